@@ -1,6 +1,14 @@
 
 from __future__ import print_function, absolute_import
-import os, pydoc
+import os, sys, pydoc
+
+# Set HOLOVIEWS_PROFILE_IMPORTS to report the cost of each submodule
+if os.environ.get('HOLOVIEWS_PROFILE_IMPORTS'):
+    from .importprofile import ImportProfiler
+    _import_profiler = ImportProfiler(__name__)
+    _import_profiler.start()
+else:
+    _import_profiler = None
 
 import numpy as np # noqa (API import)
 import param
@@ -20,8 +28,8 @@ from .core.tree import *                                 # noqa (API import)
 from .core.spaces import (HoloMap, Callable, DynamicMap, # noqa (API import)
                           GridSpace, GridMatrix)
 
-from .operation import Operation                         # noqa (API import)
-from .operation import ElementOperation                  # noqa (Deprecated API import)
+from .core.operation import Operation                    # noqa (API import)
+from .core.operation import ElementOperation             # noqa (Deprecated API import)
 from .element import *                                   # noqa (API import)
 from .element import __all__ as elements_list
 from . import util # noqa (API import)
@@ -33,14 +41,52 @@ import warnings
 warnings.filterwarnings("ignore",
                         message="elementwise comparison failed; returning scalar instead")
 
-try:
-    import IPython                 # noqa (API import)
-    from .ipython import notebook_extension
-    extension = notebook_extension # noqa (name remapping)
-except ImportError as e:
-    class notebook_extension(param.ParameterizedFunction):
-        def __call__(self, *args, **opts): # noqa (dummy signature)
-            raise Exception("IPython notebook not available: use hv.extension instead.")
+def _ipython_available():
+    "Whether IPython can be imported, without importing it"
+    try:
+        from importlib.util import find_spec
+    except ImportError:
+        import imp
+        try:
+            imp.find_module('IPython')
+        except ImportError:
+            return False
+        return True
+    return find_spec('IPython') is not None
+
+class _notebook_unavailable(param.ParameterizedFunction):
+    def __call__(self, *args, **opts): # noqa (dummy signature)
+        raise Exception("IPython notebook not available: use hv.extension instead.")
+
+# Outside an IPython session the IPython extension and the submodules
+# below are imported when first accessed (requires Python >= 3.7).
+_lazy_submodules = ['operation', 'ipython', 'plotting']
+_lazy = sys.version_info >= (3, 7) and 'IPython' not in sys.modules
+
+def __getattr__(name):
+    if name in ('notebook_extension', 'extension'):
+        try:
+            import IPython                 # noqa (API import)
+            from .ipython import notebook_extension
+            ext = notebook_extension
+        except ImportError:
+            notebook_extension, ext = _notebook_unavailable, _extension
+        globals().update(notebook_extension=notebook_extension, extension=ext)
+        return globals()[name]
+    elif name in _lazy_submodules:
+        import importlib
+        return importlib.import_module('.'+name, __name__)
+    raise AttributeError("module %r has no attribute %r" % (__name__, name))
+
+_extension = extension
+if _lazy and _ipython_available():
+    del extension
+elif _lazy:
+    notebook_extension = _notebook_unavailable
+else:
+    from . import operation # noqa (API import)
+    __getattr__('extension')
+
 
 # A single holoviews.rc file may be executed if found.
 for rcfile in [os.environ.get("HOLOVIEWSRC", ''),
@@ -58,6 +104,10 @@ for rcfile in [os.environ.get("HOLOVIEWSRC", ''),
                 print("Warning: Could not load %r [%r]" % (filename, str(e)))
         break
 
+if _import_profiler is not None:
+    _import_profiler.stop()
+    print(_import_profiler.report(), file=sys.stderr)
+
 def help(obj, visualization=True, ansi=True, backend=None,
          recursive=False, pattern=None):
     """
@@ -5,12 +5,15 @@ try:
 except ImportError:
     pass
 
+import copy
+
 import numpy as np
 import param
 
 from ..dimension import redim
 from ..util import dimension_range
 from .interface import Interface, iloc, ndloc
+from .lazy import LazyDataset
 from .array import ArrayInterface
 from .dictionary import DictInterface
 from .grid import GridInterface
@@ -53,6 +56,12 @@ try:
 except ImportError:
     pass
 
+try:
+    from .arrow import ArrowInterface   # noqa (Conditional API import)
+    datatypes.append('arrow')
+except ImportError:
+    pass
+
 from ..dimension import Dimension, process_dimensions
 from ..element import Element
 from ..ndmapping import OrderedDict
@@ -181,7 +190,12 @@ class Dataset(Element):
     _vdim_reductions = {}
     _kdim_reductions = {}
 
+    # Parameter attribute names by element type used by _construct
+    _slot_cache = {}
+
     def __init__(self, data, kdims=None, vdims=None, **kwargs):
+        if isinstance(data, LazyDataset):
+            data = data.execute()
         if isinstance(data, Element):
             pvals = util.get_param_values(data)
             kwargs.update([(l, pvals[l]) for l in ['group', 'label']
@@ -199,6 +213,117 @@ class Dataset(Element):
         self.redim = redim(self, mode='dataset')
 
 
+    @classmethod
+    def _param_slots(cls):
+        """
+        Returns a list of (name, attribute, parameter) tuples for each
+        parameter, where attribute is the instance attribute param
+        stores the parameter value in.
+        """
+        slots = Dataset._slot_cache.get(cls)
+        if slots is None:
+            slots = [(name, p._internal_name, p) for name, p in cls.params().items()]
+            Dataset._slot_cache[cls] = slots
+        return slots
+
+
+    @classmethod
+    def _construct(cls, data, interface, params):
+        """
+        Trusted constructor for data already in the format of the
+        supplied interface and parameter values taken from an existing
+        element, skipping Interface.initialize and the validation of
+        each parameter. Returns None if the element type defines its
+        own constructor, a parameter value has to be validated or the
+        regular constructor would select a different interface, in
+        which case the element should be constructed normally.
+        """
+        if cls.__init__ != Dataset.__init__ or interface.gridded:
+            return None
+
+        slots = cls._param_slots()
+        names = [name for name, _, _ in slots]
+        if any(k not in names and k not in ('id', 'plot_id') for k in params):
+            return None
+        for name, _, p in slots:
+            if name not in ('kdims', 'vdims') or name not in params:
+                continue
+            dims, (lower, upper) = params[name], p.bounds
+            if (not isinstance(dims, list) or
+                not all(isinstance(d, Dimension) for d in dims) or
+                (lower is not None and len(dims) < lower) or
+                (upper is not None and len(dims) > upper)):
+                return None
+        for name, sanitizer in [('group', util.group_sanitizer),
+                                ('label', util.label_sanitizer)]:
+            if name in params and not (isinstance(params[name], util.basestring)
+                                       and sanitizer.allowable(params[name])):
+                return None
+
+        # Interface.initialize prioritizes interfaces matching the type
+        datatype = params.get('datatype', cls.datatype)
+        matching = [Interface.interfaces[dt] for dt in datatype
+                    if dt in Interface.interfaces and
+                    Interface.interfaces[dt].applies(data)]
+        if not matching or matching[0] is not interface:
+            return None
+
+        obj = cls.__new__(cls)
+        state = obj.__dict__
+        for name, attr, p in slots:
+            if name in params:
+                value = params[name]
+                # Dimension lists and dicts must not be shared with the source
+                state[attr] = copy.copy(value) if isinstance(value, (list, dict)) else value
+            elif name == 'name':
+                state[attr] = '%s%05d' % (cls.__name__, param.parameterized.object_count)
+            elif p.instantiate:
+                state[attr] = copy.deepcopy(p.default)
+        param.parameterized.object_count += 1
+        plot_id = params.get('plot_id')
+        state.update(data=data, interface=interface, id=params.get('id'),
+                     _plot_id=plot_id or util.builtins.id(obj), initialized=True,
+                     ndims=len(obj.kdims), _settings=None)
+        state['_cached_constants'] = OrderedDict([(d.name, val) for d, val
+                                                  in obj.cdims.items()])
+        interface.validate(obj)
+        obj.redim = redim(obj, mode='dataset')
+        return obj
+
+
+    def _clone_data(self, data, **overrides):
+        """
+        Clones the element with new data returned by the interface,
+        which is already in the format of the current interface.
+        """
+        element = None
+        if all(k in ('group', 'label', 'id', 'plot_id') for k in overrides):
+            params = {name: self.__dict__[attr] for name, attr, _ in self._param_slots()
+                      if attr in self.__dict__}
+            params['id'] = self.id
+            params.update(overrides)
+            element = self._construct(data, self.interface, params)
+        if element is None:
+            return super(Dataset, self).clone(data, **overrides)
+        return element
+
+
+    def clone(self, data=None, shared_data=True, new_type=None, *args, **overrides):
+        """
+        Returns a clone of the object with matching parameter values
+        containing the specified args and kwargs.
+
+        If shared_data is set to True and no data explicitly supplied,
+        the clone will share data with the original. May also supply
+        a new_type, which will inherit all shared parameters.
+        """
+        if data is None and shared_data and new_type is None and not args:
+            return self._clone_data(self.data, **dict({'plot_id': self._plot_id},
+                                                      **overrides))
+        return super(Dataset, self).clone(data, shared_data, new_type,
+                                          *args, **overrides)
+
+
     def closest(self, coords=[], **kwargs):
         """
         Given a single coordinate or multiple coordinates as
@@ -234,7 +359,7 @@ class Dataset(Element):
         if not isinstance(by, list): by = [by]
 
         sorted_columns = self.interface.sort(self, by, reverse)
-        return self.clone(sorted_columns)
+        return self._clone_data(sorted_columns)
 
 
     def range(self, dim, data_range=True):
@@ -307,7 +432,7 @@ class Dataset(Element):
         if np.isscalar(data):
             return data
         else:
-            return self.clone(data)
+            return self._clone_data(data)
 
 
     def reindex(self, kdims=None, vdims=None):
@@ -662,6 +787,28 @@ class Dataset(Element):
         return ndloc(self)
 
 
+    @property
+    def lazy(self):
+        """
+        Returns a LazyDataset object which records select, sort,
+        reindex, redim, aggregate and add_dimension operations as a
+        plan instead of executing them immediately. The plan is
+        optimized and executed once, when values are requested or
+        when ``execute`` is called, returning a regular Dataset.
+
+        Examples:
+
+        * Select, sort and aggregate in a single execution:
+
+            dataset.lazy.select(x=(0, 10)).sort('t').aggregate('g', np.mean).execute()
+
+        * Request values directly from the plan:
+
+            dataset.lazy.select(g=['A', 'B']).sort('t').dimension_values('t')
+        """
+        return LazyDataset(self)
+
+
 # Aliases for pickle backward compatibility
 Columns      = Dataset
 ArrayColumns = ArrayInterface
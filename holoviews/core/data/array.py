@@ -184,7 +184,7 @@ class ArrayInterface(Interface):
                     group_data = {d.name: group_data[:, i] for i, d in
                                   enumerate(kdims+vdims)}
                 else:
-                    group_data = group_type(group_data, **group_kwargs)
+                    group_data = cls.construct_group(group_type, group_data, **group_kwargs)
             grouped_data.append((tuple(group), group_data))
 
         if issubclass(container_type, NdMapping):
@@ -0,0 +1,471 @@
+from __future__ import absolute_import
+
+try:
+    import itertools.izip as zip
+except ImportError:
+    pass
+
+import numpy as np
+import pyarrow as pa
+import pyarrow.compute as pc
+
+from .interface import Interface, DataError
+from .dictionary import DictInterface
+from ..dimension import Dimension
+from ..element import Element
+from ..ndmapping import NdMapping, item_check, OrderedDict
+from .. import util
+
+
+class ArrowInterface(Interface):
+    """
+    The ArrowInterface allows Dataset objects to wrap an Apache Arrow
+    Table. Arrow stores each column as a contiguous, typed buffer, so
+    columns can be handed to numpy without a copy and tables loaded
+    from memory-mapped IPC files are never read into memory in full.
+
+    Compared to the PandasInterface the ArrowInterface has the
+    following properties:
+
+    1) Columns without nulls stored in a single chunk are returned
+       as zero-copy numpy views by dimension_values.
+    2) Dictionary-encoded (categorical) columns are decoded with a
+       single vectorized take over the dictionary.
+    3) Selections, sorting and inbuilt aggregations (mean, sum, min,
+       max, std, var, count) are evaluated by Arrow compute kernels.
+    4) The from_parquet and from_ipc helpers allow loading data
+       with row group pruning and memory mapping respectively.
+    """
+
+    types = (pa.Table,)
+
+    datatype = 'arrow'
+
+    # Mapping from numpy reductions to Arrow hash aggregation kernels
+    _kernels = {np.mean: 'mean', np.nanmean: 'mean', np.sum: 'sum',
+                np.nansum: 'sum', np.min: 'min', np.amin: 'min',
+                np.nanmin: 'min', np.max: 'max', np.amax: 'max',
+                np.nanmax: 'max', np.std: 'stddev', np.nanstd: 'stddev',
+                np.var: 'variance', np.nanvar: 'variance',
+                np.size: 'count', len: 'count'}
+
+    @classmethod
+    def from_ipc(cls, path):
+        """
+        Loads an Arrow IPC (feather v2) file by memory mapping it, the
+        returned Table references the mapped buffers so columns are
+        only paged in when they are accessed.
+        """
+        source = pa.memory_map(path, 'r')
+        return pa.ipc.open_file(source).read_all()
+
+
+    @classmethod
+    def from_parquet(cls, path, columns=None, **selection):
+        """
+        Loads a Parquet file optionally restricted to a subset of
+        columns. Selections may be supplied using the same syntax as
+        Dataset.select (tuple ranges, slices, lists, sets or scalar
+        values) and are pushed down to the Parquet reader, which skips
+        row groups whose statistics cannot match the selection.
+        """
+        import pyarrow.parquet as pq
+        filters = []
+        for dim, k in selection.items():
+            dim = dim.name if isinstance(dim, Dimension) else dim
+            if isinstance(k, tuple):
+                k = slice(*k)
+            if isinstance(k, slice):
+                if k.start is not None:
+                    filters.append((dim, '>=', k.start))
+                if k.stop is not None:
+                    filters.append((dim, '<', k.stop))
+            elif isinstance(k, (set, list)):
+                filters.append((dim, 'in', list(k)))
+            elif callable(k):
+                raise ValueError('Callable selections cannot be pushed '
+                                 'down to the Parquet reader.')
+            else:
+                filters.append((dim, '==', k))
+        return pq.read_table(path, columns=columns, filters=filters or None)
+
+
+    @classmethod
+    def to_numpy(cls, column):
+        """
+        Converts an Arrow Array or ChunkedArray to a numpy array,
+        avoiding copies where the memory layout permits it.
+        """
+        if isinstance(column, pa.ChunkedArray):
+            if column.num_chunks == 1:
+                return cls.to_numpy(column.chunk(0))
+            elif column.num_chunks == 0:
+                return np.array([], dtype=column.type.to_pandas_dtype())
+            return np.concatenate([cls.to_numpy(c) for c in column.chunks])
+        if pa.types.is_dictionary(column.type) and not column.null_count:
+            categories = column.dictionary.to_numpy(zero_copy_only=False)
+            return categories[column.indices.to_numpy(zero_copy_only=False)]
+        try:
+            return column.to_numpy(zero_copy_only=True)
+        except (pa.ArrowInvalid, NotImplementedError):
+            return column.to_numpy(zero_copy_only=False)
+
+
+    @classmethod
+    def dimension_type(cls, dataset, dim):
+        name = dataset.get_dimension(dim, strict=True).name
+        dtype = dataset.data.schema.field(name).type
+        if pa.types.is_dictionary(dtype):
+            dtype = dtype.value_type
+        try:
+            return np.dtype(dtype.to_pandas_dtype()).type
+        except (NotImplementedError, TypeError):
+            return np.object_
+
+
+    @classmethod
+    def init(cls, eltype, data, kdims, vdims):
+        element_params = eltype.params()
+        kdim_param = element_params['kdims']
+        vdim_param = element_params['vdims']
+        if util.is_dataframe(data):
+            data = pa.Table.from_pandas(data, preserve_index=False)
+
+        if isinstance(data, pa.Table):
+            columns = data.column_names
+            if isinstance(kdim_param.bounds[1], int):
+                ndim = min([kdim_param.bounds[1], len(kdim_param.default)])
+            else:
+                ndim = None
+            nvdim = vdim_param.bounds[1] if isinstance(vdim_param.bounds[1], int) else None
+            if kdims and vdims is None:
+                vdims = [c for c in columns if c not in kdims]
+            elif vdims and kdims is None:
+                kdims = [c for c in columns if c not in vdims][:ndim]
+            elif kdims is None:
+                kdims = list(columns[:ndim])
+                if vdims is None:
+                    vdims = [d for d in columns[ndim:((ndim+nvdim) if nvdim else None)]
+                             if d not in kdims]
+            elif kdims == [] and vdims is None:
+                vdims = list(columns[:nvdim if nvdim else None])
+            return data, {'kdims': kdims, 'vdims': vdims}, {}
+
+        data, dims, extra = DictInterface.init(eltype, data, kdims, vdims)
+        lengths = [len(v) for v in data.values() if not np.isscalar(v)]
+        length = max(lengths) if lengths else 1
+        columns = OrderedDict()
+        for k, v in data.items():
+            columns[k] = pa.array(np.full(length, v) if np.isscalar(v) else v)
+        return pa.Table.from_arrays(list(columns.values()), list(columns)), dims, extra
+
+
+    @classmethod
+    def validate(cls, dataset, vdims=True):
+        dim_types = 'all' if vdims else 'key'
+        dimensions = dataset.dimensions(dim_types, label='name')
+        not_found = [d for d in dimensions if d not in dataset.data.column_names]
+        if not_found:
+            raise DataError("Supplied data does not contain specified "
+                            "dimensions, the following dimensions were "
+                            "not found: %s" % repr(not_found), cls)
+
+
+    @classmethod
+    def isscalar(cls, dataset, dim):
+        name = dataset.get_dimension(dim, strict=True).name
+        return pc.count_distinct(dataset.data.column(name)).as_py() == 1
+
+
+    @classmethod
+    def shape(cls, dataset):
+        return (dataset.data.num_rows, dataset.data.num_columns)
+
+
+    @classmethod
+    def length(cls, dataset):
+        return dataset.data.num_rows
+
+
+    @classmethod
+    def range(cls, dataset, dimension):
+        column = dataset.data.column(dataset.get_dimension(dimension, strict=True).name)
+        if pa.types.is_dictionary(column.type):
+            column = column.cast(column.type.value_type)
+        if len(column) == 0 or column.null_count == len(column):
+            return np.NaN, np.NaN
+        minmax = pc.min_max(column)
+        return minmax['min'].as_py(), minmax['max'].as_py()
+
+
+    @classmethod
+    def values(cls, dataset, dim, expanded=True, flat=True):
+        dim = dataset.get_dimension(dim, strict=True)
+        column = dataset.data.column(dim.name)
+        if not expanded:
+            if pa.types.is_dictionary(column.type):
+                column = column.cast(column.type.value_type)
+            return cls.to_numpy(pc.unique(column))
+        return cls.to_numpy(column)
+
+
+    @classmethod
+    def _column_mask(cls, column, k):
+        """
+        Returns an Arrow boolean mask for a single dimension selection
+        or None if the selection cannot be evaluated by Arrow kernels.
+        """
+        if isinstance(k, slice):
+            mask = None
+            if k.start is not None:
+                mask = pc.greater_equal(column, k.start)
+            if k.stop is not None:
+                stop = pc.less(column, k.stop)
+                mask = stop if mask is None else pc.and_(mask, stop)
+            return mask
+        elif isinstance(k, (set, list)):
+            return pc.is_in(column, value_set=pa.array(list(k)))
+        elif callable(k):
+            return pa.array(k(cls.to_numpy(column)))
+        return pc.equal(column, k)
+
+
+    @classmethod
+    def select_mask(cls, dataset, selection):
+        """
+        Given a Dataset object and a dictionary with dimension keys and
+        selection keys (i.e tuple ranges, slices, sets, lists or literals)
+        return a boolean mask over the rows in the Dataset object that
+        have been selected.
+        """
+        mask = None
+        for dim, k in selection.items():
+            if isinstance(k, tuple):
+                k = slice(*k)
+            column = dataset.data.column(dataset.get_dimension(dim, strict=True).name)
+            if pa.types.is_dictionary(column.type):
+                column = column.cast(column.type.value_type)
+            dim_mask = cls._column_mask(column, k)
+            if dim_mask is None:
+                continue
+            if (dataset.ndims == 1 and not isinstance(k, (slice, set, list))
+                and not callable(k) and not pc.any(dim_mask).as_py()):
+                arr = cls.to_numpy(column)
+                dim_mask = np.zeros(len(arr), dtype=bool)
+                dim_mask[np.argmin(np.abs(arr - k))] = True
+                dim_mask = pa.array(dim_mask)
+            mask = dim_mask if mask is None else pc.and_(mask, dim_mask)
+        if mask is None:
+            return np.ones(len(dataset), dtype=bool)
+        return cls.to_numpy(pc.fill_null(mask, False))
+
+
+    @classmethod
+    def select(cls, dataset, selection_mask=None, **selection):
+        if selection_mask is None:
+            selection_mask = cls.select_mask(dataset, selection)
+        indexed = cls.indexed(dataset, selection)
+        data = dataset.data.filter(pa.array(selection_mask))
+        if indexed and data.num_rows == 1 and len(dataset.vdims) == 1:
+            return cls.to_numpy(data.column(dataset.vdims[0].name))[0]
+        return data
+
+
+    @classmethod
+    def sort(cls, dataset, by=[], reverse=False):
+        order = 'descending' if reverse else 'ascending'
+        keys = [(dataset.get_dimension(d, strict=True).name, order) for d in by]
+        return dataset.data.sort_by(keys)
+
+
+    @classmethod
+    def _group_indices(cls, table, names):
+        """
+        Factorizes the supplied columns using dictionary encoding and
+        returns the group keys in order of first appearance along with
+        the row indices belonging to each group. Rows with null keys
+        are dropped.
+        """
+        codes, categories = [], []
+        valid = np.ones(table.num_rows, dtype=bool)
+        for name in names:
+            encoded = pc.dictionary_encode(table.column(name)).combine_chunks()
+            indices = encoded.indices
+            if indices.null_count:
+                valid &= cls.to_numpy(pc.is_valid(indices))
+                indices = pc.fill_null(indices, 0)
+            codes.append(indices.to_numpy(zero_copy_only=False).astype('int64'))
+            categories.append(cls.to_numpy(encoded.dictionary))
+        shape = [max(len(c), 1) for c in categories]
+        group_codes = np.ravel_multi_index(codes, shape) if len(codes) > 1 else codes[0]
+        rows = np.flatnonzero(valid)
+        group_codes = group_codes[rows]
+        uniques, first, inverse = np.unique(group_codes, return_index=True,
+                                            return_inverse=True)
+        order = np.argsort(first)
+        sorting = np.argsort(inverse, kind='mergesort')
+        bounds = np.concatenate([[0], np.cumsum(np.bincount(inverse))])
+        groups = []
+        for g in order:
+            key_codes = np.unravel_index(uniques[g], shape)
+            key = tuple(cats[c] for cats, c in zip(categories, key_codes))
+            groups.append((key, rows[sorting[bounds[g]:bounds[g+1]]]))
+        return groups
+
+
+    @classmethod
+    def groupby(cls, dataset, dimensions, container_type, group_type, **kwargs):
+        index_dims = [dataset.get_dimension(d, strict=True) for d in dimensions]
+        element_dims = [kdim for kdim in dataset.kdims
+                        if kdim not in index_dims]
+
+        group_kwargs = {}
+        if group_type != 'raw' and issubclass(group_type, Element):
+            group_kwargs = dict(util.get_param_values(dataset),
+                                kdims=element_dims)
+        group_kwargs.update(kwargs)
+
+        group_by = [d.name for d in index_dims]
+        data = []
+        for key, indices in cls._group_indices(dataset.data, group_by):
+            key = key[0] if len(key) == 1 else key
+            group = dataset.data.take(pa.array(indices))
+            data.append((key, group if group_type == 'raw' else
+                         cls.construct_group(group_type, group, **group_kwargs)))
+        if issubclass(container_type, NdMapping):
+            with item_check(False):
+                return container_type(data, kdims=index_dims)
+        else:
+            return container_type(data)
+
+
+    @classmethod
+    def aggregate(cls, dataset, dimensions, function, **kwargs):
+        table = dataset.data
+        cols = [d.name for d in dataset.kdims if d in dimensions]
+        vdims = [d for d in dataset.dimensions('value', label='name')
+                 if d not in cols]
+        kernel = cls._kernels.get(function)
+        if cols and kernel is not None and not kwargs:
+            agg = table.group_by(cols).aggregate([(vd, kernel) for vd in vdims])
+            renames = {'%s_%s' % (vd, kernel): vd for vd in vdims}
+            agg = agg.rename_columns([renames.get(c, c) for c in agg.column_names])
+            return cls._sort_groups(agg.select(cols+vdims), cols)
+
+        # Apply the function to each group (or the zero-copy column) in numpy
+        aggregated = OrderedDict([(c, []) for c in cols+vdims])
+        groups = cls._group_indices(table, cols) if cols else [((), None)]
+        for key, indices in groups:
+            for c, v in zip(cols, key):
+                aggregated[c].append(v)
+            for vd in vdims:
+                values = cls.to_numpy(table.column(vd))
+                if indices is not None:
+                    values = values[indices]
+                if isinstance(function, np.ufunc):
+                    reduced = function.reduce(values, **kwargs)
+                else:
+                    reduced = function(values, **kwargs)
+                aggregated[vd].append(reduced)
+        agg = pa.Table.from_arrays([pa.array(v) for v in aggregated.values()],
+                                   list(aggregated))
+        return cls._sort_groups(agg, cols)
+
+
+    @classmethod
+    def _sort_groups(cls, table, cols):
+        """
+        Sorts an aggregated table by its group keys since Arrow hash
+        aggregation does not guarantee the order of the groups.
+        """
+        if not cols:
+            return table
+        return table.sort_by([(c, 'ascending') for c in cols])
+
+
+    @classmethod
+    def unpack_scalar(cls, dataset, data):
+        """
+        Given a dataset object and data in the appropriate format for
+        the interface, return a simple scalar.
+        """
+        if data.num_rows != 1 or data.num_columns > 1:
+            return data
+        return cls.to_numpy(data.column(0))[0]
+
+
+    @classmethod
+    def reindex(cls, dataset, kdims=None, vdims=None):
+        # Arrow Tables don't need to be reindexed
+        return dataset.data
+
+
+    @classmethod
+    def redim(cls, dataset, dimensions):
+        renamed = [dimensions[c].name if c in dimensions else c
+                   for c in dataset.data.column_names]
+        return dataset.data.rename_columns(renamed)
+
+
+    @classmethod
+    def add_dimension(cls, dataset, dimension, dim_pos, values, vdim):
+        data = dataset.data
+        if dimension.name in data.column_names:
+            return data
+        if np.isscalar(values):
+            values = np.full(data.num_rows, values)
+        return data.add_column(dim_pos, dimension.name, pa.array(values))
+
+
+    @classmethod
+    def concat(cls, dataset_objs):
+        cast_objs = cls.cast(dataset_objs)
+        return pa.concat_tables([obj.data for obj in cast_objs])
+
+
+    @classmethod
+    def sample(cls, dataset, samples=[]):
+        dims = dataset.dimensions('key')
+        mask = np.zeros(len(dataset), dtype=bool)
+        for sample in samples:
+            if np.isscalar(sample): sample = [sample]
+            mask |= cls.select_mask(dataset, dict(zip(dims, sample)))
+        return dataset.data.filter(pa.array(mask))
+
+
+    @classmethod
+    def dframe(cls, dataset, dimensions):
+        data = dataset.data
+        if dimensions:
+            data = data.select(dimensions)
+        return data.to_pandas()
+
+
+    @classmethod
+    def iloc(cls, dataset, index):
+        rows, cols = index
+        scalar = False
+        if isinstance(cols, slice):
+            cols = [d.name for d in dataset.dimensions()][cols]
+        elif np.isscalar(cols):
+            scalar = np.isscalar(rows)
+            cols = [dataset.get_dimension(cols).name]
+        else:
+            cols = [dataset.get_dimension(d).name for d in index[1]]
+        if np.isscalar(rows):
+            rows = [rows]
+
+        data = dataset.data.select(cols)
+        if isinstance(rows, slice):
+            data = data.take(pa.array(np.arange(data.num_rows)[rows]))
+        else:
+            rows = np.asarray(rows)
+            if rows.dtype.kind == 'b':
+                rows = np.flatnonzero(rows)
+            data = data.take(pa.array(rows))
+        if scalar:
+            return cls.to_numpy(data.column(0))[0]
+        return data
+
+
+Interface.register(ArrowInterface)
@@ -96,14 +96,7 @@ class DaskInterface(PandasInterface):
                 if k.stop is not None:
                     masks.append(series < k.stop)
             elif isinstance(k, (set, list)):
-                iter_slc = None
-                for ik in k:
-                    mask = series == ik
-                    if iter_slc is None:
-                        iter_slc = mask
-                    else:
-                        iter_slc |= mask
-                masks.append(iter_slc)
+                masks.append(series.isin(list(k)))
             elif callable(k):
                 masks.append(k(series))
             else:
@@ -255,7 +255,7 @@ class DictInterface(Interface):
             group_data = OrderedDict(((d.name, dataset.data[d.name] if np.isscalar(dataset.data[d.name])
                                        else dataset.data[d.name][mask])
                                       for d in kdims+vdims))
-            group_data = group_type(group_data, **group_kwargs)
+            group_data = cls.construct_group(group_type, group_data, **group_kwargs)
             grouped_data.append((unique_key, group_data))
 
         if issubclass(container_type, NdMapping):
@@ -1,3 +1,6 @@
+import os
+import struct
+import zipfile
 from collections import OrderedDict, defaultdict, Iterable
 
 try:
@@ -6,6 +9,7 @@ except ImportError:
     pass
 
 import numpy as np
+from numpy.lib.npyio import NpzFile
 
 from .dictionary import DictInterface
 from .interface import Interface, DataError
@@ -55,6 +59,10 @@ class GridInterface(DictInterface):
                       d for d in kdims + vdims]
         if isinstance(data, tuple):
             data = {d: v for d, v in zip(dimensions, data)}
+        elif isinstance(data, NpzFile):
+            # Only load the arrays referenced by the dimensions
+            data = {d: cls._load_npz(data, d) for d in dimensions
+                    if d in data.files}
         elif isinstance(data, list) and data == []:
             data = OrderedDict([(d, []) for d in dimensions])
         elif not any(isinstance(data, tuple(t for t in interface.types if t is not None))
@@ -79,7 +87,7 @@ class GridInterface(DictInterface):
             if name not in data:
                 raise ValueError("Values for dimension %s not found" % dim)
             if not isinstance(data[name], np.ndarray):
-                data[name] = np.array(data[name])
+                data[name] = np.asarray(data[name])
 
         kdim_names = [d.name if isinstance(d, Dimension) else d for d in kdims]
         vdim_names = [d.name if isinstance(d, Dimension) else d for d in vdims]
@@ -197,6 +205,40 @@ class GridInterface(DictInterface):
         return data
 
 
+    @classmethod
+    def _load_npz(cls, npz, name):
+        """
+        Loads an array from an NpzFile, memory mapping it if it was
+        stored uncompressed (as written by np.savez) so that it is
+        only read from disk when accessed. Compressed members and
+        object arrays cannot be mapped and are loaded eagerly.
+        """
+        filename = getattr(npz.zip, 'filename', None)
+        info = npz.zip.getinfo(name+'.npy')
+        if (info.compress_type != zipfile.ZIP_STORED or
+            not isinstance(filename, util.basestring) or
+            not os.path.isfile(filename)):
+            return npz[name]
+        with open(filename, 'rb') as f:
+            # Skip the zip local file header to the start of the member
+            f.seek(info.header_offset)
+            header = f.read(30)
+            name_len, extra_len = struct.unpack('<HH', header[26:30])
+            f.seek(info.header_offset+30+name_len+extra_len)
+            version = np.lib.format.read_magic(f)
+            if version == (1, 0):
+                shape, fortran, dtype = np.lib.format.read_array_header_1_0(f)
+            elif version == (2, 0):
+                shape, fortran, dtype = np.lib.format.read_array_header_2_0(f)
+            else:
+                return npz[name]
+            offset = f.tell()
+        if dtype.hasobject or not shape or not np.prod(shape):
+            return npz[name]
+        return np.memmap(filename, dtype=dtype, mode='r', shape=shape,
+                         order='F' if fortran else 'C', offset=offset)
+
+
     @classmethod
     def canonicalize(cls, dataset, data, data_coords=None, virtual_coords=[]):
         """
@@ -376,10 +418,7 @@ class GridInterface(DictInterface):
             if mask is True:
                 mask = np.ones(values.shape, dtype=np.bool)
         elif isinstance(ind, (set, list)):
-            iter_slcs = []
-            for ik in ind:
-                iter_slcs.append(values == ik)
-            mask = np.logical_or.reduce(iter_slcs)
+            mask = util.isin(values, ind)
         elif callable(ind):
             mask = ind(values)
         elif ind is None:
@@ -397,6 +436,20 @@ class GridInterface(DictInterface):
         return mask
 
 
+    @classmethod
+    def _contiguous_slice(cls, indices):
+        """
+        Returns a slice equivalent to the supplied integer indices if
+        they form a contiguous ascending range, otherwise None.
+        """
+        if not len(indices):
+            return None
+        start, stop = indices[0], indices[-1]+1
+        if (stop-start) == len(indices) and np.all(np.diff(indices) == 1):
+            return slice(start, stop)
+        return None
+
+
     @classmethod
     def select(cls, dataset, selection_mask=None, **selection):
         dimensions = dataset.kdims
@@ -447,8 +500,14 @@ class GridInterface(DictInterface):
             data[dim.name] = np.array([values]) if np.isscalar(values) else values
 
         int_inds = [np.argwhere(v) for v in value_select][::-1]
-        index = np.ix_(*[np.atleast_1d(np.squeeze(ind)) if ind.ndim > 1 else np.atleast_1d(ind)
-                         for ind in int_inds])
+        int_inds = [np.atleast_1d(np.squeeze(ind)) if ind.ndim > 1 else np.atleast_1d(ind)
+                    for ind in int_inds]
+        slices = [cls._contiguous_slice(ind) for ind in int_inds]
+        if all(slc is not None for slc in slices):
+            # Basic slicing returns views, keeping memory-mapped arrays lazy
+            index = tuple(slices)
+        else:
+            index = np.ix_(*int_inds)
         for kdim in dataset.kdims:
             if cls.irregular(dataset, dim):
                 data[kdim.name] = np.asarray(data[kdim.name])[index]
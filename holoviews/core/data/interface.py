@@ -95,6 +95,14 @@ class Interface(param.Parameterized):
 
     datatype = None
 
+    # Maps from (element type, datatype, number of key and value
+    # dimensions, data signature) to the index
+    # of the first prioritized interface which accepted data with that
+    # signature, all interfaces before it having rejected it
+    _dispatch = OrderedDict()
+
+    _dispatch_size = 500
+
     # Denotes whether the interface expects gridded data
     gridded = False
 
@@ -104,6 +112,54 @@ class Interface(param.Parameterized):
     @classmethod
     def register(cls, interface):
         cls.interfaces[interface.datatype] = interface
+        Interface._dispatch.clear()
+
+
+    @classmethod
+    def applies(cls, obj):
+        """
+        Indicates whether the interface is designed specifically to
+        handle the supplied object's type. Interfaces which apply are
+        tried before all other interfaces when initializing an element.
+        """
+        return type(obj) in cls.types
+
+
+    @classmethod
+    def signature(cls, data):
+        """
+        Returns a hashable signature summarizing the type, shape and
+        dtype of the supplied data and its columns, which determines
+        which interface can interpret the data. Lists are summarized
+        by the dtype numpy infers for them. Returns None if the data
+        cannot be summarized.
+        """
+        def summarize(obj):
+            if isinstance(obj, (list, tuple)):
+                try:
+                    arr = np.asarray(obj)
+                except Exception:
+                    return None
+                return (type(obj), arr.ndim, arr.dtype.kind)
+            elif isinstance(obj, np.ndarray):
+                return (type(obj), obj.ndim, obj.dtype.kind)
+            return (type(obj),)
+
+        if isinstance(data, (dict, tuple)):
+            columns = list(data.values()) if isinstance(data, dict) else data
+            if any(isinstance(c, (dict, tuple, list)) and not len(c) for c in columns):
+                return None
+            lengths = {len(c) for c in columns if isinstance(c, list) or
+                       (isinstance(c, np.ndarray) and c.ndim)}
+            summaries = tuple(summarize(c) for c in columns)
+            if None in summaries:
+                return None
+            return (type(data), len(lengths) < 2) + summaries
+        elif isinstance(data, (np.ndarray, list)):
+            return summarize(data)
+        elif data is None:
+            return None
+        return (type(data),)
 
 
     @classmethod
@@ -179,16 +235,29 @@ class Interface(param.Parameterized):
         # Set interface priority order
         prioritized = [cls.interfaces[p] for p in datatype
                        if p in cls.interfaces]
-        head = [intfc for intfc in prioritized if type(data) in intfc.types]
+        head = [intfc for intfc in prioritized if intfc.applies(data)]
+        start = 0
         if head:
             # Prioritize interfaces which have matching types
             prioritized = head + [el for el in prioritized if el != head[0]]
+            key = None
+        else:
+            # Skip the interfaces which rejected data with the same
+            # signature before instead of probing each in turn
+            signature = cls.signature(data)
+            ndims = tuple(None if dims is None else len(dims) for dims in (kdims, vdims))
+            key = None if signature is None else (eltype, tuple(datatype), ndims, signature)
+            start = Interface._dispatch.get(key, 0)
 
         # Iterate over interfaces until one can interpret the input
         priority_errors = []
-        for interface in prioritized:
+        for index, interface in enumerate(prioritized[start:], start):
             try:
                 (data, dims, extra_kws) = interface.init(eltype, data, kdims, vdims)
+                if key is not None:
+                    Interface._dispatch[key] = index
+                    if len(Interface._dispatch) > Interface._dispatch_size:
+                        Interface._dispatch.popitem(last=False)
                 break
             except DataError:
                 raise
@@ -208,6 +277,25 @@ class Interface(param.Parameterized):
         return data, interface, dims, extra_kws
 
 
+    @classmethod
+    def construct_group(cls, group_type, data, **kwargs):
+        """
+        Constructs an element of the supplied group_type from group
+        data in the format of this interface, e.g. as returned by
+        groupby. If the group_type supports it and only the dimensions,
+        group and label are supplied the element is constructed via
+        the trusted constructor, skipping the validation of data which
+        is already in the correct format.
+        """
+        construct = getattr(group_type, '_construct', None)
+        if construct is not None and all(k in ('kdims', 'vdims', 'group', 'label')
+                                         for k in kwargs):
+            element = construct(data, cls, kwargs)
+            if element is not None:
+                return element
+        return group_type(data, **kwargs)
+
+
     @classmethod
     def validate(cls, dataset, vdims=True):
         dims = 'all' if vdims else 'key'
@@ -248,10 +336,7 @@ class Interface(param.Parameterized):
                 if k.stop is not None:
                     mask &= arr < k.stop
             elif isinstance(k, (set, list)):
-                iter_slcs = []
-                for ik in k:
-                    iter_slcs.append(arr == ik)
-                mask &= np.logical_or.reduce(iter_slcs)
+                mask &= util.isin(arr, k)
             elif callable(k):
                 mask &= k(arr)
             else:
@@ -262,6 +347,10 @@ class Interface(param.Parameterized):
                     mask[data_index] = True
                 else:
                     mask &= index_mask
+            # Remaining selections cannot select any rows, except in
+            # the 1D case where scalar selections snap to the closest row
+            if dataset.ndims > 1 and not mask.any():
+                break
         return mask
 
 
@@ -0,0 +1,292 @@
+import numpy as np
+
+from .. import util
+
+
+class LazyDataset(object):
+    """
+    LazyDataset is a small wrapper object that records a chain of
+    operations on a Dataset as a logical plan instead of executing
+    them immediately, accessible via the ``.lazy`` property. Each
+    method returns a new LazyDataset with the operation appended to
+    the plan, leaving the original Dataset untouched.
+
+    The plan is optimized and executed once, either explicitly by
+    calling ``execute`` or implicitly when values are requested via
+    ``dimension_values``, ``columns``, ``dframe``, ``range`` or
+    ``len``. The optimizer applies the following rewrites:
+
+    1) Selections are moved ahead of sorts, so sorting operates only
+       on the selected rows.
+    2) Adjacent range, list and callable selections are merged into
+       a single selection, intersecting ranges and lists along shared
+       dimensions.
+    3) Key dimensions not referenced by any selection or sort and
+       dropped by a subsequent reindex or aggregate are removed
+       before any other operation is applied.
+
+    When executed on a columnar Dataset, consecutive selections and
+    sorts are fused into a single row index, which is computed from
+    the selection masks and sort order and then materialized in one
+    pass, rather than creating a Dataset for each step.
+
+    A LazyDataset is executed automatically when it is used to
+    construct an Element or is passed to a Renderer.
+    """
+
+    # Operations which may be reordered relative to a selection
+    _commutes_with_select = ('sort',)
+
+    # Datatypes supporting fused select and sort execution via iloc
+    _fused_datatypes = ('array', 'dictionary', 'dataframe', 'arrow')
+
+    def __init__(self, dataset, plan=None):
+        self.dataset = dataset
+        self.plan = list(plan or [])
+        self._executed = None
+
+    def _append(self, op, *args, **kwargs):
+        return LazyDataset(self.dataset, self.plan+[(op, args, kwargs)])
+
+    def __repr__(self):
+        ops = ['.%s(%s)' % (op, ', '.join([repr(a) for a in args] +
+                                           ['%s=%r' % kv for kv in sorted(kwargs.items())]))
+               for op, args, kwargs in self.plan]
+        return 'LazyDataset(%s)%s' % (type(self.dataset).__name__, ''.join(ops))
+
+    def select(self, selection_specs=None, **selection):
+        return self._append('select', selection_specs, **selection)
+
+    def sort(self, by=[], reverse=False):
+        return self._append('sort', by, reverse)
+
+    def reindex(self, kdims=None, vdims=None):
+        return self._append('reindex', kdims, vdims)
+
+    def redim(self, specs=None, **dimensions):
+        return self._append('redim', specs, **dimensions)
+
+    def aggregate(self, dimensions=None, function=None, spreadfn=None, **kwargs):
+        return self._append('aggregate', dimensions, function, spreadfn, **kwargs)
+
+    def add_dimension(self, dimension, dim_pos, dim_val, vdim=False, **kwargs):
+        return self._append('add_dimension', dimension, dim_pos, dim_val, vdim, **kwargs)
+
+    #========================#
+    # Plan optimization      #
+    #========================#
+
+    @classmethod
+    def _merge_selection(cls, sel1, sel2):
+        """
+        Merges two selections along the same dimension, returning
+        None if the selections cannot be combined.
+        """
+        if isinstance(sel1, tuple): sel1 = slice(*sel1)
+        if isinstance(sel2, tuple): sel2 = slice(*sel2)
+        if isinstance(sel1, slice) and isinstance(sel2, slice):
+            if sel1.step is not None or sel2.step is not None:
+                return None
+            starts = [s for s in (sel1.start, sel2.start) if s is not None]
+            stops = [s for s in (sel1.stop, sel2.stop) if s is not None]
+            return slice(max(starts) if starts else None,
+                         min(stops) if stops else None)
+        elif isinstance(sel1, (list, set)) and isinstance(sel2, (list, set)):
+            return [v for v in sel1 if v in sel2]
+        return None
+
+    @classmethod
+    def _is_filter(cls, sel):
+        "Whether a selection filters rows rather than indexing a value"
+        return isinstance(sel, (tuple, slice, list, set)) or callable(sel)
+
+    @classmethod
+    def _merge_selects(cls, sel1, sel2):
+        if not all(cls._is_filter(sel) for sel in list(sel1.values())+list(sel2.values())):
+            return None
+        merged = dict(sel1)
+        for dim, sel in sel2.items():
+            if dim not in merged:
+                merged[dim] = sel
+                continue
+            combined = cls._merge_selection(merged[dim], sel)
+            if combined is None:
+                return None
+            merged[dim] = combined
+        return merged
+
+    def _referenced(self, op, args, kwargs):
+        "Returns the dimensions referenced by a select or sort operation"
+        if op == 'select':
+            return list(kwargs)
+        by = args[0]
+        if not by:
+            return list(self.dataset.kdims)
+        return by if isinstance(by, list) else [by]
+
+    def optimize(self):
+        """
+        Returns the optimized plan as a list of (operation, args,
+        kwargs) tuples.
+        """
+        plan = list(self.plan)
+
+        # Push selections ahead of operations they commute with
+        changed = True
+        while changed:
+            changed = False
+            for i in range(1, len(plan)):
+                prev, op = plan[i-1], plan[i]
+                if (op[0] == 'select' and 'selection_mask' not in op[2]
+                    and prev[0] in self._commutes_with_select):
+                    plan[i-1], plan[i] = op, prev
+                    changed = True
+
+        # Merge adjacent selections
+        merged = []
+        for op in plan:
+            if merged and op[0] == 'select' and merged[-1][0] == 'select':
+                prev = merged[-1]
+                if (prev[1][0] is None and op[1][0] is None and
+                    'selection_mask' not in prev[2] and 'selection_mask' not in op[2]):
+                    selection = self._merge_selects(prev[2], op[2])
+                    if selection is not None:
+                        merged[-1] = ('select', (None,), selection)
+                        continue
+            merged.append(op)
+        plan = merged
+
+        # Project away unused key dimensions up front
+        projection = self._projection(plan)
+        if projection is not None:
+            plan = [('reindex', (projection, None), {})] + plan
+        return plan
+
+    def _projection(self, plan):
+        """
+        Determines the key dimensions required to execute the plan,
+        returning None if no key dimensions can be dropped.
+        """
+        dataset = self.dataset
+        if dataset.interface.gridded:
+            return None
+        referenced = []
+        for op, args, kwargs in plan:
+            if op in ('select', 'sort'):
+                if op == 'select' and ('selection_mask' in kwargs or not
+                                       all(self._is_filter(v) for v in kwargs.values())):
+                    return None
+                referenced += self._referenced(op, args, kwargs)
+            elif op == 'reindex':
+                kdims, vdims = args
+                if kdims is None:
+                    return None
+                referenced += list(kdims)+list(vdims or [])
+                break
+            elif op == 'aggregate':
+                dims = args[0]
+                if dims is None:
+                    return None
+                referenced += dims if isinstance(dims, list) else [dims]
+                break
+            else:
+                return None
+        else:
+            return None
+
+        dims = [dataset.get_dimension(d) for d in referenced]
+        if any(d is None for d in dims):
+            return None
+        kdims = [kd for kd in dataset.kdims if kd in dims]
+        if len(kdims) == len(dataset.kdims):
+            return None
+        lower, upper = dataset.params('kdims').bounds
+        if lower is not None and len(kdims) < lower:
+            return None
+        return kdims
+
+    #========================#
+    # Plan execution         #
+    #========================#
+
+    def execute(self):
+        """
+        Optimizes and executes the plan returning the resulting
+        Dataset (or scalar if the plan ends in a scalar selection or
+        aggregation). The result is cached on the LazyDataset.
+        """
+        if self._executed is not None:
+            return self._executed
+        result = self.dataset
+        plan = self.optimize()
+        while plan:
+            if np.isscalar(result):
+                raise ValueError('Cannot apply %s operation, preceding operations '
+                                 'in the plan returned a scalar.' % plan[0][0])
+            fused = self._fusable(result, plan)
+            if len(fused) > 1:
+                result = self._execute_fused(result, fused)
+                plan = plan[len(fused):]
+                continue
+            op, args, kwargs = plan.pop(0)
+            result = getattr(result, op)(*args, **kwargs)
+        self._executed = result
+        return result
+
+    def _fusable(self, dataset, plan):
+        """
+        Returns the leading run of select and sort operations in the
+        plan which may be fused into a single row index.
+        """
+        if dataset.interface.datatype not in self._fused_datatypes:
+            return []
+        fused = []
+        for op, args, kwargs in plan:
+            if op == 'select':
+                if (args[0] is not None or 'selection_mask' in kwargs or
+                    not all(self._is_filter(v) for v in kwargs.values())):
+                    break
+            elif op != 'sort':
+                break
+            fused.append((op, args, kwargs))
+        return fused
+
+    def _execute_fused(self, dataset, plan):
+        """
+        Computes the row index selected and ordered by a run of select
+        and sort operations and materializes it with a single iloc.
+        """
+        index = np.arange(len(dataset))
+        for op, args, kwargs in plan:
+            if op == 'select':
+                selection = {dim: sel for dim, sel in kwargs.items()
+                             if dim in dataset.dimensions()}
+                if selection:
+                    mask = dataset.interface.select_mask(dataset, selection)
+                    index = index[mask[index]]
+            else:
+                by, reverse = args
+                if not by: by = dataset.kdims
+                if not isinstance(by, list): by = [by]
+                arrays = [dataset.dimension_values(d)[index] for d in by]
+                if len(arrays) == 1:
+                    sorting = arrays[0].argsort()
+                else:
+                    sorting = util.arglexsort(arrays)
+                index = index[sorting][::-1] if reverse else index[sorting]
+        return dataset.iloc[index]
+
+    def dimension_values(self, dim, expanded=True, flat=True):
+        return self.execute().dimension_values(dim, expanded, flat)
+
+    def columns(self, dimensions=None):
+        return self.execute().columns(dimensions)
+
+    def dframe(self, dimensions=None):
+        return self.execute().dframe(dimensions)
+
+    def range(self, dim, data_range=True):
+        return self.execute().range(dim, data_range)
+
+    def __len__(self):
+        return len(self.execute())
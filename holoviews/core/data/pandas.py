@@ -150,7 +150,7 @@ class PandasInterface(Interface):
         group_kwargs.update(kwargs)
 
         group_by = [d.name for d in index_dims]
-        data = [(k, group_type(v, **group_kwargs)) for k, v in
+        data = [(k, cls.construct_group(group_type, v, **group_kwargs)) for k, v in
                 columns.data.groupby(group_by, sort=False)]
         if issubclass(container_type, NdMapping):
             with item_check(False):
@@ -513,6 +513,9 @@ class LabelledData(param.Parameterized):
 
     _deep_indexable = False
 
+    # Incremented whenever the items of an indexed container change
+    _structure_version = 0
+
     def __init__(self, data, id=None, plot_id=None, **params):
         """
         All LabelledData subclasses must supply data to the
@@ -631,6 +634,9 @@ class LabelledData(param.Parameterized):
         processed. Otherwise, specs must be a list of
         type.group.label specs, types, and functions.
         """
+        if full_breadth:
+            return self._traverse_index(fn, specs)
+
         accumulator = []
         matches = specs is None
         if not matches:
@@ -650,6 +656,83 @@ class LabelledData(param.Parameterized):
         return accumulator
 
 
+    def _traverse_index(self, fn, specs=None):
+        """
+        Implements a full breadth traversal over the flat traversal
+        index. Since group and label are constant the result of
+        matching type.group.label specs and types is memoized on the
+        (type, group, label) of each object, while functions are
+        evaluated on every object.
+        """
+        accumulator = []
+        matched = {}
+        for obj_type, group, label, obj in self._traversal_index():
+            if specs is None:
+                accumulator.append(fn(obj))
+                continue
+            for spec in specs:
+                if callable(spec) and not isinstance(spec, type):
+                    match = spec(obj)
+                else:
+                    key = (obj_type, group, label, spec)
+                    match = matched.get(key)
+                    if match is None:
+                        match = matched[key] = obj.matches(spec)
+                if match:
+                    accumulator.append(fn(obj))
+                    break
+        return accumulator
+
+
+    def _traversal_index(self):
+        """
+        Returns a flat list of (type, group, label, object) entries
+        for this object and all the objects nested within it in
+        traversal order. The index of a container is cached until the
+        items of any indexed container change, see _invalidate_index.
+        """
+        return self._traversal_state()[0]
+
+
+    def _traversal_state(self):
+        """
+        Returns the traversal index along with the data object and
+        items of each container in it. The cached index is only
+        reused if none of the containers had their data or any of
+        its items replaced, added or removed, e.g. by modifying the
+        .data directly.
+        """
+        entry = (type(self), self.group, self.label, self)
+        if not self._deep_indexable:
+            return [entry], []
+        cached = self.__dict__.get('_index')
+        if (cached is not None and cached[0] == LabelledData._structure_version
+            and cached[1][0][3] is self and
+            all(c.data is data and len(data) == len(items) and
+                all(v is item for v, item in zip(data.values(), items))
+                for c, data, items in cached[2])):
+            return cached[1], cached[2]
+        index = [entry]
+        containers = [(self, self.data, tuple(self.data.values()))]
+        for el in self:
+            if el is not None:
+                el_index, el_containers = el._traversal_state()
+                index += el_index
+                containers += el_containers
+        self.__dict__['_index'] = (LabelledData._structure_version, index, containers)
+        return index, containers
+
+
+    def _invalidate_index(self):
+        """
+        Invalidates all cached traversal indexes if this object has
+        been indexed. Containers must call this whenever their items
+        are added, removed, replaced or reordered.
+        """
+        if self.__dict__.pop('_index', None) is not None:
+            LabelledData._structure_version += 1
+
+
     def map(self, map_fn, specs=None, clone=True):
         """
         Recursively replaces elements using a map function when the
@@ -676,6 +759,7 @@ class LabelledData(param.Parameterized):
         plotting options as well.
         """
         obj_dict = self.__dict__.copy()
+        obj_dict.pop('_index', None)
         try:
             if Store.save_option_state and (obj_dict.get('id', None) is not None):
                 custom_key = '_custom_option_%d' % obj_dict['id']
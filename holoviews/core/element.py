@@ -1,4 +1,5 @@
 from itertools import groupby
+from multiprocessing.pool import ThreadPool
 import numpy as np
 
 import param
@@ -7,9 +8,9 @@ from .dimension import Dimension, Dimensioned, ViewableElement
 from .layout import Composable, Layout, NdLayout
 from .ndmapping import OrderedDict, NdMapping
 from .overlay import Overlayable, NdOverlay, CompositeOverlay
-from .spaces import HoloMap, GridSpace
+from .spaces import HoloMap, GridSpace, DynamicMap
 from .tree import AttrTree
-from .util import get_param_values
+from .util import get_param_values, unique_iterator
 
 
 class Element(ViewableElement, Composable, Overlayable):
@@ -280,6 +281,24 @@ class Collator(NdMapping):
 
     group = param.String(default='Collator')
 
+    processes = param.Integer(default=1, bounds=(1, None), doc="""
+        The number of threads used to load the Collator values in
+        parallel, which is useful when the value_transform loads
+        data from disk.""")
+
+    streaming = param.Boolean(default=False, doc="""
+        Whether calling the Collator returns a DynamicMap over the
+        Collator keys which loads each value on demand, instead of
+        loading and merging all values eagerly. The drop and
+        drop_constant options are applied to the DynamicMap key
+        dimensions. The loaded values must be Elements or Overlays,
+        Collators with a merge_type other than HoloMap are always
+        collated eagerly.""")
+
+    cache_size = param.Integer(default=100, bounds=(1, None), doc="""
+        The number of loaded values cached by the DynamicMap returned
+        in streaming mode.""")
+
     progress_bar = param.Parameter(default=None, doc="""
          The progress bar instance used to report progress. Set to
          None to disable progress bars.""")
@@ -324,21 +343,57 @@ class Collator(NdMapping):
         Layouts is returned. Optionally a list of dimensions
         to be ignored can be supplied.
         """
+        if self.streaming and self.merge_type is HoloMap:
+            return self._stream()
+
         constant_dims = self.static_dimensions
         ndmapping = NdMapping(kdims=self.kdims)
 
         num_elements = len(self)
-        for idx, (key, data) in enumerate(self.data.items()):
-            if isinstance(data, AttrTree):
-                data = data.filter(self.filters)
-            if len(self.vdims) and self.value_transform:
-                vargs = dict(zip(self.dimensions('value', label=True), data))
-                data = self.value_transform(vargs)
-            if not isinstance(data, Dimensioned):
-                raise ValueError("Collator values must be Dimensioned objects "
-                                 "before collation.")
-
-            dim_keys = zip(self.kdims, key)
+        items = list(self.data.items())
+        if self.processes > 1 and num_elements > 1:
+            pool = ThreadPool(min(self.processes, num_elements))
+            try:
+                loaded = pool.imap(self._load_value, [data for _, data in items])
+                values = self._collate(items, loaded, constant_dims, num_elements)
+            finally:
+                pool.close()
+        else:
+            loaded = (self._load_value(data) for _, data in items)
+            values = self._collate(items, loaded, constant_dims, num_elements)
+        for key, data in values:
+            ndmapping[key] = data
+
+        components = ndmapping.values()
+        accumulator = ndmapping.last.clone(components[0].data)
+        for component in components:
+            accumulator.update(component)
+        return accumulator
+
+
+    def _load_value(self, data):
+        """
+        Filters and transforms a single Collator value.
+        """
+        if isinstance(data, AttrTree):
+            data = data.filter(self.filters)
+        if len(self.vdims) and self.value_transform:
+            vargs = dict(zip(self.dimensions('value', label=True), data))
+            data = self.value_transform(vargs)
+        if not isinstance(data, Dimensioned):
+            raise ValueError("Collator values must be Dimensioned objects "
+                             "before collation.")
+        return data
+
+
+    def _collate(self, items, loaded, constant_dims, num_elements):
+        """
+        Adds the Collator key dimensions to the loaded values,
+        reporting progress as each value is collated.
+        """
+        values = []
+        for idx, ((key, _), data) in enumerate(zip(items, loaded)):
+            dim_keys = list(zip(self.kdims, key))
             varying_keys = [(d, k) for d, k in dim_keys if not self.drop_constant or
                             (d not in constant_dims and d not in self.drop)]
             constant_keys = [(d, k) for d, k in dim_keys if d in constant_dims
@@ -346,15 +401,45 @@ class Collator(NdMapping):
             if varying_keys or constant_keys:
                 data = self._add_dimensions(data, varying_keys,
                                             dict(constant_keys))
-            ndmapping[key] = data
+            values.append((key, data))
             if self.progress_bar is not None:
                 self.progress_bar(float(idx+1)/num_elements*100)
+        return values
 
-        components = ndmapping.values()
-        accumulator = ndmapping.last.clone(components[0].data)
-        for component in components:
-            accumulator.update(component)
-        return accumulator
+
+    def _stream(self):
+        """
+        Returns a DynamicMap over the Collator keys which loads the
+        value corresponding to each key on demand. Dropped dimensions
+        are removed from the keys and constant dimensions are demoted
+        to constant dimensions when drop_constant is enabled, matching
+        the dimensions added by _add_dimensions when collating eagerly.
+        """
+        constant_dims = self.static_dimensions
+        keys = list(self.data.keys())
+        indices = [i for i, d in enumerate(self.kdims) if d not in self.drop and
+                   not (self.drop_constant and d in constant_dims)]
+        cdims = {d: keys[0][i] for i, d in enumerate(self.kdims) if keys and
+                 self.drop_constant and d in constant_dims and d not in self.drop}
+
+        # Later values replace earlier ones sharing the same reduced
+        # key, as they do when merging HoloMaps eagerly
+        lookup = OrderedDict((tuple(k[i] for i in indices), k) for k in keys)
+        def load_value(*key):
+            if key not in lookup:
+                raise KeyError('Key %s not found in Collator.' % (key,))
+            value = self._load_value(self.data[lookup[key]])
+            if not isinstance(value, ViewableElement):
+                raise ValueError('Streaming Collator values must be Elements or '
+                                 'Overlays, found %s. Disable streaming to '
+                                 'collate %s types.' % (type(value).__name__,
+                                                        type(value).__name__))
+            return value
+
+        kdims = [self.kdims[i].clone(values=list(unique_iterator([k[n] for k in lookup])))
+                 for n, i in enumerate(indices)]
+        return DynamicMap(load_value, kdims=kdims, cdims=cdims,
+                          cache_size=self.cache_size)
 
 
     @property
@@ -14,12 +14,15 @@ Archives: A collection of HoloViews objects that are first collected
 """
 from __future__ import absolute_import
 
-import re, os, time, string, zipfile, tarfile, shutil, itertools, pickle
+import re, os, time, string, zipfile, tarfile, shutil, itertools, pickle, sqlite3, tempfile
+import copy
 from collections import defaultdict
 
 from io import BytesIO
+from multiprocessing.pool import ThreadPool
 from hashlib import sha256
 
+import numpy as np
 import param
 from param.parameterized import bothmethod
 
@@ -28,6 +31,7 @@ from .element import Collator, Element
 from .overlay import Overlay, Layout
 from .ndmapping import OrderedDict, NdMapping, UniformNdMapping
 from .options import Store
+from .spaces import HoloMap, DynamicMap
 from .util import unique_iterator, group_sanitizer, label_sanitizer
 
 
@@ -303,19 +307,25 @@ class Pickler(Exporter):
     The recommended pickler for serializing HoloViews object to a .hvz
     file (a simple zip archive of pickle files). In addition to the
     functionality offered by Store.dump and Store.load, this file
-    format offers three additional features:
+    format offers four additional features:
 
     1. Optional (zip) compression.
     2. Ability to save and load components of a Layout independently.
     3. Support for metadata per saved component.
+    4. HoloMap frames stored as separate entries which may be loaded
+       lazily.
 
     The output file with the .hvz file extension is simply a zip
-    archive containing pickled HoloViews objects.
+    archive containing pickled HoloViews objects. Each HoloMap
+    component is stored as an empty HoloMap with a key index and one
+    entry per frame, where frames holding a numeric array have their
+    data stored as a separate .npy entry.
     """
 
-    protocol = param.Integer(default=2, doc="""
+    protocol = param.Integer(default=pickle.HIGHEST_PROTOCOL, doc="""
         The pickling protocol where 0 is ASCII, 1 supports old Python
-        versions and 2 is efficient for new style classes.""")
+        versions and 2 is efficient for new style classes. Defaults
+        to the highest protocol available.""")
 
     compress = param.Boolean(default=True, doc="""
         Whether compression is enabled or not""")
@@ -323,6 +333,9 @@ class Pickler(Exporter):
     mime_type = 'application/zip'
     file_ext = 'hvz'
 
+    # Version of the archive format
+    version = 2
+
 
     def __call__(self, obj, key={}, info={}, **kwargs):
         buff = BytesIO()
@@ -330,12 +343,32 @@ class Pickler(Exporter):
         buff.seek(0)
         return buff.read(), {'file-ext': 'hvz', 'mime_type':self.mime_type}
 
+    @bothmethod
+    def _dump_frame(self_or_cls, f, entry, frame):
+        """
+        Writes a single frame to the archive, storing numeric array
+        data as a separate .npy entry. Returns whether the data was
+        written separately.
+        """
+        data = getattr(frame, 'data', None)
+        if not (isinstance(data, np.ndarray) and data.dtype.kind in 'biufcmM'):
+            f.writestr(entry, Store.dumps(frame, protocol=self_or_cls.protocol))
+            return False
+        buff = BytesIO()
+        np.save(buff, data, allow_pickle=False)
+        f.writestr(entry+'.npy', buff.getvalue())
+        # Pickle a shallow copy without data, leaving the frame untouched
+        stub = copy.copy(frame)
+        stub.data = None
+        f.writestr(entry, Store.dumps(stub, protocol=self_or_cls.protocol))
+        return True
+
     @bothmethod
     def save(self_or_cls, obj, filename, key={}, info={}, **kwargs):
         base_info = {'file-ext': 'hvz', 'mime_type':self_or_cls.mime_type}
         key = self_or_cls._merge_metadata(obj, self_or_cls.key_fn, key)
         info = self_or_cls._merge_metadata(obj, self_or_cls.info_fn, info, base_info)
-        compression = zipfile.ZIP_STORED if self_or_cls.compress else zipfile.ZIP_DEFLATED
+        compression = zipfile.ZIP_DEFLATED if self_or_cls.compress else zipfile.ZIP_STORED
 
         filename = self_or_cls._filename(filename) if isinstance(filename, str) else filename
         with zipfile.ZipFile(filename, 'w', compression=compression) as f:
@@ -350,8 +383,19 @@ class Pickler(Exporter):
                 components = [obj]
 
             for component, entry in zip(components, entries):
-                f.writestr(entry,
-                           Store.dumps(component, protocol=self_or_cls.protocol))
+                if type(component) is not HoloMap:
+                    f.writestr(entry,
+                               Store.dumps(component, protocol=self_or_cls.protocol))
+                    continue
+                keys, npy = [], []
+                for i, (k, frame) in enumerate(component.data.items()):
+                    keys.append(k)
+                    npy.append(self_or_cls._dump_frame(f, '%s/%d' % (entry, i), frame))
+                f.writestr(entry, Store.dumps(component.clone(shared_data=False),
+                                              protocol=self_or_cls.protocol))
+                f.writestr(entry+'/index', pickle.dumps({'keys': keys, 'npy': npy},
+                                                        protocol=self_or_cls.protocol))
+            f.writestr('version', str(self_or_cls.version))
             f.writestr('metadata',
                        pickle.dumps({'info':info, 'key':key}))
 
@@ -370,19 +414,81 @@ class Unpickler(Importer):
     the entries method.
     """
 
+    lazy = param.Boolean(default=False, doc="""
+        Whether HoloMaps stored frame by frame are loaded as a
+        DynamicMap which only reads the frames that are accessed.
+        If disabled all frames are read into a HoloMap. Files loaded
+        via the Collators returned by collect are always read into
+        HoloMaps.""")
+
+    processes = param.Integer(default=8, bounds=(1, None), doc="""
+        The number of threads used to scan the metadata of the files
+        supplied to collect.""")
+
     def __call__(self, data, entries=None):
         buff = BytesIO(data)
         return self.load(buff, entries=entries)
 
+    @classmethod
+    def _load_frame(cls, f, entry, npy):
+        frame = Store.loads(f.read(entry))
+        if npy:
+            frame.data = np.load(BytesIO(f.read(entry+'.npy')), allow_pickle=False)
+        return frame
+
+    @bothmethod
+    def _load_holomap(self_or_cls, filename, f, entry, lazy):
+        """
+        Loads a HoloMap stored frame by frame, either returning a
+        DynamicMap reading each frame from the archive on access or
+        a HoloMap containing all the frames.
+        """
+        hmap = Store.loads(f.read(entry))
+        index = pickle.loads(f.read(entry+'/index'))
+        keys, npy = index['keys'], index['npy']
+        if not lazy:
+            frames = [self_or_cls._load_frame(f, '%s/%d' % (entry, i), n)
+                      for i, n in enumerate(npy)]
+            return hmap.clone(list(zip(keys, frames)))
+
+        # The archive is opened on first access and kept open
+        lookup, archive = {k: i for i, k in enumerate(keys)}, []
+        def load_frame(*key):
+            if key not in lookup:
+                raise KeyError('Key %s not found in archive entry %s.' % (key, entry))
+            if not archive:
+                archive.append(zipfile.ZipFile(filename, 'r'))
+            i = lookup[key]
+            return self_or_cls._load_frame(archive[0], '%s/%d' % (entry, i), npy[i])
+
+        kdims = [kd.clone(values=list(unique_iterator([k[d] for k in keys])))
+                 for d, kd in enumerate(hmap.kdims)]
+        dmap = DynamicMap(load_frame, kdims=kdims, group=hmap.group,
+                          label=hmap.label)
+        dmap.id = hmap.id
+        return dmap
+
     @bothmethod
-    def load(self_or_cls, filename, entries=None):
+    def loader(self_or_cls, kwargs):
+        # Collators add dimensions to the loaded objects so HoloMaps
+        # have to be materialized
+        return self_or_cls.load(lazy=False, **kwargs)
+
+    @bothmethod
+    def load(self_or_cls, filename, entries=None, lazy=None):
         components, single_layout = [], False
+        lazy = self_or_cls.lazy if lazy is None else lazy
         entries = entries if entries else self_or_cls.entries(filename)
         with zipfile.ZipFile(filename, 'r') as f:
+            names = f.namelist()
             for entry in entries:
-                if entry not in f.namelist():
+                if entry not in names:
                     raise Exception("Entry %s not available" % entry)
-                components.append(Store.loads(f.read(entry)))
+                if entry+'/index' in names:
+                    component = self_or_cls._load_holomap(filename, f, entry, lazy)
+                else:
+                    component = Store.loads(f.read(entry))
+                components.append(component)
                 single_layout = entry.endswith('(L)')
 
         if len(components) == 1 and not single_layout:
@@ -411,10 +517,68 @@ class Unpickler(Importer):
     @bothmethod
     def entries(self_or_cls, filename):
         with zipfile.ZipFile(filename, 'r') as f:
-            return [el for el in f.namelist() if el != 'metadata']
+            return [el for el in f.namelist()
+                    if el not in ('metadata', 'version') and '/' not in el]
 
     @bothmethod
-    def collect(self_or_cls, files, drop=[], metadata=True):
+    def scan(self_or_cls, filename):
+        """
+        Returns a dictionary of the key, info and entries of the
+        supplied file, opening the archive only once.
+        """
+        with zipfile.ZipFile(filename, 'r') as f:
+            names = f.namelist()
+            metadata = (pickle.loads(f.read('metadata'))
+                        if 'metadata' in names else {})
+        entries = [el for el in names
+                   if el not in ('metadata', 'version') and '/' not in el]
+        return {'key': metadata.get('key', {}), 'info': metadata.get('info', {}),
+                'entries': entries}
+
+    @bothmethod
+    def _scan_files(self_or_cls, fnames, index=None):
+        """
+        Scans the supplied files in parallel returning a dictionary
+        mapping from filename to the scanned metadata. If an index
+        file is supplied, the metadata of files which have not been
+        modified since the last scan is read from the index and the
+        index is updated with any newly scanned files.
+        """
+        fnames = list(unique_iterator(fnames))
+        stats = {fname: os.stat(fname) for fname in fnames}
+        scanned, conn = {}, None
+        if index is not None:
+            conn = sqlite3.connect(index)
+            conn.execute('CREATE TABLE IF NOT EXISTS files (filename TEXT PRIMARY KEY, '
+                         'mtime REAL, size INTEGER, metadata BLOB)')
+            for fname, mtime, size, mdata in conn.execute(
+                    'SELECT filename, mtime, size, metadata FROM files'):
+                stat = stats.get(fname)
+                if stat is not None and (stat.st_mtime, stat.st_size) == (mtime, size):
+                    scanned[fname] = pickle.loads(bytes(mdata))
+
+        missing = [fname for fname in fnames if fname not in scanned]
+        if len(missing) > 1 and self_or_cls.processes > 1:
+            pool = ThreadPool(min(self_or_cls.processes, len(missing)))
+            try:
+                results = pool.map(self_or_cls.scan, missing)
+            finally:
+                pool.close()
+        else:
+            results = [self_or_cls.scan(fname) for fname in missing]
+        scanned.update(zip(missing, results))
+
+        if conn is not None:
+            with conn:
+                conn.executemany('INSERT OR REPLACE INTO files VALUES (?, ?, ?, ?)',
+                                 [(fname, stats[fname].st_mtime, stats[fname].st_size,
+                                   sqlite3.Binary(pickle.dumps(mdata, protocol=2)))
+                                  for fname, mdata in zip(missing, results)])
+            conn.close()
+        return scanned
+
+    @bothmethod
+    def collect(self_or_cls, files, drop=[], metadata=True, index=None):
         """
         Given a list or NdMapping type containing file paths return a
         Layout of Collators, which can be called to load a given set
@@ -425,6 +589,11 @@ class Unpickler(Importer):
         supplied additional key dimensions may be supplied as long as
         they do not clash with the file metadata. Any key dimension
         may be dropped by name by supplying a drop argument.
+
+        The metadata of each file is read once, scanning the files in
+        parallel. Optionally the path of a SQLite index file may be
+        supplied, in which case only files which were added or
+        modified since the previous collection are scanned.
         """
         aslist = not isinstance(files, (NdMapping, Element))
         if isinstance(files, Element):
@@ -434,16 +603,18 @@ class Unpickler(Importer):
             file_kdims = files.kdims
         drop_extra = files.drop if isinstance(files, Collator) else []
 
+        fnames = [fname[0] if isinstance(fname, tuple) else fname
+                  for fname in files.values()]
+        scanned = self_or_cls._scan_files(fnames, index)
+
         mdata_dims = []
         if metadata:
-            fnames = [fname[0] if isinstance(fname, tuple) else fname
-                      for fname in files.values()]
             mdata_dims = {kdim for fname in fnames
-                          for kdim in self_or_cls.key(fname).keys()}
+                          for kdim in scanned[fname]['key'].keys()}
         file_dims = set(files.dimensions('key', label=True))
-        added_dims = set(mdata_dims) - file_dims
+        added_dims = sorted(set(mdata_dims) - file_dims)
         overlap_dims = file_dims & set(mdata_dims)
-        kwargs = dict(kdims=file_kdims + sorted(added_dims),
+        kwargs = dict(kdims=file_kdims + added_dims,
                       vdims=['filename', 'entries'],
                       value_transform=self_or_cls.loader,
                       drop=drop_extra + drop)
@@ -451,7 +622,7 @@ class Unpickler(Importer):
 
         for key, fname in files.data.items():
             fname = fname[0] if isinstance(fname, tuple) else fname
-            mdata = self_or_cls.key(fname) if metadata else {}
+            mdata = scanned[fname]['key'] if metadata else {}
             for odim in overlap_dims:
                 kval = key[files.get_dimension_index(odim)]
                 if kval != mdata[odim]:
@@ -459,9 +630,7 @@ class Unpickler(Importer):
                                    "value for dimension %s" % odim)
             mkey = tuple(mdata.get(d, None) for d in added_dims)
             key = mkey if aslist else key + mkey
-            if isinstance(fname, tuple) and len(fname) == 1:
-                (fname,) = fname
-            for entry in self_or_cls.entries(fname):
+            for entry in scanned[fname]['entries']:
                 layout_data[entry][key] = (fname, [entry])
         return Layout(layout_data.items())
 
@@ -518,6 +687,16 @@ def simple_name_generator(obj):
 
 
 
+class _SpooledData(object):
+    "Reference to encoded archive contents spooled to disk."
+
+    __slots__ = ['path', 'digest']
+
+    def __init__(self, path, digest):
+        self.path, self.digest = path, digest
+
+
+
 class FileArchive(Archive):
     """
     A file archive stores files on disk, either unpacked in a
@@ -597,6 +776,19 @@ class FileArchive(Archive):
        Flushed the contents of the archive after export.
        """)
 
+    spool = param.Boolean(default=False, doc="""
+       Whether the encoded contents of each entry are written to a
+       temporary spool directory when added instead of being held in
+       memory until export. Identical contents are spooled once and
+       the spool directory is removed when the archive is flushed,
+       cleared or garbage collected.""")
+
+    processes = param.Integer(default=4, bounds=(1, None), doc="""
+       The number of threads used to encode and hash the entries of
+       the archive on export. Objects are still rendered one at a time
+       as they are added since the plotting backends are not thread
+       safe.""")
+
 
     ffields = {'type', 'group', 'label', 'obj', 'SHA', 'timestamp', 'dimensions'}
     efields = {'timestamp'}
@@ -615,6 +807,7 @@ class FileArchive(Archive):
         super(FileArchive, self).__init__(**params)
         #  Items with key: (basename,ext) and value: (data, info)
         self._files = OrderedDict()
+        self._spool_dir = None
         self._validate_formatters()
 
 
@@ -690,9 +883,83 @@ class FileArchive(Archive):
 
     def _add_content(self, obj, data, info, filename=None):
         (unique_key, ext) = self._compute_filename(obj, info, filename=filename)
+        if self.spool:
+            data = self._spool_data(Exporter.encode((data, info)))
         self._files[(unique_key, ext)] = (data, info)
 
 
+    def _spool_data(self, data):
+        """
+        Writes the encoded data to the spool directory, named by its
+        SHA256 digest, returning a reference to the spooled file.
+        """
+        if self._spool_dir is None:
+            self._spool_dir = tempfile.mkdtemp(prefix='holoviews-archive-')
+        digest = sha256(data).hexdigest()
+        path = os.path.join(self._spool_dir, digest)
+        if not os.path.isfile(path):
+            with open(path, 'wb') as f:
+                f.write(data)
+        return _SpooledData(path, digest)
+
+
+    def _encode_entry(self, entry):
+        """
+        Returns the SHA256 digest of an entry along with either the
+        encoded data or a reference to the spooled file.
+        """
+        if isinstance(entry[0], _SpooledData):
+            return entry[0].digest, entry[0]
+        data = Exporter.encode(entry)
+        return sha256(data).hexdigest(), data
+
+
+    def _encoded(self, files):
+        """
+        Generator over the files returning the filename, digest and
+        encoded data (or spooled file reference) of each entry,
+        encoding the entries over a thread pool.
+        """
+        entries = [entry for _, entry in files]
+        if self.processes > 1 and len(entries) > 1:
+            pool = ThreadPool(min(self.processes, len(entries)))
+            try:
+                for (name, _), (digest, data) in zip(files, pool.imap(self._encode_entry, entries)):
+                    yield name, digest, data
+            finally:
+                pool.close()
+        else:
+            for name, entry in files:
+                digest, data = self._encode_entry(entry)
+                yield name, digest, data
+
+
+    @classmethod
+    def _write_data(cls, fpath, data, linked=None):
+        """
+        Writes encoded data to the supplied path, hard linking to an
+        existing file with identical contents if available.
+        """
+        source = linked or (data.path if isinstance(data, _SpooledData) else None)
+        if source is not None:
+            try:
+                os.link(source, fpath)
+                return
+            except (OSError, AttributeError):
+                shutil.copyfile(source, fpath)
+                return
+        with open(fpath, 'wb') as f:
+            f.write(data)
+
+
+    @classmethod
+    def _read_data(cls, data):
+        if isinstance(data, _SpooledData):
+            with open(data.path, 'rb') as f:
+                return f.read()
+        return data
+
+
     def _compute_filename(self, obj, info, filename=None):
         if filename is None:
             hashfn = sha256()
@@ -721,19 +988,31 @@ class FileArchive(Archive):
         return (unique_key, ext)
 
     def _zip_archive(self, export_name, files, root):
+        """
+        Writes the files to a zip archive. Unlike tar, the zip format
+        has no portable support for links so entries with identical
+        contents are stored once per filename.
+        """
         archname = '.'.join(self._unique_name(export_name, 'zip', root))
         with zipfile.ZipFile(os.path.join(root, archname), 'w') as zipf:
-            for (basename, ext), entry in files:
+            for (basename, ext), _, data in self._encoded(files):
                 filename = self._truncate_name(basename, ext)
-                zipf.writestr(('%s/%s' % (export_name, filename)),Exporter.encode(entry))
+                zipf.writestr(('%s/%s' % (export_name, filename)), self._read_data(data))
 
     def _tar_archive(self, export_name, files, root):
         archname = '.'.join(self._unique_name(export_name, 'tar', root))
+        written = {}
         with tarfile.TarFile(os.path.join(root, archname), 'w') as tarf:
-            for (basename, ext), entry in files:
+            for (basename, ext), digest, data in self._encoded(files):
                 filename = self._truncate_name(basename, ext)
                 tarinfo = tarfile.TarInfo('%s/%s' % (export_name, filename))
-                filedata = Exporter.encode(entry)
+                if digest in written:
+                    tarinfo.type = tarfile.LNKTYPE
+                    tarinfo.linkname = written[digest]
+                    tarf.addfile(tarinfo)
+                    continue
+                written[digest] = tarinfo.name
+                filedata = self._read_data(data)
                 tarinfo.size = len(filedata)
                 tarf.addfile(tarinfo, BytesIO(filedata))
 
@@ -743,8 +1022,8 @@ class FileArchive(Archive):
         (unique_name, ext) = self._unique_name(full_fname, ext, root)
         filename = self._truncate_name(self._normalize_name(unique_name), ext=ext)
         fpath = os.path.join(root, filename)
-        with open(fpath, 'wb') as f:
-            f.write(Exporter.encode(entry))
+        _, data = self._encode_entry(entry)
+        self._write_data(fpath, data)
 
     def _directory_archive(self, export_name, files, root):
         output_dir = os.path.join(root, self._unique_name(export_name,'', root)[0])
@@ -752,11 +1031,12 @@ class FileArchive(Archive):
             shutil.rmtree(output_dir)
         os.makedirs(output_dir)
 
-        for (basename, ext), entry in files:
+        written = {}
+        for (basename, ext), digest, data in self._encoded(files):
             filename = self._truncate_name(basename, ext)
             fpath = os.path.join(output_dir, filename)
-            with open(fpath, 'wb') as f:
-                f.write(Exporter.encode(entry))
+            self._write_data(fpath, data, written.get(digest))
+            written.setdefault(digest, fpath)
 
 
     def _unique_name(self, basename, ext, existing, force=False):
@@ -823,7 +1103,21 @@ class FileArchive(Archive):
         elif self.archive_format == 'tar':
             self._tar_archive(export_name, files, root)
         if self.flush_archive:
-            self._files = OrderedDict()
+            self.clear()
+
+    def clear(self):
+        "Clears the file archive, removing any spooled contents"
+        self._files = OrderedDict()
+        spool_dir = getattr(self, '_spool_dir', None)
+        if spool_dir is not None:
+            shutil.rmtree(spool_dir, ignore_errors=True)
+            self._spool_dir = None
+
+    def __del__(self):
+        try:
+            self.clear()
+        except Exception:
+            pass
 
     def _format(self, formatter, info):
         filtered = {k:v for k,v in info.items()
@@ -212,6 +212,7 @@ class AdjointLayout(Dimensioned):
         if key in ['main', 'right', 'top']:
             if isinstance(value, (ViewableElement, UniformNdMapping, Empty)):
                 self.data[key] = value
+                self._invalidate_index()
             else:
                 raise ValueError('AdjointLayout only accepts Element types.')
         else:
@@ -381,6 +382,11 @@ class Layout(AttrTree, Dimensioned):
         Dimensioned.__init__(self, self.data, **params)
 
 
+    def _propagate(self, path, val):
+        self._invalidate_index()
+        super(Layout, self)._propagate(path, val)
+
+
     @classmethod
     def from_values(cls, vals):
         """
@@ -172,6 +172,7 @@ class MultiDimensionalMapping(Dimensioned):
             self.data[dim_vals].update(data)
         else:
             self.data[dim_vals] = data
+        self._invalidate_index()
 
         if sort:
             self._resort()
@@ -242,6 +243,7 @@ class MultiDimensionalMapping(Dimensioned):
 
 
     def _resort(self):
+        self._invalidate_index()
         self.data = OrderedDict(dimension_sort(self.data, self.kdims, self.vdims,
                                                range(self.ndims)))
 
@@ -501,6 +503,7 @@ class MultiDimensionalMapping(Dimensioned):
     def pop(self, key, default=None):
         "Standard pop semantics for all mapping types"
         if not isinstance(key, tuple): key = (key,)
+        self._invalidate_index()
         return self.data.pop(key, default)
 
 
@@ -764,6 +767,24 @@ class UniformNdMapping(NdMapping):
                                               if k not in pos_args})
 
 
+    def map(self, map_fn, specs=None, clone=True):
+        """
+        Recursively replaces elements using a map function when the
+        specification applies. The mapped items are inserted in their
+        existing order, avoiding a resort on every insertion.
+        """
+        if specs and not isinstance(specs, list): specs = [specs]
+        applies = specs is None or any(self.matches(spec) for spec in specs)
+
+        deep_mapped = self.clone(shared_data=False) if clone else self
+        for k, v in list(self.data.items()):
+            new_val = v.map(map_fn, specs, clone)
+            if new_val is not None:
+                deep_mapped._add_item(k, new_val, sort=False, update=False)
+        if applies: deep_mapped = map_fn(deep_mapped)
+        return deep_mapped
+
+
     @property
     def group(self):
         if self._group:
@@ -780,6 +801,7 @@ class UniformNdMapping(NdMapping):
             raise ValueError("Supplied group %s contains invalid "
                              "characters." % self.group)
         self._group = group
+        self._invalidate_index()
 
 
     @property
@@ -800,6 +822,7 @@ class UniformNdMapping(NdMapping):
             raise ValueError("Supplied group %s contains invalid "
                              "characters." % self.group)
         self._label = label
+        self._invalidate_index()
 
     @property
     def type(self):
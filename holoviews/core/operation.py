@@ -68,6 +68,10 @@ class Operation(param.ParameterizedFunction):
     _preprocess_hooks = []
     _postprocess_hooks = []
 
+    # The object the operation is dynamically applied to, set by the
+    # Dynamic utility while it processes the elements of that object
+    _source = None
+
     @classmethod
     def search(cls, element, pattern):
         """
@@ -33,6 +33,7 @@ Store:
 
 """
 import pickle
+import threading
 import traceback
 import difflib
 from contextlib import contextmanager
@@ -793,6 +794,22 @@ class Compositor(param.Parameterized):
     operations = []  # The operations that can be used to define compositors.
     definitions = [] # The set of all the compositor instances
 
+    # Cache of strongest matches keyed by overlay signature and mode
+    _match_cache = OrderedDict()
+    _match_cache_size = 1000
+    _match_definitions = ()
+
+    @classmethod
+    def signature(cls, overlay):
+        """
+        Returns the structural signature of an overlay, i.e. the
+        type, group and label of each of its items, which fully
+        determines which compositors match it.
+        """
+        return tuple((type(el).__name__, el.group, el.label)
+                     for el in overlay.values())
+
+
     @classmethod
     def strongest_match(cls, overlay, mode):
         """
@@ -801,12 +818,27 @@ class Compositor(param.Parameterized):
 
         The best match is defined as the compositor operation with the
         highest match value as returned by the match_level method.
+        Matches are cached on the signature of the overlay and the
+        cache is invalidated whenever the definitions change.
         """
-        match_strength = [(op.match_level(overlay), op) for op in cls.definitions
+        definitions = tuple(cls.definitions)
+        if definitions != Compositor._match_definitions:
+            Compositor._match_cache.clear()
+            Compositor._match_definitions = definitions
+
+        key = (cls.signature(overlay), mode)
+        cache = Compositor._match_cache
+        if key in cache:
+            return cache[key]
+
+        match_strength = [(op.match_level(overlay), op) for op in definitions
                           if op.mode == mode]
         matches = [(match[0], op, match[1]) for (match, op) in match_strength if match is not None]
-        if matches == []: return None
-        else:             return sorted(matches)[0]
+        match = sorted(matches)[0] if matches else None
+        cache[key] = match
+        if len(cache) > cls._match_cache_size:
+            cache.popitem(last=False)
+        return match
 
 
     @classmethod
@@ -895,6 +927,7 @@ class Compositor(param.Parameterized):
         cls.definitions.append(compositor)
         if compositor.operation not in cls.operations:
             cls.operations.append(compositor.operation)
+        Compositor._match_cache.clear()
 
 
     def __init__(self, pattern, operation, group, mode, transfer_options=False,
@@ -973,8 +1006,9 @@ class Compositor(param.Parameterized):
 
         # Check all the possible slices and return the best matching one
         best_lvl, match_slice = (0, None)
-        for i in range(len(overlay)-slice_width+1):
-            overlay_slice = overlay.values()[i:i+slice_width]
+        values = overlay.values()
+        for i in range(len(values)-slice_width+1):
+            overlay_slice = values[i:i+slice_width]
             lvl = self._slice_match_level(overlay_slice)
             if lvl is None: continue
             if lvl > best_lvl:
@@ -1037,6 +1071,10 @@ class Store(object):
     load_counter_offset = None
     save_option_state = False
 
+    # Serializes (un)pickling since load_counter_offset and
+    # save_option_state are global state read while (un)pickling
+    _pickle_lock = threading.RLock()
+
     current_backend = 'matplotlib'
 
     @classmethod
@@ -1069,10 +1107,12 @@ class Store(object):
         Equivalent to pickle.load except that the HoloViews trees is
         restored appropriately.
         """
-        cls.load_counter_offset = StoreOptions.id_offset()
-        val = pickle.load(filename)
-        cls.load_counter_offset = None
-        return val
+        with cls._pickle_lock:
+            cls.load_counter_offset = StoreOptions.id_offset()
+            try:
+                return pickle.load(filename)
+            finally:
+                cls.load_counter_offset = None
 
     @classmethod
     def loads(cls, pickle_string):
@@ -1080,10 +1120,12 @@ class Store(object):
         Equivalent to pickle.loads except that the HoloViews trees is
         restored appropriately.
         """
-        cls.load_counter_offset = StoreOptions.id_offset()
-        val = pickle.loads(pickle_string)
-        cls.load_counter_offset = None
-        return val
+        with cls._pickle_lock:
+            cls.load_counter_offset = StoreOptions.id_offset()
+            try:
+                return pickle.loads(pickle_string)
+            finally:
+                cls.load_counter_offset = None
 
     @classmethod
     def dump(cls, obj, file, protocol=0):
@@ -1091,9 +1133,12 @@ class Store(object):
         Equivalent to pickle.dump except that the HoloViews option
         tree is saved appropriately.
         """
-        cls.save_option_state = True
-        pickle.dump(obj, file, protocol=protocol)
-        cls.save_option_state = False
+        with cls._pickle_lock:
+            cls.save_option_state = True
+            try:
+                pickle.dump(obj, file, protocol=protocol)
+            finally:
+                cls.save_option_state = False
 
     @classmethod
     def dumps(cls, obj, protocol=0):
@@ -1101,10 +1146,12 @@ class Store(object):
         Equivalent to pickle.dumps except that the HoloViews option
         tree is saved appropriately.
         """
-        cls.save_option_state = True
-        val = pickle.dumps(obj, protocol=protocol)
-        cls.save_option_state = False
-        return val
+        with cls._pickle_lock:
+            cls.save_option_state = True
+            try:
+                return pickle.dumps(obj, protocol=protocol)
+            finally:
+                cls.save_option_state = False
 
     @classmethod
     def info(cls, obj, ansi=True, backend='matplotlib', visualization=True,
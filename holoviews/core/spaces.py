@@ -898,6 +898,7 @@ class DynamicMap(HoloMap):
         """
         Return a cleared dynamic map with a cleared cached
         """
+        self._invalidate_index()
         self.data = OrderedDict()
         return self
 
@@ -1073,7 +1074,7 @@ class DynamicMap(HoloMap):
                       else self.cache_size)
         if len(self) >= cache_size:
             first_key = next(k for k in self.data)
-            self.data.pop(first_key)
+            self.pop(first_key)
         self[key] = val
 
 
@@ -1580,6 +1580,28 @@ def search_indices(values, source):
     return orig_indices[np.searchsorted(source[orig_indices], values)]
 
 
+def isin(values, elements):
+    """
+    Vectorized membership test returning a boolean mask of the
+    supplied values which are contained in the list of elements.
+    Avoids allocating one mask per element, falling back to
+    elementwise comparisons for types that cannot be sorted.
+    """
+    values = np.asarray(values)
+    elements = list(elements)
+    if not elements:
+        return np.zeros(values.shape, dtype=bool)
+    elif len({type(e) for e in elements}) > 1:
+        # Avoid numpy coercing mixed types to a common (string) type
+        elements = np.array(elements, dtype=object)
+    try:
+        if hasattr(np, 'isin'):
+            return np.isin(values, elements)
+        return np.in1d(values.ravel(), elements).reshape(values.shape)
+    except TypeError:
+        return np.logical_or.reduce([values == e for e in elements])
+
+
 def compute_edges(edges):
     """
     Computes edges as midpoints of the bin centers.  The first and
@@ -96,3 +96,12 @@ def public(obj):
     return issubclass(obj, Element)
 
 __all__ = list(set([_k for _k, _v in locals().items() if public(_v)]))
+
+# Modules imported when first accessed (requires Python >= 3.7)
+_lazy_submodules = ['comparison']
+
+def __getattr__(name):
+    if name in _lazy_submodules:
+        import importlib
+        return importlib.import_module('.'+name, __name__)
+    raise AttributeError("module %r has no attribute %r" % (__name__, name))
@@ -421,6 +421,14 @@ class TriMesh(Graph):
 
     group = param.String(default='TriMesh', constant=True)
 
+    _triangle_cache = None
+
+    def __getstate__(self):
+        "Drops the cached simplex and vertex arrays when pickling"
+        state = super(TriMesh, self).__getstate__()
+        state.pop('_triangle_cache', None)
+        return state
+
     def __init__(self, data, kdims=None, vdims=None, **params):
         if isinstance(data, tuple):
             data = data + (None,)*(3-len(data))
@@ -479,6 +487,18 @@ class TriMesh(Graph):
         tris = Delaunay(points.array([0, 1]))
         return cls((tris.simplices, points))
 
+    def _triangles(self):
+        """
+        Returns the simplices as an (N, 3) integer array and the node
+        positions as an (M, 2) float array. The arrays are cached so
+        the edgepaths and rasterization share a single vertex layout.
+        """
+        if self._triangle_cache is None:
+            simplices = self.array([0, 1, 2]).astype(np.int32)
+            vertices = self.nodes.array([0, 1]).astype(float)
+            self._triangle_cache = (simplices, vertices)
+        return self._triangle_cache
+
     @property
     def edgepaths(self):
         """
@@ -491,12 +511,14 @@ class TriMesh(Graph):
             self._edgepaths = edgepaths
             return edgepaths
 
-        simplices = self.array([0, 1, 2]).astype(np.int32)
-        pts = self.nodes.array([0, 1]).astype(float)
-        empty = np.array([[np.NaN, np.NaN]])
-        paths = [arr for tri in pts[simplices] for arr in
-                 (tri[[0, 1, 2, 0], :], empty)][:-1]
-        edgepaths = self.edge_type([np.concatenate(paths)],
+        # Each triangle is closed and separated by a NaN row
+        simplices, vertices = self._triangles()
+        paths = np.empty((len(simplices), 5, 2))
+        for i in range(3):
+            paths[:, i] = vertices[simplices[:, i]]
+        paths[:, 3] = paths[:, 0]
+        paths[:, 4] = np.NaN
+        edgepaths = self.edge_type([paths.reshape(-1, 2)[:-1]],
                                     kdims=self.nodes.kdims[:2])
         self._edgepaths = edgepaths
         return edgepaths
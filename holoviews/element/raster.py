@@ -639,6 +639,14 @@ class QuadMesh(Dataset, Element2D):
 
     _binned = True
 
+    _trimesh = None
+
+    def __getstate__(self):
+        "Drops the cached TriMesh when pickling"
+        state = super(QuadMesh, self).__getstate__()
+        state.pop('_trimesh', None)
+        return state
+
     def __setstate__(self, state):
         """
         Ensures old-style QuadMesh types without an interface can be unpickled.
@@ -656,8 +664,12 @@ class QuadMesh(Dataset, Element2D):
 
     def trimesh(self):
         """
-        Converts a QuadMesh into a TriMesh.
+        Converts a QuadMesh into a TriMesh, splitting each quad into
+        two triangles. The TriMesh is cached on the QuadMesh.
         """
+        if self._trimesh is not None:
+            return self._trimesh
+
         # Generate vertices
         xs = self.interface.coords(self, 0, edges=True)
         ys = self.interface.coords(self, 1, edges=True)
@@ -666,24 +678,17 @@ class QuadMesh(Dataset, Element2D):
                       np.tile(ys[:, np.newaxis], len(xs)))
         vertices = (xs.T.flatten(), ys.T.flatten())
 
-        # Generate triangle simplexes
-        shape = self.dimension_values(2, flat=False).shape
-        s0 = shape[0]
-        t1 = np.arange(np.product(shape))
-        js = (t1//s0)
-        t1s = js*(s0+1)+t1%s0
-        t2s = t1s+1
-        t3s = (js+1)*(s0+1)+t1%s0
-        t4s = t2s
-        t5s = t3s
-        t6s = t3s+1
-        t1 = np.concatenate([t1s, t6s])
-        t2 = np.concatenate([t2s, t5s])
-        t3 = np.concatenate([t3s, t4s])
-        ts = (t1, t2, t3)
+        # Generate triangle simplexes, the first triangle of every
+        # quad followed by the second triangle of every quad
+        s0, s1 = self.dimension_values(2, flat=False).shape
+        corners = (np.arange(s1)[:, np.newaxis]*(s0+1) + np.arange(s0)).ravel()
+        simplices = np.empty((2, len(corners), 3), dtype=np.int32)
+        simplices[0] = corners[:, np.newaxis] + [0, 1, s0+1]
+        simplices[1] = corners[:, np.newaxis] + [s0+2, s0+1, 1]
+        simplices = simplices.reshape(-1, 3)
+        ts = tuple(simplices.T)
         for vd in self.vdims:
-            zs = self.dimension_values(vd)
-            ts = ts + (np.concatenate([zs, zs]),)
+            ts = ts + (np.tile(self.dimension_values(vd), 2),)
 
         # Construct TriMesh
         params = util.get_param_values(self)
@@ -691,8 +696,11 @@ class QuadMesh(Dataset, Element2D):
         nodes = TriMesh.node_type(vertices+(np.arange(len(vertices[0])),),
                                   **{k: v for k, v in params.items()
                                      if k != 'vdims'})
-        return TriMesh(((ts,), nodes), **{k: v for k, v in params.items()
-                                          if k != 'kdims'})
+        trimesh = TriMesh(((ts,), nodes), **{k: v for k, v in params.items()
+                                             if k != 'kdims'})
+        trimesh._triangle_cache = (simplices, np.column_stack(vertices).astype(float))
+        self._trimesh = trimesh
+        return trimesh
 
 
 
@@ -713,9 +721,20 @@ class HeatMap(Dataset, Element2D):
 
     vdims = param.List(default=[Dimension('z')], constant=True)
 
+    _gridded = None
+
     def __init__(self, data, kdims=None, vdims=None, **params):
         super(HeatMap, self).__init__(data, kdims=kdims, vdims=vdims, **params)
-        self.gridded = categorical_aggregate2d(self)
+
+    @property
+    def gridded(self):
+        """
+        The 2D aggregate of the HeatMap, computed the first time it
+        is requested.
+        """
+        if self._gridded is None:
+            self._gridded = categorical_aggregate2d(self)
+        return self._gridded
 
     @property
     def raster(self):
@@ -1,5 +1,3 @@
-import itertools
-
 import param
 import numpy as np
 
@@ -7,8 +5,7 @@ from ..core import Dataset, OrderedDict
 from ..core.boundingregion import BoundingBox
 from ..core.operation import Operation
 from ..core.sheetcoords import Slice
-from ..core.util import (is_nan, sort_topologically, one_to_one,
-                         cartesian_product, is_cyclic, datetime_types)
+from ..core.util import is_nan, datetime_types
 
 try:
     import pandas as pd
@@ -133,82 +130,115 @@ class categorical_aggregate2d(Operation):
     datatype = param.List(['xarray', 'grid'] if xr else ['grid'], doc="""
         The grid interface types to use when constructing the gridded Dataset.""")
 
+    sparse = param.Boolean(default=False, doc="""
+        Whether to return a columnar Dataset containing only the
+        non-empty cells, sorted along both key dimensions, instead of
+        a dense grid. The ordering of the categories along each axis
+        is declared as the values of the key dimensions.""")
+
+    @classmethod
+    def _factorize(cls, values):
+        """
+        Returns the unique values in order of first appearance and the
+        integer code of each value into them, followed by the sorted
+        unique values and the codes into those.
+        """
+        uniques, first, inverse = np.unique(values, return_index=True,
+                                            return_inverse=True)
+        inverse = inverse.ravel()
+        order = np.argsort(first, kind='mergesort')
+        ranks = np.empty(len(order), dtype=int)
+        ranks[order] = np.arange(len(order))
+        return uniques[order], ranks[inverse], uniques, inverse
+
+
     def _get_coords(self, obj):
         """
-        Get the coordinates of the 2D aggregate, maintaining the correct
-        sorting order.
+        Get the coordinates of the 2D aggregate and the integer codes
+        of each sample along both axes. The x-coordinates retain the
+        order of first appearance. The y-coordinates are sorted if
+        the y-values are sorted within each x-category, otherwise they
+        also retain the order of first appearance.
         """
         xdim, ydim = obj.dimensions(label=True)[:2]
-        xcoords = obj.dimension_values(xdim, False)
-        ycoords = obj.dimension_values(ydim, False)
-
-        # Determine global orderings of y-values using topological sort
-        grouped = obj.groupby(xdim, container_type=OrderedDict,
-                              group_type=Dataset).values()
-        orderings = OrderedDict()
-        sort = True
-        for group in grouped:
-            vals = group.dimension_values(ydim, False)
-            if len(vals) == 1:
-                orderings[vals[0]] = [vals[0]]
-            else:
-                for i in range(len(vals)-1):
-                    p1, p2 = vals[i:i+2]
-                    orderings[p1] = [p2]
-            if sort:
-                if vals.dtype.kind in ('i', 'f'):
-                    sort = (np.diff(vals)>=0).all()
-                else:
-                    sort = np.array_equal(np.sort(vals), vals)
-        if sort or one_to_one(orderings, ycoords):
-            ycoords = np.sort(ycoords)
-        elif not is_cyclic(orderings):
-            coords = list(itertools.chain(*sort_topologically(orderings)))
-            ycoords = coords if len(coords) == len(ycoords) else np.sort(ycoords)
-        return xcoords, ycoords
-
-
-    def _aggregate_dataset(self, obj, xcoords, ycoords):
+        xcoords, xcodes, _, _ = self._factorize(obj.dimension_values(xdim))
+        ycoords, ycodes, ysorted, yranks = self._factorize(obj.dimension_values(ydim))
+
+        # Check ordering of first occurrences of each y-value per x-category
+        _, first = np.unique(xcodes*len(ysorted)+yranks, return_index=True)
+        first = np.sort(first)
+        first = first[np.argsort(xcodes[first], kind='mergesort')]
+        same = xcodes[first][1:] == xcodes[first][:-1]
+        if (np.diff(yranks[first])[same] >= 0).all():
+            ycoords, ycodes = ysorted, yranks
+        return xcoords, ycoords, xcodes, ycodes
+
+
+    def _scatter(self, values, target, size):
+        """
+        Scatters values onto an array of the given size, assigning the
+        first non-NaN value at each target index.
+        """
+        if values.dtype.kind in 'fc':
+            valid = ~np.isnan(values)
+            dtype, fill = values.dtype, np.NaN
+        elif values.dtype.kind in 'iub':
+            valid = slice(None)
+            dtype, fill = 'float64', np.NaN
+        elif values.dtype.kind == 'M':
+            valid = ~np.isnat(values)
+            dtype, fill = values.dtype, np.datetime64('NaT')
+        else:
+            valid = np.array([not is_nan(v) for v in values], dtype=bool)
+            dtype, fill = object, np.NaN
+        scattered = np.full(size, fill, dtype=dtype)
+        scattered[target[valid][::-1]] = values[valid][::-1]
+        return scattered
+
+
+    def _aggregate_dataset(self, obj, xcoords, ycoords, xcodes, ycodes):
         """
-        Generates a gridded Dataset from a column-based dataset and
-        lists of xcoords and ycoords
+        Generates a gridded Dataset from a column-based dataset, the
+        lists of xcoords and ycoords and the integer codes of each
+        sample along both axes.
         """
         dim_labels = obj.dimensions(label=True)
         vdims = obj.dimensions()[2:]
         xdim, ydim = dim_labels[:2]
         shape = (len(ycoords), len(xcoords))
-        nsamples = np.product(shape)
-
-        ys, xs = cartesian_product([ycoords, xcoords], copy=True)
-        data = {xdim: xs, ydim: ys}
+        grid_data = {xdim: xcoords, ydim: ycoords}
+        target = ycodes*len(xcoords)+xcodes
         for vdim in vdims:
-            values = np.empty(nsamples)
-            values[:] = np.NaN
-            data[vdim.name] = values
-        dtype = 'dataframe' if pd else 'dictionary'
-        dense_data = Dataset(data, kdims=obj.kdims, vdims=obj.vdims, datatype=[dtype])
-        concat_data = obj.interface.concatenate([dense_data, obj], datatype=[dtype])
-        reindexed = concat_data.reindex([xdim, ydim], vdims)
-        if pd:
-            df = PandasInterface.as_dframe(reindexed)
-            df = df.groupby([xdim, ydim], sort=False).first().reset_index()
-            agg = reindexed.clone(df)
-        else:
-            agg = reindexed.aggregate([xdim, ydim], reduce_fn)
+            values = obj.dimension_values(vdim)
+            grid_data[vdim.name] = self._scatter(values, target, np.product(shape)).reshape(shape)
+        return Dataset(obj).clone(grid_data, kdims=[xdim, ydim], vdims=vdims,
+                                  datatype=self.p.datatype)
 
-        # Convert data to a gridded dataset
-        grid_data = {xdim: xcoords, ydim: ycoords}
+
+    def _sparse_dataset(self, obj, xcoords, ycoords, xcodes, ycodes):
+        """
+        Generates a columnar Dataset of the non-empty cells sorted by
+        their x- and y-coordinates.
+        """
+        xdim, ydim = obj.kdims
+        vdims = obj.dimensions()[2:]
+        cells, target = np.unique(xcodes*len(ycoords)+ycodes, return_inverse=True)
+        xcells, ycells = np.divmod(cells, len(ycoords))
+        data = OrderedDict([(xdim.name, xcoords[xcells]), (ydim.name, ycoords[ycells])])
         for vdim in vdims:
-            grid_data[vdim.name] = agg.dimension_values(vdim).reshape(shape)
-        return agg.clone(grid_data, kdims=[xdim, ydim], vdims=vdims,
-                         datatype=self.p.datatype)
+            values = obj.dimension_values(vdim)
+            data[vdim.name] = self._scatter(values, target.ravel(), len(cells))
+        kdims = [xdim(values=list(xcoords)), ydim(values=list(ycoords))]
+        datatype = ['dataframe' if pd else 'dictionary']
+        return Dataset(obj).clone(data, kdims=kdims, vdims=vdims, datatype=datatype)
 
 
     def _process(self, obj, key=None):
         """
-        Generates a categorical 2D aggregate by inserting NaNs at all
-        cross-product locations that do not already have a value assigned.
-        Returns a 2D gridded Dataset object.
+        Generates a categorical 2D aggregate by scattering the values
+        onto a grid of all x- and y-categories, inserting NaNs where no
+        value is assigned. Returns a 2D gridded Dataset object, or a
+        columnar Dataset of the non-empty cells if sparse.
         """
         if isinstance(obj, Dataset) and obj.interface.gridded:
             return obj
@@ -218,10 +248,10 @@ class categorical_aggregate2d(Operation):
             raise ValueError("Must have at two dimensions to aggregate over"
                              "and one value dimension to aggregate on.")
 
-        dtype = 'dataframe' if pd else 'dictionary'
-        obj = Dataset(obj, datatype=[dtype])
-        xcoords, ycoords = self._get_coords(obj)
-        return self._aggregate_dataset(obj, xcoords, ycoords)
+        coords = self._get_coords(obj)
+        if self.p.sparse:
+            return self._sparse_dataset(obj, *coords)
+        return self._aggregate_dataset(obj, *coords)
 
 
 def circular_layout(nodes):
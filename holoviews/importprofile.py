@@ -0,0 +1,96 @@
+"""
+Utilities to profile the cost of importing each submodule of
+HoloViews. Profiling is enabled by setting the
+HOLOVIEWS_PROFILE_IMPORTS environment variable before importing
+holoviews, in which case a report is printed once the import
+completes. This module must only depend on the standard library.
+"""
+from __future__ import print_function
+
+import sys
+import time
+from collections import OrderedDict
+
+
+class _TimedLoader(object):
+    """
+    Wraps a module loader, recording the time taken to execute the
+    module on the supplied ImportProfiler.
+    """
+
+    def __init__(self, loader, profiler):
+        self._loader = loader
+        self._profiler = profiler
+
+    def __getattr__(self, attr):
+        return getattr(self._loader, attr)
+
+    def create_module(self, spec):
+        return self._loader.create_module(spec)
+
+    def exec_module(self, module):
+        self._profiler._enter(module.__name__)
+        try:
+            self._loader.exec_module(module)
+        finally:
+            self._profiler._exit(module.__name__)
+
+
+class ImportProfiler(object):
+    """
+    ImportProfiler is a meta path finder which records the inclusive
+    and exclusive time spent importing each module whose name starts
+    with the supplied prefix. The exclusive time of a module excludes
+    the time spent importing other profiled modules but includes any
+    third-party imports it triggers.
+    """
+
+    def __init__(self, prefix='holoviews'):
+        self.prefix = prefix
+        self.timings = OrderedDict()
+        self._stack = []
+
+    def start(self):
+        if sys.version_info < (3, 4):
+            return
+        if self not in sys.meta_path:
+            sys.meta_path.insert(0, self)
+
+    def stop(self):
+        if self in sys.meta_path:
+            sys.meta_path.remove(self)
+
+    def find_spec(self, name, path=None, target=None):
+        if not name.startswith(self.prefix+'.'):
+            return None
+        for finder in sys.meta_path:
+            if finder is self or not hasattr(finder, 'find_spec'):
+                continue
+            spec = finder.find_spec(name, path, target)
+            if spec is not None:
+                if spec.loader is not None and hasattr(spec.loader, 'exec_module'):
+                    spec.loader = _TimedLoader(spec.loader, self)
+                return spec
+        return None
+
+    def _enter(self, name):
+        self._stack.append([name, time.time(), 0])
+
+    def _exit(self, name):
+        name, start, children = self._stack.pop()
+        total = time.time()-start
+        self.timings[name] = (total, total-children)
+        if self._stack:
+            self._stack[-1][2] += total
+
+    def report(self, limit=None):
+        """
+        Returns a report of the profiled modules sorted by their
+        inclusive import time in milliseconds.
+        """
+        timings = sorted(self.timings.items(), key=lambda x: x[1][0], reverse=True)
+        width = max([len(name) for name in self.timings]+[6])
+        lines = ['%-*s %12s %12s' % (width, 'Module', 'Total (ms)', 'Self (ms)')]
+        for name, (total, own) in timings[:limit]:
+            lines.append('%-*s %12.1f %12.1f' % (width, name, total*1000, own*1000))
+        return '\n'.join(lines)
@@ -73,6 +73,9 @@ class NotebookArchive(FileArchive):
         Similar to FileArchive.filename_formatter except with support
         for the notebook name field as {notebook}.""")
 
+    spool = param.Boolean(default=True, doc="""
+        Similar to FileArchive.spool except enabled by default to
+        bound the memory used by long notebook sessions.""")
 
     auto = param.Boolean(False)
 
@@ -16,6 +16,7 @@ from ..core.options import (Store, StoreOptions, SkipRendering,
 from ..core import (ViewableElement, UniformNdMapping,
                     HoloMap, AdjointLayout, NdLayout, GridSpace, Layout,
                     CompositeOverlay, DynamicMap)
+from ..core.data import LazyDataset
 from ..core.traversal import unique_dimkeys
 from ..core.io import FileArchive
 from ..util.settings import OutputSettings
@@ -231,6 +232,8 @@ def display(obj, raw=False, **kwargs):
     using the IPython display function. If raw is enabled
     the raw HTML is returned instead of displaying it directly.
     """
+    if isinstance(obj, LazyDataset):
+        obj = obj.execute()
     if isinstance(obj, GridSpace):
         with option_state(obj):
             html = grid_display(obj)
@@ -322,6 +325,7 @@ def set_display_hooks(ip):
     html_formatter.for_type(UniformNdMapping, pprint_display)
     html_formatter.for_type(AdjointLayout, pprint_display)
     html_formatter.for_type(Layout, pprint_display)
+    html_formatter.for_type(LazyDataset, pprint_display)
     # Give plot instances rich display
     html_formatter.for_type(Plot, plot_display)
 
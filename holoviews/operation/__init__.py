@@ -19,3 +19,13 @@ for _k, _v in _current_locals:
         Compositor.operations.append(_v)
 
 __all__ = _public + ['Compositor']
+
+# Optional operation modules imported when first accessed
+# (requires Python >= 3.7)
+_lazy_submodules = ['datashader', 'normalization', 'stats', 'timeseries']
+
+def __getattr__(name):
+    if name in _lazy_submodules:
+        import importlib
+        return importlib.import_module('.'+name, __name__)
+    raise AttributeError("module %r has no attribute %r" % (__name__, name))
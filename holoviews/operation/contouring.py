@@ -0,0 +1,329 @@
+"""
+Vectorized marching squares implementation used by the contours
+operation. Rather than building an object per path the functions
+in this module return flat coordinate buffers along with an array
+of offsets delimiting each path and the level (or band) index of
+each path.
+"""
+import numpy as np
+
+
+def _case_tables():
+    """
+    Builds lookup tables for the 16 marching squares cases. Cell
+    corners are numbered counter-clockwise (BL, BR, TR, TL) and edge
+    e joins corner e to corner e+1, i.e. edges are (B, R, T, L).
+    Segments are oriented so that values above the level lie on the
+    right, connecting the edge where the level is crossed upward to
+    the edge where it is crossed downward going counter-clockwise.
+    The saddle cases (5 and 10) hold two segments, indexed by
+    whether the mean of the corners lies above the level.
+    """
+    src, dst = np.full((16, 2, 2), -1, int), np.full((16, 2, 2), -1, int)
+    for case in range(16):
+        bits = [(case >> c) & 1 for c in range(4)]
+        up = [e for e in range(4) if not bits[e] and bits[(e+1) % 4]]
+        down = [e for e in range(4) if bits[e] and not bits[(e+1) % 4]]
+        if len(up) == 1:
+            src[case, :, 0], dst[case, :, 0] = up[0], down[0]
+    B, R, T, L = range(4)
+    for case, centre, segs in [(5, 1, [(R, B), (L, T)]), (5, 0, [(L, B), (R, T)]),
+                               (10, 1, [(B, L), (T, R)]), (10, 0, [(B, R), (T, L)])]:
+        for i, (s, d) in enumerate(segs):
+            src[case, centre, i], dst[case, centre, i] = s, d
+    return src, dst
+
+_SRC_EDGE, _DST_EDGE = _case_tables()
+
+
+class _Grid(object):
+    """
+    Flattened view of a (possibly curvilinear) grid of samples,
+    mapping edge ids to the nodes they join. Horizontal edges are
+    numbered first followed by the vertical edges.
+    """
+
+    def __init__(self, X, Y, Z):
+        self.Z = Z
+        self.ny, self.nx = Z.shape
+        self.nh = self.ny*(self.nx-1)
+        self.nedges = self.nh + (self.ny-1)*self.nx
+        self.nnodes = Z.size
+        self.points = np.column_stack([X.ravel(), Y.ravel()]).astype('float64')
+        self.values = Z.ravel()
+        # Segments are reversed if the grid has a left-handed layout
+        if self.ny > 1 and self.nx > 1:
+            dx, dy = np.diff(X, axis=1)[:-1], np.diff(Y, axis=0)[:, :-1]
+            ux, uy = np.diff(Y, axis=1)[:-1], np.diff(X, axis=0)[:, :-1]
+            self.flip = np.nansum(dx*dy-ux*uy) < 0
+        else:
+            self.flip = False
+
+    def edge_ids(self, edge, i, j):
+        "Maps local cell edges to global edge ids"
+        horizontal = edge % 2 == 0
+        return np.where(horizontal, (i+(edge == 2))*(self.nx-1)+j,
+                        self.nh+i*self.nx+j+(edge == 1))
+
+    def edge_nodes(self, ids):
+        "Returns the start and end node of each edge"
+        horizontal = ids < self.nh
+        row, col = np.divmod(ids, self.nx-1)
+        start = np.where(horizontal, row*self.nx+col, ids-self.nh)
+        return start, np.where(horizontal, start+1, start+self.nx)
+
+    def segments(self, level, valid=None):
+        """
+        Returns the start and end edge ids of all segments of the
+        iso-line at the supplied level.
+        """
+        Z = self.Z
+        if self.ny < 2 or self.nx < 2:
+            empty = np.array([], dtype=int)
+            return empty, empty
+        with np.errstate(invalid='ignore'):
+            above = (Z >= level).astype('uint8')
+        cases = (above[:-1, :-1] | (above[:-1, 1:] << 1) |
+                 (above[1:, 1:] << 2) | (above[1:, :-1] << 3))
+        if valid is not None:
+            cases[~valid] = 0
+        i, j = np.nonzero((cases != 0) & (cases != 15))
+        case = cases[i, j]
+        centre = np.zeros(len(case), dtype=int)
+        saddle = (case == 5) | (case == 10)
+        if saddle.any():
+            si, sj = i[saddle], j[saddle]
+            mean = (Z[si, sj] + Z[si, sj+1] + Z[si+1, sj+1] + Z[si+1, sj])/4.
+            centre[saddle] = mean >= level
+        src = np.concatenate([_SRC_EDGE[case, centre, 0], _SRC_EDGE[case[saddle], centre[saddle], 1]])
+        dst = np.concatenate([_DST_EDGE[case, centre, 0], _DST_EDGE[case[saddle], centre[saddle], 1]])
+        i, j = np.concatenate([i, i[saddle]]), np.concatenate([j, j[saddle]])
+        src, dst = self.edge_ids(src, i, j), self.edge_ids(dst, i, j)
+        return (dst, src) if self.flip else (src, dst)
+
+    def crossings(self, ids, level):
+        """
+        Returns the points where the level crosses the supplied edges
+        along with the node each crossing coincides with, if one of
+        the edge nodes is -inf (and -1 otherwise).
+        """
+        start, end = self.edge_nodes(ids)
+        z0, z1 = self.values[start], self.values[end]
+        with np.errstate(invalid='ignore', divide='ignore'):
+            t = (level-z0)/(z1-z0)
+        t[np.isneginf(z1)] = 0
+        t[np.isneginf(z0)] = 1
+        p0, p1 = self.points[start], self.points[end]
+        points = p0 + t[:, np.newaxis]*(p1-p0)
+        node = np.where(np.isneginf(z1), start, np.where(np.isneginf(z0), end, -1))
+        return points, node
+
+
+def _link(src, dst, flags):
+    """
+    Links segments into paths by matching the end key of each segment
+    to the start key of another. Where multiple segments meet at one
+    key, segments with a different flag are preferred. Returns the
+    segment order and the id of the path each sorted segment belongs
+    to. Closed paths are broken at their lowest segment id.
+    """
+    n = len(src)
+    idx = np.arange(n)
+    out_order = np.lexsort((1-flags, src))
+    in_order = np.lexsort((flags, dst))
+    out_keys, in_keys = src[out_order], dst[in_order]
+    rank = idx - np.searchsorted(in_keys, in_keys, 'left')
+    first = np.searchsorted(out_keys, in_keys, 'left')+rank
+    valid = first < np.searchsorted(out_keys, in_keys, 'right')
+    succ = np.full(n, -1, dtype=int)
+    succ[in_order[valid]] = out_order[first[valid]]
+    pred = np.full(n, -1, dtype=int)
+    pred[succ[succ >= 0]] = idx[succ >= 0]
+
+    # Break cycles at the lowest segment id using pointer jumping
+    steps = int(np.ceil(np.log2(max(n, 2))))+1
+    root = np.where(pred < 0, idx, pred)
+    nxt, low = np.where(succ < 0, idx, succ), idx.copy()
+    for _ in range(steps):
+        root = root[root]
+        low = np.minimum(low, low[nxt])
+        nxt = nxt[nxt]
+    cyclic = pred[root] >= 0
+    pred[cyclic & (low == idx)] = -1
+
+    # Rank each segment by its distance from the start of its path
+    root = np.where(pred < 0, idx, pred)
+    depth = (pred >= 0).astype(int)
+    for _ in range(steps):
+        depth = depth + depth[root]
+        root = root[root]
+    order = np.lexsort((depth, root))
+    return order, root[order]
+
+
+def _path_bounds(paths):
+    "Returns the start and end index of each run of path ids"
+    breaks = np.flatnonzero(paths[1:] != paths[:-1])+1
+    starts = np.concatenate([[0], breaks])
+    return starts, np.concatenate([breaks, [len(paths)]])
+
+
+def contour_lines(X, Y, Z, levels):
+    """
+    Computes the iso-lines of a 2D array of samples Z at the given
+    levels, where X and Y are 2D arrays of the sample coordinates.
+    Cells with any NaN corner are skipped entirely, i.e. unlike
+    matplotlib's default corner_mask=True the valid triangle of a
+    cell with a single NaN corner is not contoured, matching
+    corner_mask=False. Returns a flat (N, 2) array
+    of coordinates, an array of offsets delimiting each path and the
+    index of the level of each path.
+    """
+    grid = _Grid(X, Y, Z)
+    nan = np.isnan(Z)
+    valid = ~(nan[:-1, :-1] | nan[:-1, 1:] | nan[1:, 1:] | nan[1:, :-1])
+    src, dst, starts, ends, ids = [], [], [], [], []
+    for i, level in enumerate(levels):
+        s, d = grid.segments(level, valid)
+        src.append(s+i*grid.nedges)
+        dst.append(d+i*grid.nedges)
+        starts.append(grid.crossings(s, level)[0])
+        ends.append(grid.crossings(d, level)[0])
+        ids.append(np.full(len(s), i, dtype=int))
+    if not len(levels) or not sum(len(s) for s in src):
+        return np.empty((0, 2)), np.zeros(1, dtype=int), np.array([], dtype=int)
+    src, dst, ids = np.concatenate(src), np.concatenate(dst), np.concatenate(ids)
+    order, paths = _link(src, dst, np.zeros(len(src), dtype=int))
+    starts, ends = np.concatenate(starts)[order], np.concatenate(ends)[order]
+    first, last = _path_bounds(paths)
+    coords = np.insert(starts, last, ends[last-1], axis=0)
+    offsets = np.concatenate([[0], np.cumsum(last-first+1)])
+    return coords, offsets, ids[order][first]
+
+
+def _mask_nan_cells(X, Y, Z):
+    """
+    Splits each node into one copy per adjacent cell, so that the
+    copies belonging to cells with a NaN corner can be set to -inf
+    without affecting the neighbouring cells. The cells between the
+    copies of a node have zero area, so the filled polygons close
+    along the edges of the masked cells, just as they do around the
+    -inf padding of the domain. As in contour_lines every cell with
+    a NaN corner is masked entirely (corner_mask=False).
+    """
+    nan = np.isnan(Z)
+    valid = ~(nan[:-1, :-1] | nan[:-1, 1:] | nan[1:, 1:] | nan[1:, :-1])
+    valid = np.pad(valid, 1, mode='constant', constant_values=False)
+    rows, cols = (np.arange(2*Z.shape[0])+1)//2, (np.arange(2*Z.shape[1])+1)//2
+    split = lambda arr: np.repeat(np.repeat(arr, 2, axis=0), 2, axis=1)
+    Z = np.where(valid[np.ix_(rows, cols)], split(Z), -np.inf)
+    return split(X), split(Y), Z
+
+
+def contour_polygons(X, Y, Z, levels):
+    """
+    Computes the filled polygons between each pair of consecutive
+    levels. Each polygon is a closed ring with values in the band
+    lying on its right, holes are returned as separate rings with
+    the opposite orientation. Returns a flat (N, 2) array of
+    coordinates, an array of offsets delimiting each ring and the
+    index of the band of each ring. Cells with any NaN corner are
+    left out of all bands.
+    """
+    Z = np.asarray(Z, dtype='float64')
+    if np.isnan(Z).any():
+        X, Y, Z = _mask_nan_cells(X, Y, Z)
+    # Pad with -inf so the iso-lines close around the domain
+    Z = np.pad(Z, 1, mode='constant', constant_values=-np.inf)
+    grid = _Grid(np.pad(X, 1, mode='edge'), np.pad(Y, 1, mode='edge'), Z)
+    finite = Z[np.isfinite(Z)]
+    levels = np.asarray(levels, dtype='float64')
+    if len(levels) < 2 or not len(finite):
+        return np.empty((0, 2)), np.zeros(1, dtype=int), np.array([], dtype=int)
+    levels = levels.copy()
+    if levels[-1] >= finite.max():
+        levels[-1] = np.inf
+
+    # Crossings at -inf nodes are keyed by node so they coincide
+    # across levels, otherwise by edge id and level.
+    lines = []
+    nedges = grid.nedges
+    for level in levels:
+        s, d = grid.segments(level)
+        (p0, n0), (p1, n1) = grid.crossings(s, level), grid.crossings(d, level)
+        lines.append((s, d, p0, p1, n0, n1))
+
+    size = 2*nedges+grid.nnodes
+    segs = []
+    for band in range(len(levels)-1):
+        for flag, (s, d, p0, p1, n0, n1) in enumerate(lines[band:band+2]):
+            k0 = np.where(n0 >= 0, 2*nedges+n0, s+flag*nedges)+band*size
+            k1 = np.where(n1 >= 0, 2*nedges+n1, d+flag*nedges)+band*size
+            if flag:
+                k0, k1, p0, p1, n0, n1 = k1, k0, p1, p0, n1, n0
+            segs.append((k0, k1, p0, p1, n0 >= 0, n1 >= 0,
+                         np.full(len(k0), flag, dtype=int),
+                         np.full(len(k0), band, dtype=int)))
+    src, dst, p0, p1, node0, node1, flags, bands = [np.concatenate(v) for v in zip(*segs)]
+
+    # Drop zero length segments and pairs of segments running along the
+    # domain boundary in opposite directions at both levels of a band
+    keep = src != dst
+    boundary = keep & node0 & node1
+    if boundary.any():
+        bidx = np.flatnonzero(boundary)
+        pairs = np.column_stack([np.minimum(src, dst), np.maximum(src, dst)])[bidx]
+        _, inverse = np.unique(pairs, axis=0, return_inverse=True)
+        inverse = inverse.ravel()
+        forward = (src < dst)[bidx]
+        nfwd = np.bincount(inverse, forward)
+        nbwd = np.bincount(inverse, ~forward)
+        cancel = (nfwd == nbwd)[inverse]
+        keep[bidx[cancel]] = False
+    src, dst, p0, node0, flags, bands = (src[keep], dst[keep], p0[keep],
+                                         node0[keep], flags[keep], bands[keep])
+    if not len(src):
+        return np.empty((0, 2)), np.zeros(1, dtype=int), np.array([], dtype=int)
+    order, paths = _link(src, dst, flags)
+    points, node, bands = p0[order], node0[order], bands[order]
+
+    # Merge repeated points, left where a ring crosses the zero area
+    # cells between the copies of a node next to masked cells
+    first, last = _path_bounds(paths)
+    lengths = last-first
+    pos = np.arange(len(paths)) - np.repeat(first, lengths)
+    prev = np.repeat(first, lengths) + (pos-1) % np.repeat(lengths, lengths)
+    repeated = (points == points[prev]).all(axis=1) & (np.repeat(lengths, lengths) > 1)
+    points, node, paths, bands = (points[~repeated], node[~repeated],
+                                  paths[~repeated], bands[~repeated])
+    if not len(points):
+        return np.empty((0, 2)), np.zeros(1, dtype=int), np.array([], dtype=int)
+
+    # Remove the spikes left where a ring switches levels at a node
+    first, last = _path_bounds(paths)
+    lengths = last-first
+    pos = np.arange(len(paths)) - np.repeat(first, lengths)
+    prev = np.repeat(first, lengths) + (pos-1) % np.repeat(lengths, lengths)
+    nxt = np.repeat(first, lengths) + (pos+1) % np.repeat(lengths, lengths)
+    u, v = points-points[prev], points[nxt]-points
+    cross = u[:, 0]*v[:, 1]-u[:, 1]*v[:, 0]
+    scale = np.hypot(*u.T)*np.hypot(*v.T)
+    spike = node & ((u*v).sum(axis=1) <= 0) & (np.abs(cross) <= 1e-9*scale)
+    points, paths, bands = points[~spike], paths[~spike], bands[~spike]
+    if not len(points):
+        return np.empty((0, 2)), np.zeros(1, dtype=int), np.array([], dtype=int)
+
+    # Drop degenerate rings
+    first, last = _path_bounds(paths)
+    shifted = np.roll(points, -1, axis=0)
+    shifted[last-1] = points[first]
+    area = np.add.reduceat(points[:, 0]*shifted[:, 1]-shifted[:, 0]*points[:, 1], first)
+    valid = ((last-first) >= 3) & (area != 0)
+    keep = np.repeat(valid, last-first)
+    points, paths, bands = points[keep], paths[keep], bands[keep]
+    if not len(points):
+        return np.empty((0, 2)), np.zeros(1, dtype=int), np.array([], dtype=int)
+    first, last = _path_bounds(paths)
+    coords = np.insert(points, last, points[first], axis=0)
+    offsets = np.concatenate([[0], np.cumsum(last-first+1)])
+    return coords, offsets, bands[first]
@@ -525,12 +525,14 @@ class trimesh_rasterize(aggregate):
 
     def _precompute(self, element):
         from datashader.utils import mesh
+        # Reuse the vertex layout shared with the TriMesh edgepaths
+        simplices, verts = element._triangles()
+        simplices = pd.DataFrame(simplices, columns=[kd.name for kd in element.kdims])
+        verts = pd.DataFrame(verts, columns=[kd.name for kd in element.nodes.kdims[:2]])
         if element.vdims:
-            simplices = element.dframe([0, 1, 2, 3])
-            verts = element.nodes.dframe([0, 1])
+            simplices[element.vdims[0].name] = element.dimension_values(3)
         elif element.nodes.vdims:
-            simplices = element.dframe([0, 1, 2])
-            verts = element.nodes.dframe([0, 1, 3])
+            verts[element.nodes.vdims[0].name] = element.nodes.dimension_values(3)
         return {'mesh': mesh(verts, simplices), 'simplices': simplices,
                 'vertices': verts}
 
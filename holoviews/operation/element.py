@@ -4,6 +4,10 @@ examples.
 """
 from __future__ import division
 
+import hashlib
+from collections import OrderedDict
+from itertools import count
+
 import numpy as np
 
 import param
@@ -19,6 +23,7 @@ from ..element.raster import Raster, Image, RGB, QuadMesh
 from ..element.path import Contours, Polygons
 from ..element.util import categorical_aggregate2d # noqa (API import)
 from ..streams import RangeXY
+from .contouring import contour_lines, contour_polygons
 
 column_interfaces = [ArrayInterface, DictInterface]
 if pd:
@@ -404,6 +409,10 @@ class contours(Operation):
 
     The return is an NdOverlay with a Contours layer for each given
     level, overlaid on top of the input Image.
+
+    Cells with a NaN value at any of their corners are excluded from
+    the contours entirely, equivalent to matplotlib's
+    corner_mask=False.
     """
 
     output_type = Overlay
@@ -420,35 +429,61 @@ class contours(Operation):
     overlaid = param.Boolean(default=False, doc="""
         Whether to overlay the contour on the supplied Element.""")
 
-    def _process(self, element, key=None):
-        try:
-            from matplotlib.contour import QuadContourSet
-            from matplotlib.axes import Axes
-            from matplotlib.figure import Figure
-        except ImportError:
-            raise ImportError("contours operation requires matplotlib.")
-        extent = element.range(0) + element.range(1)[::-1]
-
-        if type(element) is Raster:
-            data = [np.flipud(element.data)]
-        elif isinstance(element, Image):
-            data = [np.flipud(element.dimension_values(2, flat=False))]
-        elif isinstance(element, QuadMesh):
-            data = (element.dimension_values(0, False),
-                    element.dimension_values(1, False),
-                    element.data[2])
+    _contour_cache = None
+
+    _cache_size = 32
 
+    def _grid(self, element):
+        "Returns the coordinate and value arrays of a gridded element"
+        if isinstance(element, QuadMesh):
+            xs = element.interface.coords(element, 0, ordered=True)
+            ys = element.interface.coords(element, 1, ordered=True)
+            if xs.ndim == 1:
+                xs, ys = np.meshgrid(xs, ys)
+            zs = element.dimension_values(2, flat=False)
+        else:
+            zs = element.data if type(element) is Raster else element.dimension_values(2, flat=False)
+            (l, r), (b, t) = element.range(0), element.range(1)
+            xs, ys = np.meshgrid(np.linspace(l, r, zs.shape[1]),
+                                 np.linspace(b, t, zs.shape[0]))
+        return xs, ys, np.asarray(zs, dtype='float64')
+
+    def _contour(self, element, levels, filled):
+        """
+        Computes the contour buffers of the element, reusing results
+        previously computed for identical coordinates, values, levels
+        and filled mode. The cache is held on the operation instance
+        so it only applies when an instance is reused, e.g. via
+        contours.instance() or when applied to a DynamicMap.
+        """
+        if self._contour_cache is None:
+            self._contour_cache = OrderedDict()
+        cache = self._contour_cache
+        xs, ys, zs = self._grid(element)
+        digest = hashlib.sha1()
+        for arr in (xs, ys, zs):
+            digest.update(np.ascontiguousarray(arr, dtype='float64'))
+        key = (digest.hexdigest(), zs.shape, tuple(levels), filled)
+        if key in cache:
+            cache[key] = cache.pop(key)
+            return cache[key]
+        fn = contour_polygons if filled else contour_lines
+        result = fn(xs, ys, zs, levels=levels)
+        cache[key] = result
+        while len(cache) > self._cache_size:
+            cache.popitem(last=False)
+        return result
+
+    def _process(self, element, key=None):
         if isinstance(self.p.levels, int):
             levels = self.p.levels+1 if self.p.filled else self.p.levels
             zmin, zmax = element.range(2)
             levels = np.linspace(zmin, zmax, levels)
         else:
             levels = self.p.levels
-            
+
         xdim, ydim = element.dimensions('key', label=True)
-        fig = Figure()
-        ax = Axes(fig, [0, 0, 1, 1])
-        contour_set = QuadContourSet(ax, *data, filled=self.p.filled, extent=extent, levels=levels)
+        coords, offsets, level_ids = self._contour(element, list(levels), self.p.filled)
         if self.p.filled:
             contour_type = Polygons
             levels = np.convolve(levels, np.ones((2,))/2, mode='valid')
@@ -456,15 +491,8 @@ class contours(Operation):
             contour_type = Contours
         vdims = element.vdims[:1]
 
-        paths = []
-        for level, cset in zip(levels, contour_set.collections):
-            for path in cset.get_paths():
-                if path.codes is None:
-                    subpaths = [path.vertices]
-                else:
-                    subpaths = np.split(path.vertices, np.where(path.codes==1)[0][1:])
-                for p in subpaths:
-                    paths.append({(xdim, ydim): p, element.vdims[0].name: level})
+        paths = [{(xdim, ydim): coords[start:end], vdims[0].name: levels[level]}
+                 for start, end, level in zip(offsets[:-1], offsets[1:], level_ids)]
         contours = contour_type(paths, label=element.label, kdims=element.kdims, vdims=vdims)
         if self.p.overlaid:
             contours = element * contours
@@ -520,13 +548,70 @@ class histogram(Operation):
     style_prefix = param.String(default=None, allow_None=None, doc="""
       Used for setting a common style for histograms in a HoloMap or AdjointLayout.""")
 
-    def _process(self, view, key=None):
+    accumulate = param.Boolean(default=False, doc="""
+      Whether the counts of each processed element are added to the
+      counts accumulated from previously processed elements, e.g. when
+      applied to a DynamicMap fed by a Pipe stream which emits only
+      newly appended chunks. The counts are accumulated separately
+      for each layer of each object the operation is dynamically
+      applied to. Requires a fixed bin_range, since the counts can
+      only be added up if the bin edges do not change between
+      updates.""")
+
+    _accumulated = None
+
+    @classmethod
+    def _bin_indices(cls, data, edges):
+        """
+        Returns the bin index of each value and a mask of the values
+        within the range of the edges. Uniform edges are binned
+        directly, other edges are binned using a binary search.
+        """
+        nbins = len(edges)-1
+        lower, upper = edges[0], edges[-1]
+        mask = (data >= lower) & (data <= upper)
+        data = data[mask]
+        widths = np.diff(edges)
+        if nbins and np.allclose(widths, widths[0]):
+            norm = nbins / float(upper - lower)
+            indices = ((data - lower) * norm).astype(np.intp)
+            # Correct for floating point error at the bin boundaries
+            indices[indices == nbins] -= 1
+            decrement = data < edges[indices]
+            indices[decrement] -= 1
+            increment = (data >= edges[indices + 1]) & (indices != nbins - 1)
+            indices[increment] += 1
+        else:
+            indices = np.searchsorted(edges, data, side='right') - 1
+            indices[indices == nbins] -= 1
+        return indices, mask
+
+    @classmethod
+    def _bin_counts(cls, data, edges, weights=None):
+        """
+        Computes the counts and, if weights are supplied, the sum of
+        weights in each bin in a single pass over the data.
+        """
+        nbins = len(edges)-1
+        indices, mask = cls._bin_indices(data, edges)
+        counts = np.bincount(indices, minlength=nbins).astype(float)
+        if weights is None:
+            return counts, None
+        sums = np.bincount(indices, weights=weights[mask], minlength=nbins)
+        return counts, sums
+
+    def _process(self, view, key=None, layer=0):
         if self.p.groupby:
             if not isinstance(view, Dataset):
                 raise ValueError('Cannot use histogram groupby on non-Dataset Element')
             grouped = view.groupby(self.p.groupby, group_type=Dataset, container_type=NdOverlay)
             self.p.groupby = None
-            return grouped.map(self._process, Dataset)
+            layers = count()
+            return grouped.map(lambda el: self._process(el, layer=next(layers)), Dataset)
+
+        if self.p.accumulate and not self.p.bin_range:
+            raise ValueError('%s requires a bin_range to accumulate the counts.'
+                             % type(self).__name__)
 
         if self.p.dimension:
             selected_dim = self.p.dimension
@@ -543,7 +628,10 @@ class histogram(Operation):
         else:
             weights = None
 
-        data = data[np.isfinite(data)]
+        finite = np.isfinite(data)
+        data = data[finite]
+        if weights is not None:
+            weights = weights[finite]
         hist_range = self.p.bin_range or view.range(selected_dim)
         # Avoids range issues including zero bin range and empty bins
         if hist_range == (0, 0) or any(not np.isfinite(r) for r in hist_range):
@@ -556,22 +644,27 @@ class histogram(Operation):
             edges = np.linspace(hist_range[0], hist_range[1], self.p.num_bins + 1)
         normed = False if self.p.mean_weighted and self.p.weight_dimension else self.p.normed
 
-        if len(data):
-            if normed:
-                # This covers True, 'height', 'integral'
-                hist, edges = np.histogram(data, density=True, range=hist_range,
-                                           weights=weights, bins=edges)
-                if normed=='height':
-                    hist /= hist.max()
-            else:
-                hist, edges = np.histogram(data, normed=normed, range=hist_range,
-                                           weights=weights, bins=edges)
-                if self.p.weight_dimension and self.p.mean_weighted:
-                    hist_mean, _ = np.histogram(data, density=False, range=hist_range,
-                                                bins=self.p.num_bins)
-                    hist /= hist_mean
-        else:
-            hist = np.zeros(self.p.num_bins)
+        counts, sums = self._bin_counts(data, edges, weights)
+        if self.p.accumulate:
+            if self._accumulated is None:
+                self._accumulated = {}
+            state = (selected_dim, self.p.weight_dimension, tuple(edges))
+            accumulated = self._accumulated.get((self._source, layer))
+            if accumulated is not None and accumulated[0] == state:
+                counts = counts + accumulated[1]
+                if sums is not None:
+                    sums = sums + accumulated[2]
+            self._accumulated[(self._source, layer)] = (state, counts, sums)
+
+        hist = counts if sums is None else sums
+        if self.p.weight_dimension and self.p.mean_weighted:
+            with np.errstate(divide='ignore', invalid='ignore'):
+                hist = hist / counts
+        elif normed and hist.sum():
+            # This covers True, 'height', 'integral'
+            hist = hist / (hist.sum() * np.diff(edges))
+            if normed == 'height':
+                hist /= hist.max()
         hist[np.isnan(hist)] = 0
 
         params = {}
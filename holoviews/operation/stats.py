@@ -1,3 +1,5 @@
+from itertools import count
+
 import param
 import numpy as np
 
@@ -20,6 +22,131 @@ def _kde_support(bin_range, bw, gridsize, cut, clip):
     return np.linspace(kmin, kmax, gridsize)
 
 
+def _bw_factor(method, n, d):
+    """
+    Returns the Scott or Silverman bandwidth factor for n samples
+    in d dimensions, matching scipy.stats.gaussian_kde.
+    """
+    if method == 'silverman':
+        return (n * (d + 2) / 4.)**(-1. / (d + 4))
+    return n**(-1. / (d + 4))
+
+
+def _moments(data):
+    """
+    Returns the number of samples along with the sum and the sum of
+    outer products of the (d, n) shaped data, which may be
+    accumulated across chunks of data to compute the covariance.
+    """
+    return data.shape[1], data.sum(axis=1), data.dot(data.T)
+
+
+def _covariance(n, s1, s2):
+    "Computes the sample covariance from the accumulated moments."
+    mean = s1 / float(n)
+    return (s2 - n * np.outer(mean, mean)) / (n - 1.)
+
+
+def _linear_binning(data, grid):
+    """
+    Linearly bins the (d, n) shaped data onto the supplied uniform
+    grid, distributing the weight of each sample across the
+    neighboring grid points. Samples outside the grid are dropped.
+    """
+    shape = tuple(len(g) for g in grid)
+    lower, frac = [], []
+    for values, g in zip(data, grid):
+        step = (g[-1] - g[0]) / (len(g) - 1.) if len(g) > 1 else 1
+        pos = (values - g[0]) / step
+        idx = np.floor(pos).astype(np.intp)
+        idx = np.clip(idx, 0, max(len(g) - 2, 0))
+        lower.append(idx)
+        frac.append(pos - idx)
+    inside = np.ones(data.shape[1], dtype=bool)
+    for f, g in zip(frac, grid):
+        inside &= (f >= 0) & (f <= (1 if len(g) > 1 else 0))
+    lower = [idx[inside] for idx in lower]
+    frac = [f[inside] for f in frac]
+
+    counts = np.zeros(int(np.prod(shape)))
+    for corner in np.ndindex(*((2,) * len(grid))):
+        weights = np.ones(len(lower[0]))
+        index = []
+        for offset, idx, f in zip(corner, lower, frac):
+            weights = weights * (f if offset else 1 - f)
+            index.append(np.minimum(idx + offset, shape[len(index)] - 1))
+        flat = np.ravel_multi_index(index, shape)
+        counts += np.bincount(flat, weights=weights, minlength=len(counts))
+    return counts.reshape(shape)
+
+
+def _grid_steps(grid):
+    return [(g[-1] - g[0]) / (len(g) - 1.) if len(g) > 1 else 1 for g in grid]
+
+
+def _undersampled(grid, cov):
+    """
+    Whether the kernel is narrower than the grid step along any axis,
+    in which case the binned KDE cannot resolve the kernel.
+    """
+    std = np.sqrt(np.diag(cov))
+    return any(s < step for s, step in zip(std, _grid_steps(grid)))
+
+
+def _binned_kde(counts, grid, cov, n):
+    """
+    Evaluates a Gaussian KDE with the supplied kernel covariance on
+    the grid by convolving the binned counts with the kernel using
+    an FFT, scaling with the grid size rather than the sample count.
+    """
+    steps = _grid_steps(grid)
+    std = np.sqrt(np.diag(cov))
+    extents = [int(min(len(g) - 1, np.ceil(4 * s / step)))
+               for g, s, step in zip(grid, std, steps)]
+    offsets = [np.arange(-e, e + 1) * step for e, step in zip(extents, steps)]
+    mesh = np.meshgrid(*offsets, indexing='ij')
+    points = np.vstack([m.ravel() for m in mesh])
+    energy = np.sum(points * np.linalg.inv(cov).dot(points), axis=0) / 2.
+    norm = np.sqrt((2 * np.pi)**len(grid) * np.linalg.det(cov))
+    kernel = (np.exp(-energy) / norm).reshape(mesh[0].shape)
+    if all(np.ceil(4 * s / step) <= len(g) - 1 for g, s, step in zip(grid, std, steps)):
+        # Normalize the discretized kernel, which is otherwise poorly
+        # sampled if the bandwidth approaches the grid step
+        kernel = kernel / (kernel.sum() * np.prod(steps))
+
+    shape = [c + k - 1 for c, k in zip(counts.shape, kernel.shape)]
+    axes = list(range(len(shape)))
+    conv = np.fft.irfftn(np.fft.rfftn(counts, shape, axes) *
+                         np.fft.rfftn(kernel, shape, axes), shape, axes)
+    crop = tuple(slice(e, e + c) for e, c in zip(extents, counts.shape))
+    return np.clip(conv[crop], 0, None) / float(n)
+
+
+def _kde_counts(op, element, data, grid, key, layer=0):
+    """
+    Returns the moments and binned counts of the data for a KDE
+    operation. The counts are reused if the same element is binned
+    onto the same grid again, e.g. when only the bandwidth changes,
+    and are added to the previously binned counts if accumulating.
+    The state is kept per layer of the object the operation is
+    dynamically applied to.
+    """
+    if op._kde_state is None:
+        op._kde_state = {}
+    grid_key = (key,) + tuple((g[0], g[-1], len(g)) for g in grid)
+    state = op._kde_state.get((op._source, layer))
+    if (not op.p.accumulate and state is not None and state[0] is element
+        and state[1] == grid_key):
+        return state[2], state[3]
+    moments = _moments(data)
+    counts = _linear_binning(data, grid)
+    if op.p.accumulate and state is not None and state[1] == grid_key:
+        moments = tuple(m1 + m2 for m1, m2 in zip(moments, state[2]))
+        counts = counts + state[3]
+    op._kde_state[(op._source, layer)] = (element, grid_key, moments, counts)
+    return moments, counts
+
+
 class univariate_kde(Operation):
     """
     Computes a 1D kernel density estimate (KDE) along the supplied
@@ -56,18 +183,40 @@ class univariate_kde(Operation):
     groupby = param.ClassSelector(default=None, class_=(basestring, Dimension), doc="""
       Defines a dimension to group the Histogram returning an NdOverlay of Histograms.""")
 
-    def _process(self, element, key=None):
+    method = param.ObjectSelector(default='auto', objects=['auto', 'exact', 'binned'], doc="""
+        Whether the KDE is evaluated exactly at each sample point using
+        scipy, which scales with the number of data samples, or by
+        linearly binning the data onto the sample grid and convolving
+        it with the kernel using an FFT, which scales with the number
+        of grid samples. The 'auto' method bins the data if there are
+        more than binned_threshold samples. Unless accumulating, the
+        exact KDE is computed if the bandwidth is smaller than the
+        grid step since the binned KDE cannot resolve the kernel.""")
+
+    binned_threshold = param.Integer(default=10000, doc="""
+        Number of data samples above which the 'auto' method computes
+        the binned KDE.""")
+
+    accumulate = param.Boolean(default=False, doc="""
+        Whether the binned counts of each processed element are added
+        to the counts of previously processed elements, e.g. when
+        applied to a DynamicMap fed by a Pipe stream which emits only
+        newly appended chunks. The counts are accumulated separately
+        for each layer of each object the operation is dynamically
+        applied to. Requires a fixed bin_range, since the counts can
+        only be added up if the sample grid does not change between
+        updates.""")
+
+    _kde_state = None
+
+    def _process(self, element, key=None, layer=0):
         if self.p.groupby:
             if not isinstance(element, Dataset):
                 raise ValueError('Cannot use histogram groupby on non-Dataset Element')
             grouped = element.groupby(self.p.groupby, group_type=Dataset, container_type=NdOverlay)
             self.p.groupby = None
-            return grouped.map(self._process, Dataset)
-
-        try:
-            from scipy import stats
-        except ImportError:
-            raise ImportError('%s operation requires SciPy to be installed.' % type(self).__name__)
+            layers = count()
+            return grouped.map(lambda el: self._process(el, layer=next(layers)), Dataset)
 
         params = {}
         if isinstance(element, Distribution):
@@ -100,17 +249,42 @@ class univariate_kde(Operation):
         elif bin_range[0] == bin_range[1]:
             bin_range = (bin_range[0]-0.5, bin_range[1]+0.5)
 
-        data = data[np.isfinite(data)] if len(data) else []
-        if len(data) > 1:
-            kde = stats.gaussian_kde(data)
-            if self.p.bandwidth:
-                kde.set_bandwidth(self.p.bandwidth)
-            bw = kde.scotts_factor() * data.std(ddof=1)
+        data = data[np.isfinite(data)] if len(data) else np.array([])
+        binned = (self.p.method == 'binned' or self.p.accumulate or
+                  (self.p.method == 'auto' and len(data) > self.p.binned_threshold))
+        if self.p.accumulate and not self.p.bin_range:
+            raise ValueError('%s requires a bin_range to accumulate the KDE.'
+                             % type(self).__name__)
+        elif self.p.accumulate:
+            xs = np.linspace(bin_range[0], bin_range[1], self.p.n_samples)
+            moments, counts = _kde_counts(self, element, data[np.newaxis].astype(float),
+                                          [xs], selected_dim.name, layer)
+        else:
+            moments = _moments(data[np.newaxis].astype(float))
+
+        n = moments[0]
+        if n > 1:
+            cov = _covariance(*moments)
+            factor = self.p.bandwidth or _bw_factor(self.p.bw_method, n, 1)
+            bw = factor * np.sqrt(cov[0, 0])
             if self.p.bin_range:
                 xs = np.linspace(bin_range[0], bin_range[1], self.p.n_samples)
             else:
                 xs = _kde_support(bin_range, bw, self.p.n_samples, self.p.cut, selected_dim.range)
-            ys = kde.evaluate(xs)
+            if binned and not self.p.accumulate and _undersampled([xs], cov * factor**2):
+                binned = False
+            if binned:
+                if not self.p.accumulate:
+                    _, counts = _kde_counts(self, element, data[np.newaxis].astype(float),
+                                            [xs], selected_dim.name, layer)
+                ys = _binned_kde(counts, [xs], cov * factor**2, n)
+            else:
+                try:
+                    from scipy import stats
+                except ImportError:
+                    raise ImportError('%s operation requires SciPy to be installed '
+                                      'to compute the exact KDE.' % type(self).__name__)
+                ys = stats.gaussian_kde(data, bw_method=factor).evaluate(xs)
         else:
             xs = np.linspace(bin_range[0], bin_range[1], self.p.n_samples)
             ys = np.full_like(xs, 0)
@@ -161,12 +335,33 @@ class bivariate_kde(Operation):
        The x_range as a tuple of min and max y-value. Auto-ranges
        if set to None.""")
 
-    def _process(self, element, key=None):
-        try:
-            from scipy import stats
-        except ImportError:
-            raise ImportError('%s operation requires SciPy to be installed.' % type(self).__name__)
+    method = param.ObjectSelector(default='auto', objects=['auto', 'exact', 'binned'], doc="""
+        Whether the KDE is evaluated exactly at each grid point using
+        scipy, which scales with the number of data samples, or by
+        linearly binning the data onto the grid and convolving it with
+        the kernel using an FFT, which scales with the grid size. The
+        'auto' method bins the data if there are more than
+        binned_threshold samples. Unless accumulating, the exact KDE
+        is computed if the bandwidth is smaller than the grid step
+        since the binned KDE cannot resolve the kernel.""")
+
+    binned_threshold = param.Integer(default=10000, doc="""
+        Number of data samples above which the 'auto' method computes
+        the binned KDE.""")
+
+    accumulate = param.Boolean(default=False, doc="""
+        Whether the binned counts of each processed element are added
+        to the counts of previously processed elements, e.g. when
+        applied to a DynamicMap fed by a Pipe stream which emits only
+        newly appended chunks. The counts are accumulated separately
+        for each object the operation is dynamically applied to.
+        Requires a fixed x_range and y_range, since the counts can
+        only be added up if the sample grid does not change between
+        updates.""")
+
+    _kde_state = None
 
+    def _process(self, element, key=None):
         if len(element.dimensions()) < 2:
             raise ValueError("bivariate_kde can only be computed on elements "
                              "declaring at least two dimensions.")
@@ -193,11 +388,27 @@ class bivariate_kde(Operation):
             ymin, ymax = ymin-0.5, ymax+0.5
 
         data = data[:, np.isfinite(data).min(axis=0)] if data.shape[1] > 1 else np.empty((2, 0))
-        if data.shape[1] > 1:
-            kde = stats.gaussian_kde(data)
-            if self.p.bandwidth:
-                kde.set_bandwidth(self.p.bandwidth)
-            bw = kde.scotts_factor() * data.std(ddof=1)
+        data = data.astype(float)
+        binned = (self.p.method == 'binned' or self.p.accumulate or
+                  (self.p.method == 'auto' and data.shape[1] > self.p.binned_threshold))
+        if self.p.accumulate and not (self.p.x_range and self.p.y_range):
+            raise ValueError('%s requires an x_range and y_range to accumulate '
+                             'the KDE.' % type(self).__name__)
+        elif self.p.accumulate:
+            xs = np.linspace(xmin, xmax, self.p.n_samples)
+            ys = np.linspace(ymin, ymax, self.p.n_samples)
+            moments, counts = _kde_counts(self, element, data, [xs, ys],
+                                          (xdim.name, ydim.name))
+        else:
+            moments = _moments(data)
+
+        n = moments[0]
+        if n > 1:
+            cov = _covariance(*moments)
+            factor = self.p.bandwidth or _bw_factor(self.p.bw_method, n, 2)
+            # Standard deviation across both dimensions
+            mean = moments[1].sum() / (2. * n)
+            bw = factor * np.sqrt((np.trace(moments[2]) - 2 * n * mean**2) / (2 * n - 1.))
             if self.p.x_range:
                 xs = np.linspace(xmin, xmax, self.p.n_samples)
             else:
@@ -206,9 +417,23 @@ class bivariate_kde(Operation):
                 ys = np.linspace(ymin, ymax, self.p.n_samples)
             else:
                 ys = _kde_support((ymin, ymax), bw, self.p.n_samples, self.p.cut, ydim.range)
-            xx, yy = cartesian_product([xs, ys], False)
-            positions = np.vstack([xx.ravel(), yy.ravel()])
-            f = np.reshape(kde(positions).T, xx.shape)
+            if binned and not self.p.accumulate and _undersampled([xs, ys], cov * factor**2):
+                binned = False
+            if binned:
+                if not self.p.accumulate:
+                    _, counts = _kde_counts(self, element, data, [xs, ys],
+                                            (xdim.name, ydim.name))
+                f = _binned_kde(counts, [xs, ys], cov * factor**2, n)
+            else:
+                try:
+                    from scipy import stats
+                except ImportError:
+                    raise ImportError('%s operation requires SciPy to be installed '
+                                      'to compute the exact KDE.' % type(self).__name__)
+                kde = stats.gaussian_kde(data, bw_method=factor)
+                xx, yy = cartesian_product([xs, ys], False)
+                positions = np.vstack([xx.ravel(), yy.ravel()])
+                f = np.reshape(kde(positions).T, xx.shape)
         elif self.p.contours:
             eltype = Polygons if self.p.filled else Contours
             return eltype([], kdims=[xdim, ydim], vdims=[vdim])
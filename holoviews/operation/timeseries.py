@@ -1,3 +1,5 @@
+from itertools import count
+
 import param
 import numpy as np
 import pandas as pd
@@ -7,6 +9,87 @@ from ..core.data import PandasInterface
 from ..element import Scatter
 
 
+class StreamingBase(param.Parameterized):
+    """
+    Parameters and methods shared between operations which may keep
+    state across calls to process only newly streamed rows, e.g. when
+    applied to a DynamicMap fed by a Buffer stream.
+    """
+
+    streaming = param.Boolean(default=False, doc="""
+        Whether to keep state across calls so that when the rows of
+        the element continue the rows processed on the previous call
+        (as when applied to a DynamicMap fed by a Buffer stream) only
+        the newly appended rows are processed. Only finalized rows,
+        i.e. rows which do not change when further data is appended,
+        are output.""")
+
+    _stream_states = None
+
+    def streamed_rows(self, element):
+        """
+        Returns the number of newly finalized rows appended to the
+        supplied output element when it was computed in streaming
+        mode, or None if it was not produced by this operation.
+        """
+        for state in (self._stream_states or {}).values():
+            if state['element'] is element:
+                return state['rows']
+        return None
+
+    def _stream_map(self, element, fn):
+        """
+        Applies the layer processing function to each Element in the
+        supplied object, passing the position of the layer so the
+        streaming state of each layer is kept separately.
+        """
+        layers = count()
+        return element.map(lambda el: fn(el, layer=next(layers)), Element)
+
+    def _stream_layer(self, element, df, compute, context, layer=0):
+        """
+        Processes the DataFrame of an element, indexed by its first
+        key dimension, using the supplied compute function which
+        given a DataFrame and the position of the first unfinalized
+        row returns the newly finalized output rows and the number of
+        trailing input rows which are not yet finalized. Keeps the
+        last context input rows to compute subsequent chunks. The
+        state is kept per layer of the object the operation is
+        dynamically applied to.
+        """
+        if self._stream_states is None:
+            self._stream_states = {}
+        key = (self._source, layer)
+        state = self._stream_states.get(key)
+        xs = df.index.values
+        new_rows = None
+        if state is not None and len(xs) and df.index.is_monotonic_increasing:
+            pos = np.searchsorted(xs, state['last'], side='right')
+            if pos and xs[pos-1] == state['last']:
+                new_rows = len(xs) - pos
+
+        if new_rows is None:
+            finalized, pending = compute(df, 0)
+            output = finalized
+        elif new_rows == 0:
+            state['rows'] = 0
+            return state['element']
+        else:
+            raw = state['raw']
+            df = pd.concat([raw, df.iloc[-new_rows:]])
+            finalized, pending = compute(df, len(raw)-state['pending'])
+            output = pd.concat([state['output'], finalized])
+        output = output[output.index >= xs[0]] if len(xs) else output
+
+        processed = element.clone(output.reset_index())
+        self._stream_states[key] = {
+            'raw': df.iloc[max(len(df)-max(context, pending), 0):],
+            'pending': pending, 'output': output, 'element': processed,
+            'rows': len(finalized),
+            'last': df.index.values[-1] if len(df) else None}
+        return processed
+
+
 class RollingBase(param.Parameterized):
     """
     Parameters shared between `rolling` and `rolling_outlier_std`.
@@ -29,7 +112,7 @@ class RollingBase(param.Parameterized):
                 'min_periods': self.p.min_periods}
 
 
-class rolling(Operation,RollingBase):
+class rolling(Operation, RollingBase, StreamingBase):
     """
     Applies a function over a rolling window.
     """
@@ -43,28 +126,38 @@ class rolling(Operation,RollingBase):
     function = param.Callable(default=np.mean, doc="""
         The function to apply over the rolling window.""")
 
-    def _process_layer(self, element, key=None):
-        xdim = element.kdims[0].name
-        df = PandasInterface.as_dframe(element)
-        df = df.set_index(xdim).rolling(win_type=self.p.window_type,
-                                        **self._roll_kwargs())
+    def _roll(self, df):
+        df = df.rolling(win_type=self.p.window_type, **self._roll_kwargs())
         if self.p.window_type is None:
-            rolled = df.apply(self.p.function)
+            return df.apply(self.p.function)
         else:
             if self.p.function is np.mean:
-                rolled = df.mean()
+                return df.mean()
             elif self.p.function is np.sum:
-                rolled = df.sum()
+                return df.sum()
             else:
                 raise ValueError("Rolling window function only supports "
                                  "mean and sum when custom window_type is supplied")
-        return element.clone(rolled.reset_index())
+
+    def _process_layer(self, element, key=None, layer=0):
+        xdim = element.kdims[0].name
+        df = PandasInterface.as_dframe(element).set_index(xdim)
+        if not self.p.streaming:
+            return element.clone(self._roll(df).reset_index())
+
+        window = self.p.rolling_window
+        pending = (window-1)//2 if self.p.center else 0
+        def compute(df, start):
+            rolled = self._roll(df)
+            end = max(len(rolled)-pending, 0)
+            return rolled.iloc[start:end], len(rolled)-end
+        return self._stream_layer(element, df, compute, 2*window, layer)
 
     def _process(self, element, key=None):
-        return element.map(self._process_layer, Element)
+        return self._stream_map(element, self._process_layer)
 
 
-class resample(Operation):
+class resample(Operation, StreamingBase):
     """
     Resamples a timeseries of dates with a frequency and function.
     """
@@ -81,19 +174,30 @@ class resample(Operation):
     rule = param.String(default='D', doc="""
         A string representing the time interval over which to apply the resampling""")
 
-    def _process_layer(self, element, key=None):
+    def _process_layer(self, element, key=None, layer=0):
         df = PandasInterface.as_dframe(element)
         xdim = element.kdims[0].name
         resample_kwargs = {'rule': self.p.rule, 'label': self.p.label,
                            'closed': self.p.closed}
-        df = df.set_index(xdim).resample(**resample_kwargs)
-        return element.clone(df.apply(self.p.function).reset_index())
+        if not self.p.streaming:
+            df = df.set_index(xdim).resample(**resample_kwargs)
+            return element.clone(df.apply(self.p.function).reset_index())
+
+        def compute(df, start):
+            # All but the last bin are finalized
+            resampled = df.resample(**resample_kwargs)
+            indices = resampled.indices
+            if not indices:
+                return df.iloc[:0], 0
+            last = max(indices)
+            return resampled.apply(self.p.function).iloc[:-1], len(indices[last])
+        return self._stream_layer(element, df.set_index(xdim), compute, 0, layer)
 
     def _process(self, element, key=None):
-        return element.map(self._process_layer, Element)
+        return self._stream_map(element, self._process_layer)
 
 
-class rolling_outlier_std(Operation, RollingBase):
+class rolling_outlier_std(Operation, RollingBase, StreamingBase):
     """
     Detect outliers using the standard deviation within a rolling window.
 
@@ -108,9 +212,7 @@ class rolling_outlier_std(Operation, RollingBase):
     sigma = param.Number(default=2.0, doc="""
         Minimum sigma before a value is considered an outlier.""")
 
-    def _process_layer(self, element, key=None):
-        ys = element.dimension_values(1)
-
+    def _outliers(self, ys):
         # Calculate the variation in the distribution of the residual
         avg = pd.Series(ys).rolling(**self._roll_kwargs()).mean()
         residual = ys - avg
@@ -118,8 +220,23 @@ class rolling_outlier_std(Operation, RollingBase):
 
         # Get indices of outliers
         with np.errstate(invalid='ignore'):
-            outliers = (np.abs(residual) > std * self.p.sigma).values
-        return element[outliers].clone(new_type=Scatter)
+            return (np.abs(residual) > std * self.p.sigma).values
+
+    def _process_layer(self, element, key=None, layer=0):
+        if not self.p.streaming:
+            outliers = self._outliers(element.dimension_values(1))
+            return element[outliers].clone(new_type=Scatter)
+
+        xdim, ydim = element.dimensions()[:2]
+        df = PandasInterface.as_dframe(element).set_index(xdim.name)
+        window = self.p.rolling_window
+        pending = 2*((window-1)//2) if self.p.center else 0
+        def compute(df, start):
+            outliers = self._outliers(df[ydim.name].values)
+            end = max(len(df)-pending, 0)
+            return df.iloc[start:end][outliers[start:end]], len(df)-end
+        return self._stream_layer(element.clone(new_type=Scatter), df, compute,
+                                  3*window, layer)
 
     def _process(self, element, key=None):
-        return element.map(self._process_layer, Element)
+        return self._stream_map(element, self._process_layer)
@@ -1451,46 +1451,47 @@ class OverlayPlot(GenericOverlayPlot, LegendPlot):
             self.current_key = key
         items = element.items() if element else []
 
-        if isinstance(self.hmap, DynamicMap):
-            range_obj = element
-        else:
-            range_obj = self.hmap
+        with self.shared_options():
+            if isinstance(self.hmap, DynamicMap):
+                range_obj = element
+            else:
+                range_obj = self.hmap
 
-        if element is not None:
-            ranges = self.compute_ranges(range_obj, key, ranges)
+            if element is not None:
+                ranges = self.compute_ranges(range_obj, key, ranges)
 
-        if element and not self.overlaid and not self.tabs and not self.batched:
-            self._update_ranges(element, ranges)
+            if element and not self.overlaid and not self.tabs and not self.batched:
+                self._update_ranges(element, ranges)
 
-        # Determine which stream (if any) triggered the update
-        triggering = [stream for stream in self.streams if stream._triggering]
+            # Determine which stream (if any) triggered the update
+            triggering = [stream for stream in self.streams if stream._triggering]
 
-        for k, subplot in self.subplots.items():
-            el = None
+            for k, subplot in self.subplots.items():
+                el = None
 
-            # Skip updates to subplots when its streams is not one of
-            # the streams that initiated the update
-            if triggering and all(s not in triggering for s in subplot.streams):
-                continue
+                # Skip updates to subplots when its streams is not one of
+                # the streams that initiated the update
+                if triggering and all(s not in triggering for s in subplot.streams):
+                    continue
 
-            # If in Dynamic mode propagate elements to subplots
-            if isinstance(self.hmap, DynamicMap) and element:
-                # In batched mode NdOverlay is passed to subplot directly
-                if self.batched:
-                    el = element
-                # If not batched get the Element matching the subplot
-                elif element is not None:
-                    idx = dynamic_update(self, subplot, k, element, items)
-                    if idx is not None:
-                        _, el = items.pop(idx)
-            subplot.update_frame(key, ranges, element=el)
-
-        if not self.batched and isinstance(self.hmap, DynamicMap) and items:
-            self.warning("Some Elements returned by the dynamic callback "
-                         "were not initialized correctly and could not be "
-                         "rendered.")
-
-        if element and not self.overlaid and not self.tabs and not self.batched:
-            self._update_plot(key, self.handles['plot'], element)
+                # If in Dynamic mode propagate elements to subplots
+                if isinstance(self.hmap, DynamicMap) and element:
+                    # In batched mode NdOverlay is passed to subplot directly
+                    if self.batched:
+                        el = element
+                    # If not batched get the Element matching the subplot
+                    elif element is not None:
+                        idx = dynamic_update(self, subplot, k, element, items)
+                        if idx is not None:
+                            _, el = items.pop(idx)
+                subplot.update_frame(key, ranges, element=el)
+
+            if not self.batched and isinstance(self.hmap, DynamicMap) and items:
+                self.warning("Some Elements returned by the dynamic callback "
+                             "were not initialized correctly and could not be "
+                             "rendered.")
+
+            if element and not self.overlaid and not self.tabs and not self.batched:
+                self._update_plot(key, self.handles['plot'], element)
 
         self._execute_hooks(element)
@@ -32,6 +32,9 @@ class GraphPlot(CompositeElementPlot, ColorbarPlot, LegendPlot):
     tools = param.List(default=['hover', 'tap'], doc="""
         A list of plugin tools to use on the plot.""")
 
+    # Cache of node ids, index and layout reused across frames
+    _node_cache = None
+
     # Map each glyph to a style group
     _style_groups = {'scatter': 'node', 'multi_line': 'edge', 'patches': 'edge', 'bezier': 'edge'}
 
@@ -141,6 +144,68 @@ class GraphPlot(CompositeElementPlot, ColorbarPlot, LegendPlot):
         return path_data, mapping
 
 
+    def _get_node_layout(self, element):
+        """
+        Computes the node ids, the integer node index and the static
+        layout for the supplied element. The result is cached and
+        reused across frames as long as the node ids, positions and
+        axis orientation are unchanged.
+        """
+        nodes = element.nodes.dimension_values(2)
+        positions = element.nodes.array([0, 1])
+        cache = self._node_cache
+        if (cache is not None and cache['invert_axes'] == self.invert_axes and
+            (cache['element'] is element.nodes or
+             (np.array_equal(cache['nodes'], nodes) and
+              np.array_equal(cache['positions'], positions)))):
+            cache['element'] = element.nodes
+            return cache['nodes'], cache['index'], cache['layout']
+
+        # Map node ids to integers
+        lookup = None
+        if nodes.dtype.kind in 'if':
+            index = nodes.astype(np.int32)
+        else:
+            try:
+                # Stable sort so duplicate ids resolve to the last occurrence
+                sorter = np.argsort(nodes, kind='mergesort')
+                sorted_nodes = nodes[sorter]
+                last = np.append(sorted_nodes[1:] != sorted_nodes[:-1], True)
+                lookup = (sorted_nodes[last], sorter[last].astype(np.int32))
+            except TypeError:
+                lookup = {v: i for i, v in enumerate(nodes)}
+            index = self._map_node_ids(nodes, -1, lookup)
+
+        xy = positions[:, ::-1] if self.invert_axes else positions
+        layout = dict(zip([str(i) for i in index.tolist()], map(tuple, xy.tolist())))
+        self._node_cache = dict(element=element.nodes, nodes=nodes, index=index,
+                                positions=positions, layout=layout, lookup=lookup,
+                                invert_axes=self.invert_axes)
+        return nodes, index, layout
+
+
+    def _map_node_ids(self, ids, missing, lookup=None):
+        """
+        Maps an array of non-numeric node ids to the integer node index
+        computed by _get_node_layout, assigning the missing index to
+        ids which do not match any node.
+        """
+        if lookup is None:
+            lookup = self._node_cache['lookup']
+        if isinstance(lookup, dict):
+            return np.array([lookup.get(i, missing) for i in ids], dtype=np.int32)
+        keys, indices = lookup
+        if not len(keys):
+            return np.full(len(ids), missing, dtype=np.int32)
+        try:
+            pos = np.searchsorted(keys, ids).clip(0, len(keys)-1)
+            valid = keys[pos] == ids
+        except TypeError:
+            lookup = dict(zip(keys.tolist(), indices.tolist()))
+            return np.array([lookup.get(i, missing) for i in ids], dtype=np.int32)
+        return np.where(valid, indices[pos], missing).astype(np.int32)
+
+
     def get_data(self, element, ranges, style):
         # Force static source to False
         static = self.static_source
@@ -148,18 +213,7 @@ class GraphPlot(CompositeElementPlot, ColorbarPlot, LegendPlot):
         self.static_source = False
 
         # Get node data
-        nodes = element.nodes.dimension_values(2)
-        node_positions = element.nodes.array([0, 1])
-        # Map node indices to integers
-        if nodes.dtype.kind not in 'if':
-            node_indices = {v: i for i, v in enumerate(nodes)}
-            index = np.array([node_indices[n] for n in nodes], dtype=np.int32)
-            layout = {str(node_indices[k]): (y, x) if self.invert_axes else (x, y)
-                      for k, (x, y) in zip(nodes, node_positions)}
-        else:
-            index = nodes.astype(np.int32)
-            layout = {str(k): (y, x) if self.invert_axes else (x, y)
-                      for k, (x, y) in zip(index, node_positions)}
+        nodes, index, layout = self._get_node_layout(element)
         point_data = {'index': index}
         cycle = self.lookup_options(element, 'style').kwargs.get('node_color')
         if isinstance(cycle, Cycle):
@@ -184,8 +238,7 @@ class GraphPlot(CompositeElementPlot, ColorbarPlot, LegendPlot):
         if nodes.dtype.kind == 'f':
             start, end = start.astype(np.int32), end.astype(np.int32)
         elif nodes.dtype.kind != 'i':
-            start = np.array([node_indices.get(x, nan_node) for x in start], dtype=np.int32)
-            end = np.array([node_indices.get(y, nan_node) for y in end], dtype=np.int32)
+            start, end = (self._map_node_ids(ids, nan_node) for ids in (start, end))
         path_data = dict(start=start, end=end)
         self._get_edge_colors(element, ranges, path_data, edge_mapping, style)
         if not static:
@@ -217,8 +270,10 @@ class GraphPlot(CompositeElementPlot, ColorbarPlot, LegendPlot):
                 source.trigger('data')
             else:
                 source.data.update(data)
-        else:
+        elif data is not self._node_cache.get('sent'):
+            # Only send the layout if it was recomputed
             source.graph_layout = data
+            self._node_cache['sent'] = data
 
 
     def _init_glyphs(self, plot, element, ranges, source):
@@ -248,6 +303,7 @@ class GraphPlot(CompositeElementPlot, ColorbarPlot, LegendPlot):
                                               data, mapping, style)
 
         # Define static layout
+        self._node_cache['sent'] = layout
         layout = StaticLayoutProvider(graph_layout=layout)
         node_source = self.handles['scatter_1_source']
         edge_source = self.handles[self.edge_glyph+'_source']
@@ -10,6 +10,7 @@ from bokeh.models.widgets import Panel, Tabs
 from ...core import (OrderedDict, Store, GridMatrix, AdjointLayout,
                      NdLayout, Empty, GridSpace, HoloMap, Element,
                      DynamicMap)
+from ...core.spaces import get_nested_dmaps
 from ...core.util import basestring, wrap_tuple, unique_iterator
 from ...element import Histogram
 from ...streams import Stream
@@ -170,16 +171,37 @@ class BokehPlot(DimensionedPlot):
         return ColumnDataSource(data=data)
 
 
+    def _streamed_rows(self, frame):
+        """
+        Returns the number of rows a streaming operation applied to
+        the sources of this plot appended to the frame, if any.
+        """
+        sources = self.stream_sources.get(getattr(self, 'zorder', 0), [])
+        for dmap in unique_iterator(d for s in sources for d in get_nested_dmaps(s)):
+            operation = getattr(dmap.callback, 'operation', None)
+            if hasattr(operation, 'streamed_rows'):
+                rows = operation.streamed_rows(frame)
+                if rows is not None:
+                    return rows
+        return None
+
+
     def _update_datasource(self, source, data):
         """
         Update datasource with data for a new frame.
         """
-        if (self.streaming and self.streaming[0].data is self.current_frame.data
+        frame = self.current_frame
+        stream_rows = self._streamed_rows(frame) if self.streaming else None
+        if (self.streaming and self.streaming[0].data is frame.data
             and self._stream_data):
             stream = self.streaming[0]
             if stream._triggering:
                 data = {k: v[-stream._chunk_length:] for k, v in data.items()}
                 source.stream(data, stream.length)
+        elif (self.streaming and self._stream_data and stream_rows is not None
+              and self.streaming[0]._triggering and set(data) == set(source.data)):
+            data = {k: v[len(v)-stream_rows:] for k, v in data.items()}
+            source.stream(data, len(frame))
         else:
             source.data.update(data)
 
@@ -2,8 +2,9 @@ import numpy as np
 import param
 
 from bokeh.models import HoverTool
-from ...core.util import cartesian_product, is_nan, dimension_sanitizer
+from ...core.util import cartesian_product, is_nan, dimension_sanitizer, basestring
 from ...element import Raster
+from ...element.util import categorical_aggregate2d
 from ..renderer import SkipRendering
 from .element import ElementPlot, ColorbarPlot, line_properties, fill_properties
 from .util import mpl_to_bokeh, colormesh
@@ -121,13 +122,23 @@ class HeatMapPlot(ColorbarPlot):
     show_legend = param.Boolean(default=False, doc="""
         Whether to show legend for the plot.""")
 
+    sparse = param.Boolean(default=False, doc="""
+        Whether to render only the non-empty cells of the HeatMap
+        rather than every cell of the dense 2D aggregate.""")
+
     _plot_methods = dict(single='rect')
     style_opts = ['cmap', 'color'] + line_properties + fill_properties
 
     _categorical = True
 
     def _get_factors(self, element):
-        return super(HeatMapPlot, self)._get_factors(element.gridded)
+        if not self.sparse or element.interface.gridded:
+            return super(HeatMapPlot, self)._get_factors(element.gridded)
+        aggregate = categorical_aggregate2d(element, sparse=True)
+        coords = tuple([v if isinstance(v, basestring) else dim.pprint_value(v) for v in dim.values]
+                       for dim in aggregate.kdims)
+        if self.invert_axes: coords = coords[::-1]
+        return coords
 
     def get_data(self, element, ranges, style):
         x, y, z = [dimension_sanitizer(d) for d in element.dimensions(label=True)[:3]]
@@ -136,16 +147,17 @@ class HeatMapPlot(ColorbarPlot):
         if self.static_source:
             return {}, {'x': x, 'y': y, 'fill_color': {'field': 'zvalues', 'transform': cmapper}}, style
 
-        aggregate = element.gridded
+        if self.sparse:
+            aggregate = categorical_aggregate2d(element, sparse=True)
+            zvals = aggregate.dimension_values(2)
+        else:
+            aggregate = element.gridded
+            zvals = aggregate.dimension_values(2, flat=False).T.flatten()
         xdim, ydim = aggregate.dimensions()[:2]
         xvals, yvals = (aggregate.dimension_values(x),
                         aggregate.dimension_values(y))
-        zvals = aggregate.dimension_values(2, flat=False)
         if self.invert_axes:
             xdim, ydim = ydim, xdim
-            zvals = zvals.T.flatten()
-        else:
-            zvals = zvals.T.flatten()
         if xvals.dtype.kind not in 'SU':
             xvals = [xdim.pprint_value(xv) for xv in xvals]
         if yvals.dtype.kind not in 'SU':
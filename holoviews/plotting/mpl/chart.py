@@ -359,7 +359,13 @@ class HistogramPlot(ChartPlot):
 
         ticks = self._compute_ticks(element, edges, widths, lims)
         ax_settings = self._process_axsettings(element, lims, ticks)
-        self._update_artists(key, element, edges, hvals, widths, lims, ranges)
+        if len(self.handles['artist']) == len(edges):
+            self._update_artists(key, element, edges, hvals, widths, lims, ranges)
+        else:
+            # Number of bins changed so the bars have to be replaced
+            self.teardown_handles()
+            bars = self.plotfn(edges, hvals, widths, align='edge', **style)
+            self.handles['artist'] = self._update_plot(key, element, bars, lims, ranges)
         return ax_settings
 
 
@@ -425,7 +431,7 @@ class SideHistogramPlot(AdjoinedPlot, HistogramPlot):
             self.handles['offset_line'] = self.offset_linefn(offset,
                                                              linewidth=1.0,
                                                              color='k')
-        elif offset:
+        elif 'offset_line' in self.handles:
             self._update_separator(offset)
 
         if cmap is not None:
@@ -447,6 +453,17 @@ class SideHistogramPlot(AdjoinedPlot, HistogramPlot):
             bar.set_clip_on(False)
 
 
+    def teardown_handles(self):
+        """
+        Removes the offset line along with the bars so it is redrawn
+        when the bars are replaced.
+        """
+        super(SideHistogramPlot, self).teardown_handles()
+        offset_line = self.handles.pop('offset_line', None)
+        if offset_line is not None:
+            offset_line.remove()
+
+
     def _update_separator(self, offset):
         """
         Compute colorbar offset and update separator line
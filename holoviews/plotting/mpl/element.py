@@ -117,6 +117,16 @@ class ElementPlot(GenericElementPlot, MPLPlot):
     # Whether plot has axes, disables setting axis limits, labels and ticks
     _has_axes = True
 
+    # Plot options which determine the axis labels, ticks and limits
+    _axis_options = ['logx', 'logy', 'logz', 'xaxis', 'yaxis', 'xticks', 'yticks',
+                     'zticks', 'xrotation', 'yrotation', 'zrotation', 'invert_axes',
+                     'invert_xaxis', 'invert_yaxis', 'invert_zaxis', 'show_grid',
+                     'show_legend', 'labelled', 'fontsize', 'apply_ticks',
+                     'apply_extents', 'apply_ranges']
+
+    # Last state of the axes, used to skip redundant axis updates
+    _axis_state = None
+
     def __init__(self, element, **params):
         super(ElementPlot, self).__init__(element, **params)
         check = self.hmap.last
@@ -171,8 +181,13 @@ class ElementPlot(GenericElementPlot, MPLPlot):
 
             # Apply axis options if axes are enabled
             if element and not any(not sp._has_axes for sp in [self] + subplots):
+                extents = self.get_extents(element, ranges)
+                changed = self._axis_state_changed(extents, dimensions, subplots,
+                                                   xticks, yticks, zticks,
+                                                   xlabel, ylabel, zlabel)
+
                 # Set axis labels
-                if dimensions:
+                if dimensions and changed:
                     self._set_labels(axis, dimensions, xlabel, ylabel, zlabel)
 
                 if not subplots:
@@ -183,22 +198,23 @@ class ElementPlot(GenericElementPlot, MPLPlot):
                     axis.xaxis.grid(self.show_grid)
                     axis.yaxis.grid(self.show_grid)
 
-                # Apply log axes
-                if self.logx:
-                    axis.set_xscale('log')
-                if self.logy:
-                    axis.set_yscale('log')
+                # Skip log axes, ticks and limits if the axes are unchanged
+                if changed:
+                    if self.logx:
+                        axis.set_xscale('log')
+                    if self.logy:
+                        axis.set_yscale('log')
 
-                if not self.projection == '3d':
-                    self._set_axis_position(axis, 'x', self.xaxis)
-                    self._set_axis_position(axis, 'y', self.yaxis)
+                    if not self.projection == '3d':
+                        self._set_axis_position(axis, 'x', self.xaxis)
+                        self._set_axis_position(axis, 'y', self.yaxis)
 
-                # Apply ticks
-                if self.apply_ticks:
-                    self._finalize_ticks(axis, dimensions, xticks, yticks, zticks)
+                    # Apply ticks
+                    if self.apply_ticks:
+                        self._finalize_ticks(axis, dimensions, xticks, yticks, zticks)
 
-                # Set axes limits
-                self._set_axis_limits(axis, element, subplots, ranges)
+                    # Set axes limits
+                    self._set_axis_limits(axis, element, subplots, ranges, extents)
 
             # Apply aspects
             if self.aspect is not None and self.projection != 'polar' and not self.adjoined:
@@ -216,6 +232,26 @@ class ElementPlot(GenericElementPlot, MPLPlot):
         return super(ElementPlot, self)._finalize_axis(key)
 
 
+    def _axis_state_changed(self, extents, dimensions, subplots, *axis_kwargs):
+        """
+        Returns whether the dimensions, extents, explicit axis settings
+        or axis related plot options changed since the axes were last
+        finalized, allowing the labels, ticks and limits to be left
+        untouched when animating frames with identical axes.
+        """
+        options = tuple(getattr(p, opt, None) for p in [self] + subplots
+                        for opt in self._axis_options)
+        state = (list(dimensions or []), extents, axis_kwargs, options)
+        previous, self._axis_state = self._axis_state, state
+        # Undefined extents require autoscaling to the new data
+        if previous is None or any(e is None or util.is_nan(e) for e in extents):
+            return True
+        try:
+            return not bool(previous == state)
+        except Exception:
+            return True
+
+
     def _finalize_ticks(self, axis, dimensions, xticks, yticks, zticks):
         """
         Finalizes the ticks on the axes based on the supplied ticks
@@ -312,13 +348,14 @@ class ElementPlot(GenericElementPlot, MPLPlot):
         axes.set_aspect(float(data_ratio))
 
 
-    def _set_axis_limits(self, axis, view, subplots, ranges):
+    def _set_axis_limits(self, axis, view, subplots, ranges, extents=None):
         """
         Compute extents for current view and apply as axis limits
         """
         # Extents
         scalex, scaley = True, True
-        extents = self.get_extents(view, ranges)
+        if extents is None:
+            extents = self.get_extents(view, ranges)
         if extents and not self.overlaid:
             coords = [coord if np.isreal(coord) or isinstance(coord, np.datetime64) else np.NaN for coord in extents]
             coords = [date2num(util.dt64_to_dt(c)) if isinstance(c, np.datetime64) else c
@@ -876,22 +913,23 @@ class OverlayPlot(LegendPlot, GenericOverlayPlot):
             range_obj = self.hmap
         items = [] if element is None else element.items()
 
-        if not empty:
-            ranges = self.compute_ranges(range_obj, key, ranges)
-        for k, subplot in self.subplots.items():
-            el = None if empty else element.get(k, None)
-            if isinstance(self.hmap, DynamicMap) and not empty:
-                idx = dynamic_update(self, subplot, k, element, items)
-                if idx is not None:
-                    _, el = items.pop(idx)
-            subplot.update_frame(key, ranges, el)
-
-        if isinstance(self.hmap, DynamicMap) and items:
-            raise Exception("Some Elements returned by the dynamic callback "
-                            "were not initialized correctly and could not be "
-                            "rendered.")
-
-        if self.show_legend and not empty:
-            self._adjust_legend(element, axis)
+        with self.shared_options():
+            if not empty:
+                ranges = self.compute_ranges(range_obj, key, ranges)
+            for k, subplot in self.subplots.items():
+                el = None if empty else element.get(k, None)
+                if isinstance(self.hmap, DynamicMap) and not empty:
+                    idx = dynamic_update(self, subplot, k, element, items)
+                    if idx is not None:
+                        _, el = items.pop(idx)
+                subplot.update_frame(key, ranges, el)
+
+            if isinstance(self.hmap, DynamicMap) and items:
+                raise Exception("Some Elements returned by the dynamic callback "
+                                "were not initialized correctly and could not be "
+                                "rendered.")
+
+            if self.show_legend and not empty:
+                self._adjust_legend(element, axis)
 
         self._finalize_axis(key, element=element, ranges=ranges)
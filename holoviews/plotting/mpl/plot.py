@@ -8,11 +8,14 @@ import matplotlib as mpl
 from mpl_toolkits.mplot3d import Axes3D  # noqa (For 3D plots)
 from matplotlib import pyplot as plt
 from matplotlib import gridspec, animation
+from matplotlib.artist import Artist
+from matplotlib.backends.backend_agg import FigureCanvasAgg
 import param
 from ...core import (OrderedDict, HoloMap, AdjointLayout, NdLayout,
                      GridSpace, Element, CompositeOverlay, Empty,
                      Collator, GridMatrix, Layout)
 from ...core.options import Store, SkipRendering
+from ...core import util
 from ...core.util import int_to_roman, int_to_alpha, basestring
 from ..plot import (DimensionedPlot, GenericLayoutPlot, GenericCompositePlot,
                     GenericElementPlot)
@@ -58,6 +61,9 @@ class MPLPlot(DimensionedPlot):
 
     sideplots = {}
 
+    # Handles which hold artists that may be updated between frames
+    _animated_handles = ['artist', 'title', 'annotations', 'legend', 'offset_line']
+
     fig_alpha = param.Number(default=1.0, bounds=(0, 1), doc="""
         Alpha of the overall figure background.""")
 
@@ -225,20 +231,107 @@ class MPLPlot(DimensionedPlot):
     def state(self):
         return self.handles['fig']
 
-    def anim(self, start=0, stop=None, fps=30):
+    def anim(self, start=0, stop=None, fps=30, blit=False):
         """
         Method to return a matplotlib animation. The start and stop
-        frames may be specified as well as the fps.
+        frames may be specified as well as the fps. If blit is
+        enabled only the artists updated on each frame are redrawn
+        on top of the cached static background of the figure.
         """
         figure = self.state or self.initialize_plot()
-        anim = animation.FuncAnimation(figure, self.update_frame,
-                                       frames=self.keys,
-                                       interval = 1000.0/fps)
+        if blit:
+            def update(key):
+                state = self._static_state(figure)
+                self.update_frame(key)
+                if self._static_state(figure) != state:
+                    # Limits, labels or ticks changed so the cached
+                    # background is stale and has to be redrawn
+                    getattr(anim, '_blit_cache', {}).clear()
+                    figure.canvas.draw()
+                return self._animated_artists()
+        else:
+            update = self.update_frame
+        anim = animation.FuncAnimation(figure, update,
+                                       frames=self.keys[start:stop],
+                                       interval = 1000.0/fps, blit=blit)
         # Close the figure handle
         if self._close_figures: plt.close(figure)
         return anim
 
 
+    def _animated_artists(self):
+        """
+        Returns the artists of this plot and all its subplots which
+        are updated between frames, sorted by their zorder.
+        """
+        def flatten(handle):
+            if isinstance(handle, Artist):
+                return [handle]
+            elif isinstance(handle, dict):
+                handle = list(handle.values())
+            if isinstance(handle, (list, tuple)):
+                return [a for h in handle for a in flatten(h)]
+            return []
+        artists = self.traverse(lambda x: [a for h in x._animated_handles
+                                           for a in flatten(x.handles.get(h))])
+        artists = util.unique_iterator(a for plot_artists in artists for a in plot_artists)
+        return sorted(artists, key=lambda a: a.get_zorder())
+
+
+    def _static_state(self, figure):
+        """
+        Returns the state of the figure components which are not
+        animated, i.e. the limits, labels and ticks of all axes, used
+        to determine whether a cached background is still valid.
+        """
+        state = []
+        for ax in figure.axes:
+            axes = [ax.xaxis, ax.yaxis] + ([ax.zaxis] if hasattr(ax, 'zaxis') else [])
+            state.append([ax.get_visible()] + [
+                (axis.get_view_interval().tolist(), axis.get_label_text(),
+                 list(axis.get_ticklocs()), [t.get_text() for t in axis.get_ticklabels()],
+                 axis.get_visible()) for axis in axes])
+        return state
+
+
+    def _rgba_frames(self, start=0, stop=None, blit=False):
+        """
+        Generator returning the raw RGBA buffer of each frame. Unless
+        blitting, the figure is fully drawn on every frame. If blit
+        is enabled the figure is fully drawn on the first frame and
+        whenever the limits, labels or ticks of any axes change,
+        otherwise the cached background of the static figure
+        components is restored and only the animated artists are
+        redrawn.
+        """
+        figure = self.state or self.initialize_plot()
+        canvas = figure.canvas
+        if not hasattr(canvas, 'copy_from_bbox'):
+            canvas = FigureCanvasAgg(figure)
+        background, static = None, None
+        artists = []
+        for key in self.keys[start:stop]:
+            self.update_frame(key)
+            if not blit:
+                canvas.draw()
+                yield canvas.buffer_rgba()
+                continue
+            artists = self._animated_artists()
+            for artist in artists:
+                artist.set_animated(True)
+            state = self._static_state(figure)
+            if background is None or state != static:
+                canvas.draw()
+                background, static = canvas.copy_from_bbox(figure.bbox), state
+            else:
+                canvas.restore_region(background)
+            for artist in artists:
+                figure.draw_artist(artist)
+            yield canvas.buffer_rgba()
+        for artist in artists:
+            artist.set_animated(False)
+
+
     def update(self, key):
         if len(self) == 1 and key == 0 and not self.drawn:
             return self.initialize_plot()
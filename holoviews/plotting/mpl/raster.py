@@ -5,6 +5,7 @@ import param
 
 from ...core import CompositeOverlay, Element
 from ...core import traversal
+from ...core.options import abbreviated_exception
 from ...core.util import match_spec, max_range, unique_iterator, unique_array, is_nan
 from ...element.raster import Image, Raster, RGB
 from .element import ColorbarPlot, OverlayPlot
@@ -252,7 +253,28 @@ class QuadMeshPlot(ColorbarPlot):
     def init_artists(self, ax, plot_args, plot_kwargs):
         locs = plot_kwargs.pop('locs', None)
         artist = ax.pcolormesh(*plot_args, **plot_kwargs)
-        return {'artist': artist, 'locs': locs}
+        return {'artist': artist, 'locs': locs, 'coords': plot_args[:-1]}
+
+
+    def update_handles(self, key, axis, element, ranges, style):
+        cmesh_data, style, axis_kwargs = self.get_data(element, ranges, style)
+        coords, data = cmesh_data[:-1], cmesh_data[-1]
+        previous = self.handles.get('coords')
+        if 'artist' in self.handles and previous is not None and all(
+                np.array_equal(c0, c1) for c0, c1 in zip(previous, coords)):
+            # Coordinates are unchanged so only the values are updated
+            artist = self.handles['artist']
+            artist.set_array(data.ravel())
+            artist.set_clim((style['vmin'], style['vmax']))
+            if 'norm' in style:
+                artist.norm = style['norm']
+            return axis_kwargs
+
+        self.teardown_handles()
+        with abbreviated_exception():
+            handles = self.init_artists(axis, cmesh_data, style)
+        self.handles.update(handles)
+        return axis_kwargs
 
 
 class RasterGridPlot(GridPlot, OverlayPlot):
@@ -2,6 +2,8 @@ import sys
 from io import BytesIO
 from tempfile import NamedTemporaryFile
 from contextlib import contextmanager
+from subprocess import Popen, PIPE
+from threading import Thread
 from itertools import chain
 
 import matplotlib as mpl
@@ -39,6 +41,13 @@ class MPLRenderer(Renderer):
 
     backend = param.String('matplotlib', doc="The backend name.")
 
+    blit = param.Boolean(default=False, doc="""
+        Whether animations encoded by piping frames into the encoder
+        only redraw the artists updated on each frame on top of the
+        cached static background. Faster, but frames of plots which
+        update artists other than the main artist, title, annotations
+        and legend may not be redrawn correctly.""")
+
     dpi=param.Integer(72, doc="""
         The render resolution in dpi (dots per inch)""")
 
@@ -70,6 +79,12 @@ class MPLRenderer(Renderer):
         'scrubber': ('html', None, {'fps': 5}, None)
     }
 
+    # <format name> : rcParams key of the encoder executable used to
+    #                 encode raw RGBA frames piped to its stdin
+    PIPE_ENCODERS = {'webm': 'animation.ffmpeg_path',
+                     'mp4': 'animation.ffmpeg_path',
+                     'gif': 'animation.convert_path'}
+
     mode_formats = {'fig':{'default': ['png', 'svg', 'pdf', 'html', None, 'auto'],
                            'nbagg': ['html', None, 'auto']},
                     'holomap': {m:['widgets', 'scrubber', 'webm','mp4', 'gif',
@@ -103,8 +118,11 @@ class MPLRenderer(Renderer):
             if sys.version_info[0] == 3 and mpl.__version__[:-2] in ['1.2', '1.3']:
                 raise Exception("<b>Python 3 matplotlib animation support broken &lt;= 1.3</b>")
             with mpl.rc_context(rc=plot.fig_rcparams):
-                anim = plot.anim(fps=self.fps)
-            data = self._anim_data(anim, fmt)
+                if fmt in self.PIPE_ENCODERS:
+                    data = self._anim_pipe(plot, fmt)
+                else:
+                    anim = plot.anim(fps=self.fps)
+                    data = self._anim_data(anim, fmt)
 
         data = self._apply_post_render_hooks(data, obj, fmt)
         return data, {'file-ext':fmt,
@@ -241,6 +259,65 @@ class MPLRenderer(Renderer):
         return video
 
 
+    def _encoder_args(self, fmt, size, fps):
+        """
+        Returns the command line arguments of the encoder for the
+        supplied format, reading raw RGBA frames of the given size
+        from stdin and writing the encoded data to stdout.
+        """
+        (writer, _, anim_kwargs, extra_args) = self.ANIMATION_OPTS[fmt]
+        executable = mpl.rcParams[self.PIPE_ENCODERS[fmt]]
+        if writer == 'imagemagick':
+            return [executable, '-size', '%dx%d' % size, '-depth', '8',
+                    '-delay', str(100./fps), '-loop', '0', 'rgba:-', '%s:-' % fmt]
+        args = [executable, '-y', '-f', 'rawvideo', '-vcodec', 'rawvideo',
+                '-s', '%dx%d' % size, '-pix_fmt', 'rgba', '-r', str(fps), '-i', 'pipe:0']
+        if 'codec' in anim_kwargs:
+            args += ['-vcodec', anim_kwargs['codec']]
+        args += list(extra_args)
+        if fmt == 'mp4':
+            # Pad to even dimensions and write a streamable mp4
+            args += ['-vf', 'pad=ceil(iw/2)*2:ceil(ih/2)*2',
+                     '-movflags', 'frag_keyframe+empty_moov']
+        return args + ['-f', fmt, 'pipe:1']
+
+
+    def _anim_pipe(self, plot, fmt):
+        """
+        Render the frames of the plot and pipe the raw RGBA buffers
+        straight into the encoder, returning the encoded data without
+        writing any intermediate files.
+        """
+        anim_kwargs = self.ANIMATION_OPTS[fmt][2]
+        fps = max([int(self.fps), 1]) if self.fps is not None else anim_kwargs.get('fps', 5)
+        figure = plot.state or plot.initialize_plot()
+        if self.dpi is not None:
+            figure.set_dpi(self.dpi)
+        size = tuple(int(v) for v in figure.canvas.get_width_height())
+
+        proc = Popen(self._encoder_args(fmt, size, fps),
+                     stdin=PIPE, stdout=PIPE, stderr=PIPE)
+        output = {}
+        readers = [Thread(target=lambda k=k: output.update({k: getattr(proc, k).read()}))
+                   for k in ('stdout', 'stderr')]
+        for reader in readers:
+            reader.start()
+        try:
+            for frame in plot._rgba_frames(blit=self.blit):
+                proc.stdin.write(frame)
+        finally:
+            proc.stdin.close()
+            for reader in readers:
+                reader.join()
+            proc.wait()
+            if plot._close_figures:
+                plt.close(figure)
+        if proc.returncode:
+            raise IOError('Encoding %s animation failed with the following error:\n\n%s'
+                          % (fmt, output['stderr'].decode('utf-8', 'replace')))
+        return output['stdout']
+
+
     def _compute_bbox(self, fig, kw):
         """
         Compute the tight bounding box for each figure once, reducing
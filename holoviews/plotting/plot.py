@@ -6,6 +6,7 @@ of this Plot baseclass.
 
 from itertools import groupby, product
 from collections import Counter, defaultdict
+from contextlib import contextmanager
 
 import numpy as np
 import param
@@ -39,6 +40,9 @@ class Plot(param.Parameterized):
     # Use this list to disable any invalid style options
     _disabled_opts = []
 
+    # Memo of resolved options, only active within shared_options
+    _options_memo = None
+
     def initialize_plot(self, ranges=None):
         """
         Initialize the matplotlib figure.
@@ -69,8 +73,43 @@ class Plot(param.Parameterized):
         """
         raise NotImplementedError
 
+    @classmethod
+    @contextmanager
+    def shared_options(cls):
+        """
+        Context manager within which options are resolved only once
+        per backend, type, group, label and id of an object, allowing
+        the subplots of an overlay to share option lookups when
+        updating a frame. The option trees must not be modified
+        within the context.
+        """
+        if Plot._options_memo is not None:
+            yield
+            return
+        Plot._options_memo = {}
+        try:
+            yield
+        finally:
+            Plot._options_memo = None
+
+
     @classmethod
     def lookup_options(cls, obj, group):
+        memo = Plot._options_memo
+        if memo is not None:
+            # Options are keyed on the type of the object while the
+            # plotting class of a HoloMap depends on its element type
+            element_type = obj.type if isinstance(obj, HoloMap) else None
+            key = (cls.backend, type(obj), element_type, obj.group,
+                   obj.label, obj.id, group)
+            if key not in memo:
+                memo[key] = cls._lookup_options(obj, group)
+            return memo[key]
+        return cls._lookup_options(obj, group)
+
+
+    @classmethod
+    def _lookup_options(cls, obj, group):
         plot_class = None
         try:
             plot_class = Store.renderers[cls.backend].plotting_class(obj)
@@ -381,26 +420,47 @@ class DimensionedPlot(Plot):
             gid = None if gid == -1 else gid
             group_specs = [el for _, el in element_spec_group]
 
-            backend = self.renderer.backend
-            optstree = Store.custom_options(
-                backend=backend).get(gid, Store.options(backend=backend))
             # Get the normalization options for the current id
             # and match against customizable elements
-            for opts in optstree:
-                path = tuple(opts.path.split('.')[1:])
+            for path, axiswise, framewise in self._norm_options(gid):
                 applies = any(path == spec[:i] for spec in group_specs
                               for i in range(1, 4))
-                if applies and 'norm' in opts.groups:
-                    nopts = opts['norm'].options
-                    if 'axiswise' in nopts or 'framewise' in nopts:
-                        norm_opts.update({path: (nopts.get('axiswise', False),
-                                                 nopts.get('framewise', False))})
+                if applies:
+                    norm_opts[path] = (axiswise, framewise)
         element_specs = [spec for _, spec in element_specs]
         norm_opts.update({spec: (False, False) for spec in element_specs
                           if not any(spec[:i] in norm_opts.keys() for i in range(1, 4))})
         return norm_opts
 
 
+    def _norm_options(self, gid):
+        """
+        Returns a list of (path, axiswise, framewise) tuples for all
+        the nodes declaring normalization options on the OptionTree
+        for the supplied id.
+        """
+        backend = self.renderer.backend
+        memo = Plot._options_memo
+        key = (backend, 'norm', gid)
+        if memo is not None and key in memo:
+            return memo[key]
+
+        optstree = Store.custom_options(
+            backend=backend).get(gid, Store.options(backend=backend))
+        norm_options = []
+        for opts in optstree:
+            if 'norm' not in opts.groups:
+                continue
+            nopts = opts['norm'].options
+            if 'axiswise' in nopts or 'framewise' in nopts:
+                path = tuple(opts.path.split('.')[1:])
+                norm_options.append((path, nopts.get('axiswise', False),
+                                     nopts.get('framewise', False)))
+        if memo is not None:
+            memo[key] = norm_options
+        return norm_options
+
+
     @staticmethod
     def _compute_group_range(group, elements, ranges):
         # Iterate over all elements in a normalization group
@@ -17,6 +17,9 @@ class PlotlyPlot(DimensionedPlot):
 
     height = param.Integer(default=400)
 
+    # Snapshot of the figure last sent to the frontend
+    _sent_state = None
+
     @property
     def state(self):
         """
@@ -1,3 +1,51 @@
+// Decodes base64 encoded binary arrays in a frame
+function plotly_decode(obj) {
+	if (obj === null || typeof obj !== 'object') {
+		return obj;
+	} else if (Array.isArray(obj)) {
+		return obj.map(plotly_decode);
+	} else if (obj.__ndarray__ !== undefined) {
+		var raw = atob(obj.__ndarray__);
+		var bytes = new Uint8Array(raw.length);
+		for (var i = 0; i < raw.length; i++) {
+			bytes[i] = raw.charCodeAt(i);
+		}
+		var types = {float64: Float64Array, float32: Float32Array, int32: Int32Array,
+					 uint32: Uint32Array, int16: Int16Array, uint16: Uint16Array,
+					 int8: Int8Array, uint8: Uint8Array};
+		var arr = Array.prototype.slice.call(new types[obj.dtype](bytes.buffer));
+		if (obj.shape.length == 2) {
+			var rows = [], n = obj.shape[1];
+			for (var r = 0; r < obj.shape[0]; r++) {
+				rows.push(arr.slice(r*n, (r+1)*n));
+			}
+			return rows;
+		}
+		return arr;
+	}
+	var decoded = {};
+	$.each(Object.keys(obj), function(i, key) {
+		decoded[key] = plotly_decode(obj[key]);
+	});
+	return decoded;
+}
+
+// Applies a (partial) frame to a plot, redrawing it if the number
+// of traces changed
+function plotly_update(plot, data) {
+	if (data.data.length != plot.data.length) {
+		Plotly.newPlot(plot, data.data, data.layout);
+		return;
+	}
+	$.each(data.data, function(i, obj) {
+		$.each(Object.keys(obj), function(j, key) {
+			plot.data[i][key] = obj[key];
+		});
+	});
+	Plotly.relayout(plot, data.layout);
+	Plotly.redraw(plot);
+}
+
 // Define Plotly specific subclasses
 function PlotlySelectionWidget() {
     SelectionWidget.apply(this, arguments);
@@ -15,25 +63,17 @@ PlotlyScrubberWidget.prototype = Object.create(ScrubberWidget.prototype);
 var PlotlyMethods = {
     init_slider : function(init_val){
 		$.each(this.frames, $.proxy(function(index, frame) {
-			this.frames[index] = JSON.parse(frame);
+			this.frames[index] = plotly_decode(JSON.parse(frame));
 		}, this));
     },
 	process_msg : function(msg) {
-		var data = JSON.parse(msg.content.data);
+		var data = plotly_decode(JSON.parse(msg.content.data));
 		this.frames[this.current] = data;
 		this.update_cache(true);
 		this.update(this.current);
 	},
     update : function(current){
-		var data = this.frames[current];
-		var plot = $('#'+this.id)[0];
-		$.each(data.data, function(i, obj) {
-			$.each(Object.keys(obj), function(j, key) {
-				plot.data[i][key] = obj[key];
-			});
-		});
-		Plotly.relayout(plot, data.layout);
-		Plotly.redraw(plot);
+		plotly_update($('#'+this.id)[0], this.frames[current]);
     }
 }
 
@@ -8,20 +8,15 @@ from ..renderer import Renderer, MIME_TYPES
 from ...core.options import Store
 from ...core import HoloMap
 from ..comms import JupyterComm
+from .util import encode_arrays, figure_diff, snapshot
 from .widgets import PlotlyScrubberWidget, PlotlySelectionWidget
 
 
 plotly_msg_handler = """
 /* Backend specific body of the msg_handler, updates displayed frame */
+/* plotly_decode and plotly_update are defined in plotlywidgets.js */
 var plot = $('#{comm_id}')[0];
-var data = JSON.parse(msg);
-$.each(data.data, function(i, obj) {{
-  $.each(Object.keys(obj), function(j, key) {{
-    plot.data[i][key] = obj[key];
-  }});
-}});
-Plotly.relayout(plot, data.layout);
-Plotly.redraw(plot);
+plotly_update(plot, plotly_decode(JSON.parse(msg)));
 """
 
 PLOTLY_WARNING = """
@@ -42,6 +37,10 @@ class PlotlyRenderer(Renderer):
         Output render format for static figures. If None, no figure
         rendering will occur. """)
 
+    binary_threshold = param.Integer(default=1000, bounds=(0, None), doc="""
+        Minimum number of elements in a numeric array for it to be
+        sent as a binary buffer when diffing a plot.""")
+
     mode_formats = {'fig': {'default': ['html', 'json']},
                     'holomap': {'default': ['widgets', 'scrubber', 'auto']}}
 
@@ -61,16 +60,23 @@ class PlotlyRenderer(Renderer):
         elif fmt == 'html':
             return self.figure_data(plot, divuuid=divuuid), mime_types
         elif fmt == 'json':
-            return self.diff(plot), mime_types
+            figure = {'data': plot.state.get('data', []),
+                      'layout': plot.state.get('layout', {})}
+            return json.dumps(figure, cls=utils.PlotlyJSONEncoder), mime_types
 
 
-    def diff(self, plot, serialize=True):
+    def diff(self, plot, serialize=True, binary=True):
         """
         Returns a json diff required to update an existing plot with
-        the latest plot data.
+        the latest plot data. Only the trace properties and layout
+        attributes which changed since the plot was last rendered or
+        diffed are included. If binary is enabled large numeric
+        arrays are sent as base64 encoded binary buffers.
         """
-        diff = {'data': plot.state.get('data', []),
-                'layout': plot.state.get('layout', {})}
+        diff = figure_diff(plot._sent_state, plot.state)
+        plot._sent_state = snapshot(plot.state)
+        if binary:
+            diff = encode_arrays(diff, self.binary_threshold)
         if serialize:
             return json.dumps(diff, cls=utils.PlotlyJSONEncoder)
         else:
@@ -79,6 +85,7 @@ class PlotlyRenderer(Renderer):
 
     def figure_data(self, plot, divuuid=None, comm=True, width=800, height=600):
         figure = plot.state
+        plot._sent_state = snapshot(figure)
         if divuuid is None:
             if plot.comm:
                 divuuid = plot.comm.id
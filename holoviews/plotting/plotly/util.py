@@ -1,3 +1,6 @@
+import base64
+
+import numpy as np
 import plotly.graph_objs as go
 
 
@@ -32,3 +35,129 @@ def replace_refs(obj, ind):
         return new_obj
     else:
         return obj
+
+
+def snapshot(obj):
+    """
+    Recursively copies the dictionaries and lists making up a figure
+    without copying the leaf values, so that the state of a figure
+    may be compared against after the figure has been modified.
+    """
+    if isinstance(obj, dict):
+        return {k: snapshot(v) for k, v in obj.items()}
+    elif isinstance(obj, list):
+        return [snapshot(v) for v in obj]
+    return obj
+
+
+def values_equal(a, b):
+    """
+    Compares two figure property values, which may be nested
+    dictionaries, lists or arrays.
+    """
+    if isinstance(a, np.ndarray) or isinstance(b, np.ndarray):
+        a, b = np.asarray(a), np.asarray(b)
+        if a.shape != b.shape:
+            return False
+        elif a.dtype.kind == 'f' and b.dtype.kind == 'f':
+            return bool(((a == b) | (np.isnan(a) & np.isnan(b))).all())
+        try:
+            return bool(np.array_equal(a, b))
+        except Exception:
+            return False
+    elif isinstance(a, dict) and isinstance(b, dict):
+        return (len(a) == len(b) and
+                all(k in b and values_equal(v, b[k]) for k, v in a.items()))
+    elif isinstance(a, (list, tuple)) and isinstance(b, (list, tuple)):
+        return len(a) == len(b) and all(values_equal(x, y) for x, y in zip(a, b))
+    try:
+        return bool(a == b)
+    except Exception:
+        return False
+
+
+def _layout_paths(previous, current, prefix=''):
+    """
+    Returns the dotted paths of all layout attributes which differ
+    between the previous and current layout.
+    """
+    paths = []
+    for key in set(previous) | set(current):
+        path = prefix + key
+        old, new = previous.get(key), current.get(key)
+        if isinstance(old, dict) and isinstance(new, dict):
+            paths += _layout_paths(old, new, path+'.')
+        elif key not in previous or key not in current or not values_equal(old, new):
+            paths.append(path)
+    return paths
+
+
+def changed_properties(previous, current):
+    """
+    Returns the names of the trace properties changed on each trace
+    and the dotted paths of the changed layout attributes between
+    two figures. Returns None if the number of traces differs.
+    """
+    prev_data, data = previous.get('data', []), current.get('data', [])
+    if len(prev_data) != len(data):
+        return None
+    traces = [set(k for k in set(old) | set(new) if k not in old or k not in new
+                  or not values_equal(old[k], new[k]))
+              for old, new in zip(prev_data, data)]
+    return traces, set(_layout_paths(previous.get('layout', {}), current.get('layout', {})))
+
+
+def select_properties(figure, traces, layout_paths):
+    """
+    Selects the supplied trace properties and layout paths from a
+    figure, returning an update suitable to be applied with
+    Plotly.restyle and Plotly.relayout.
+    """
+    data = [{k: trace.get(k) for k in keys}
+            for trace, keys in zip(figure.get('data', []), traces)]
+    layout = {}
+    for path in layout_paths:
+        value = figure.get('layout', {})
+        for key in path.split('.'):
+            value = value.get(key) if isinstance(value, dict) else None
+        layout[path] = value
+    return {'data': data, 'layout': layout}
+
+
+def figure_diff(previous, current):
+    """
+    Computes the minimal update turning the previous figure into the
+    current figure, containing only the changed trace properties and
+    layout attributes. If there is no previous figure or the number
+    of traces changed the full figure is returned.
+    """
+    changed = None if previous is None else changed_properties(previous, current)
+    if changed is None:
+        return {'data': list(current.get('data', [])),
+                'layout': current.get('layout', {})}
+    return select_properties(current, *changed)
+
+
+def encode_arrays(obj, threshold=1000):
+    """
+    Replaces numeric arrays with at least threshold elements by a
+    base64 encoded binary representation, which is decoded to typed
+    arrays on the frontend.
+    """
+    if isinstance(obj, dict):
+        return {k: encode_arrays(v, threshold) for k, v in obj.items()}
+    elif isinstance(obj, list):
+        return [encode_arrays(v, threshold) for v in obj]
+    elif (isinstance(obj, np.ndarray) and not isinstance(obj, np.ma.MaskedArray)
+          and obj.dtype.kind in 'uif' and obj.size >= threshold and obj.ndim <= 2):
+        # Typed arrays support neither 64-bit integers nor 16-bit floats
+        if obj.dtype.itemsize > 4:
+            dtype = np.dtype('float64')
+        elif obj.dtype.kind == 'f':
+            dtype = np.dtype('float32')
+        else:
+            dtype = obj.dtype
+        data = np.ascontiguousarray(obj, dtype=dtype.newbyteorder('<'))
+        return {'__ndarray__': base64.b64encode(data.tobytes()).decode('utf-8'),
+                'dtype': dtype.name, 'shape': list(obj.shape)}
+    return obj
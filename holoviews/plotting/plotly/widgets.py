@@ -1,7 +1,12 @@
 import json
 import param
+with param.logging_level('CRITICAL'):
+    from plotly.offline.offline import utils
 
+from ...core import OrderedDict
 from ..widgets import NdWidget, SelectionWidget, ScrubberWidget
+from .util import (changed_properties, encode_arrays, figure_diff,
+                   select_properties, snapshot)
 
 class PlotlyWidget(NdWidget):
 
@@ -14,6 +19,31 @@ class PlotlyWidget(NdWidget):
         data = super(PlotlyWidget, self)._get_data()
         return dict(data, init_frame=init_frame)
 
+    def get_frames(self):
+        """
+        Embeds only the trace properties and layout attributes which
+        vary across frames, since the static parts of the figure are
+        already included in the initial frame.
+        """
+        if not self.embed:
+            return super(PlotlyWidget, self).get_frames()
+        figures = []
+        for idx in range(len(self.plot)):
+            self.plot.update(idx)
+            figures.append(snapshot(self.plot.state))
+        changes = [changed_properties(figures[0], fig) for fig in figures]
+        if any(changed is None for changed in changes):
+            updates = [figure_diff(None, fig) for fig in figures]
+        else:
+            traces = [set().union(*keys) for keys in zip(*[c[0] for c in changes])]
+            layout = set().union(*[c[1] for c in changes])
+            updates = [select_properties(fig, traces, layout) for fig in figures]
+        threshold = self.renderer.binary_threshold
+        frames = OrderedDict([(idx, json.dumps(encode_arrays(update, threshold),
+                                               cls=utils.PlotlyJSONEncoder))
+                              for idx, update in enumerate(updates)])
+        return self.encode_frames(frames)
+
     def encode_frames(self, frames):
         frames = json.dumps(frames).replace('</', r'<\/')
         return frames
@@ -10,6 +10,7 @@ from contextlib import contextmanager
 
 import param
 from ..core.io import Exporter
+from ..core.data import LazyDataset
 from ..core.options import Store, StoreOptions, SkipRendering, Compositor
 from ..core.util import find_file, unicode, unbound_dimensions, basestring
 from .. import Layout, HoloMap, AdjointLayout
@@ -162,6 +163,9 @@ class Renderer(Exporter):
         """
         Given a HoloViews Viewable return a corresponding plot instance.
         """
+        if isinstance(obj, LazyDataset):
+            obj = obj.execute()
+
         # Initialize DynamicMaps with first data item
         initialize_dynamic(obj)
 
@@ -466,6 +470,9 @@ class Renderer(Exporter):
         if info or key:
             raise Exception('Renderer does not support saving metadata to file.')
 
+        if isinstance(obj, LazyDataset):
+            obj = obj.execute()
+
         with StoreOptions.options(obj, options, **kwargs):
             plot = self_or_cls.get_plot(obj)
 
@@ -324,11 +324,16 @@ class Dynamic(param.ParameterizedFunction):
         return streams
 
 
-    def _process(self, element, key=None):
+    def _process(self, element, key=None, source=None):
         if isinstance(self.p.operation, Operation):
+            operation = self.p.operation
             kwargs = {k: v for k, v in self.p.kwargs.items()
-                      if k in self.p.operation.params()}
-            return self.p.operation.process_element(element, key, **kwargs)
+                      if k in operation.params()}
+            operation._source = source
+            try:
+                return operation.process_element(element, key, **kwargs)
+            finally:
+                operation._source = None
         else:
             return self.p.operation(element, **self.p.kwargs)
 
@@ -342,11 +347,11 @@ class Dynamic(param.ParameterizedFunction):
             def dynamic_operation(*key, **kwargs):
                 self.p.kwargs.update(kwargs)
                 obj = map_obj[key] if isinstance(map_obj, HoloMap) else map_obj
-                return self._process(obj, key)
+                return self._process(obj, key, map_obj)
         else:
             def dynamic_operation(*key, **kwargs):
                 self.p.kwargs.update(kwargs)
-                return self._process(map_obj[key], key)
+                return self._process(map_obj[key], key, map_obj)
         if isinstance(self.p.operation, Operation):
             return OperationCallable(dynamic_operation, inputs=[map_obj],
                                      link_inputs=self.p.link_inputs,
@@ -3,16 +3,19 @@ The magics offered by the HoloViews IPython extension are powerful and
 support rich, compositional specifications. To avoid the the brittle,
 convoluted code that results from trying to support the syntax in pure
 Python, this file defines suitable parsers using pyparsing that are
-cleaner and easier to understand.
+cleaner and easier to understand. The common subset of the options
+specification syntax is handled by a faster hand-written parser,
+falling back to pyparsing for anything else.
 
 Pyparsing is required by matplotlib and will therefore be available if
 HoloViews is being used in conjunction with matplotlib.
 """
 from __future__ import division
+import re
 import param
+from collections import OrderedDict
 from itertools import groupby
 import numpy as np
-import pyparsing as pp
 
 from ..core.options import Options, Cycle, Palette
 from ..operation import Compositor
@@ -38,6 +41,11 @@ class Parser(object):
     # If True, raise SyntaxError on eval error otherwise warn
     abort_on_eval_failure = False
 
+    # Compiled keyword expressions shared by all parsers
+    _compiled = {}
+
+    _compiled_size = 1000
+
     @classmethod
     def _strip_commas(cls, kw):
         "Strip out any leading/training commas from the token"
@@ -84,8 +92,16 @@ class Parser(object):
         The ns is a dynamic namespace (typically the IPython Notebook
         namespace) used to update the class-level namespace.
         """
-        grouped, kwargs = [], {}
         tokens = cls.collect_tokens(parseresult, mode)
+        return cls.evaluate(cls.keywords(tokens), ns)
+
+    @classmethod
+    def keywords(cls, tokens):
+        """
+        Given a list of tokens, group them into the list of keyword
+        strings to be evaluated.
+        """
+        grouped = []
         # Group tokens without '=' and append to last token containing '='
         for group in groupby(tokens, lambda el: '=' in el):
             (val, items) = group
@@ -99,6 +115,7 @@ class Parser(object):
                                   for el in elements) else ''
                 grouped[-1] += joiner + joiner.join(elements)
 
+        keywords = []
         for keyword in grouped:
             # Tuple ('a', 3) becomes (,'a',3) and '(,' is never valid
             # Same for some of the other joining errors corrected here
@@ -106,9 +123,27 @@ class Parser(object):
                               (',:',':'), (':,', ':'), (',,', ','),
                               (',.', '.')]:
                 keyword = keyword.replace(fst, snd)
+            keywords.append(keyword)
+        return keywords
+
+    @classmethod
+    def evaluate(cls, keywords, ns={}):
+        """
+        Evaluate a list of keyword strings returning a dictionary of
+        keyword values. The compiled keywords are cached, while the
+        values are evaluated in the supplied namespace on every call.
+        """
+        kwargs = {}
+        namespace = dict(cls.namespace, **ns)
+        for keyword in keywords:
             try:
-                kwargs.update(eval('dict(%s)' % keyword,
-                                   dict(cls.namespace, **ns)))
+                code = cls._compiled.get(keyword)
+                if code is None:
+                    code = compile('dict(%s)' % keyword, '<string>', 'eval')
+                    if len(cls._compiled) >= cls._compiled_size:
+                        cls._compiled.clear()
+                    cls._compiled[keyword] = code
+                kwargs.update(eval(code, namespace))
             except:
                 if cls.abort_on_eval_failure:
                     raise SyntaxError("Could not evaluate keyword: %r"
@@ -146,59 +181,84 @@ class OptsSpec(Parser):
     '=' sign (no space).
     """
 
-    plot_options_short = pp.nestedExpr('[',
-                                       ']',
-                                       content=pp.OneOrMore(pp.Word(allowed) ^ pp.quotedString)
-                                   ).setResultsName('plot_options')
+    # Grammar and compositor groups it was constructed with
+    _opts_spec = None
+
+    # Parsed option groups by line and compositor groups
+    _parse_cache = OrderedDict()
+
+    _parse_cache_size = 500
+
+    _brackets = {'plot': ('[', ']'), 'style': ('(', ')'), 'norm': ('{', '}')}
+
+    _path_pattern = re.compile('[A-Z][a-zA-Z0-9._]+')
+
+    @classmethod
+    def _grammar(cls):
+        """
+        Returns the pyparsing grammar of the options specification,
+        which is constructed when first required and whenever the
+        compositor definitions change.
+        """
+        groups = [el.group for el in Compositor.definitions if el.group]
+        if cls._opts_spec is not None and cls._opts_spec[0] == groups:
+            return cls._opts_spec[1]
+
+        import pyparsing as pp
+        plot_options_short = pp.nestedExpr('[',
+                                           ']',
+                                           content=pp.OneOrMore(pp.Word(allowed) ^ pp.quotedString)
+                                       ).setResultsName('plot_options')
 
-    plot_options_long = pp.nestedExpr(opener='plot[',
-                                      closer=']',
-                                      content=pp.OneOrMore(pp.Word(allowed) ^ pp.quotedString)
-                                  ).setResultsName('plot_options')
+        plot_options_long = pp.nestedExpr(opener='plot[',
+                                          closer=']',
+                                          content=pp.OneOrMore(pp.Word(allowed) ^ pp.quotedString)
+                                      ).setResultsName('plot_options')
 
-    plot_options = (plot_options_short | plot_options_long)
+        plot_options = (plot_options_short | plot_options_long)
 
-    style_options_short = pp.nestedExpr(opener='(',
-                                        closer=')',
-                                        ignoreExpr=None
-                                    ).setResultsName("style_options")
+        style_options_short = pp.nestedExpr(opener='(',
+                                            closer=')',
+                                            ignoreExpr=None
+                                        ).setResultsName("style_options")
 
-    style_options_long = pp.nestedExpr(opener='style(',
-                                       closer=')',
-                                       ignoreExpr=None
-                                   ).setResultsName("style_options")
+        style_options_long = pp.nestedExpr(opener='style(',
+                                           closer=')',
+                                           ignoreExpr=None
+                                       ).setResultsName("style_options")
 
-    style_options = (style_options_short | style_options_long)
+        style_options = (style_options_short | style_options_long)
 
 
-    norm_options_short = pp.nestedExpr(opener='{',
-                                       closer='}',
-                                       ignoreExpr=None
-                                   ).setResultsName("norm_options")
+        norm_options_short = pp.nestedExpr(opener='{',
+                                           closer='}',
+                                           ignoreExpr=None
+                                       ).setResultsName("norm_options")
 
-    norm_options_long = pp.nestedExpr(opener='norm{',
-                                      closer='}',
-                                      ignoreExpr=None
-                                  ).setResultsName("norm_options")
+        norm_options_long = pp.nestedExpr(opener='norm{',
+                                          closer='}',
+                                          ignoreExpr=None
+                                      ).setResultsName("norm_options")
 
-    norm_options = (norm_options_short | norm_options_long)
+        norm_options = (norm_options_short | norm_options_long)
 
-    compositor_ops = pp.MatchFirst(
-        [pp.Literal(el.group) for el in Compositor.definitions if el.group])
+        compositor_ops = pp.MatchFirst([pp.Literal(group) for group in groups])
 
-    dotted_path = pp.Combine( pp.Word(ascii_uppercase, exact=1)
-                              + pp.Word(pp.alphanums+'._'))
+        dotted_path = pp.Combine( pp.Word(ascii_uppercase, exact=1)
+                                  + pp.Word(pp.alphanums+'._'))
 
 
-    pathspec = (dotted_path | compositor_ops).setResultsName("pathspec")
+        pathspec = (dotted_path | compositor_ops).setResultsName("pathspec")
 
 
-    spec_group = pp.Group(pathspec +
-                          (pp.Optional(norm_options)
-                           & pp.Optional(plot_options)
-                           & pp.Optional(style_options)))
+        spec_group = pp.Group(pathspec +
+                              (pp.Optional(norm_options)
+                               & pp.Optional(plot_options)
+                               & pp.Optional(style_options)))
 
-    opts_spec = pp.OneOrMore(spec_group)
+        opts_spec = pp.OneOrMore(spec_group)
+        cls._opts_spec = (groups, opts_spec)
+        return opts_spec
 
     # Aliases that map to the current option name for backward compatibility
     aliases = {'horizontal_spacing':'hspace',
@@ -222,7 +282,15 @@ class OptsSpec(Parser):
         integer value for the normalization plotting option.
         """
         if ('norm_options' not in parse_group): return None
-        opts = parse_group['norm_options'][0].asList()
+        return cls._normalization(parse_group['norm_options'][0].asList())
+
+
+    @classmethod
+    def _normalization(cls, opts):
+        """
+        Given the list of normalization options, validate them and
+        compute the normalization settings.
+        """
         if opts == []: return None
 
         options = ['+framewise', '-framewise', '+axiswise', '-axiswise']
@@ -322,12 +390,98 @@ class OptsSpec(Parser):
 
 
     @classmethod
-    def parse(cls, line, ns={}):
+    def _scan_options(cls, content, kind):
         """
-        Parse an options specification, returning a dictionary with
-        path keys and {'plot':<options>, 'style':<options>} values.
+        Splits the contents of a keyword list into tokens equivalent
+        to those produced by the pyparsing grammar, returning None if
+        the contents use syntax outside the supported subset.
+        """
+        opener, closer = cls._brackets[kind]
+        if kind == 'plot' and any(c not in allowed and c not in '[] \t\n\r'
+                                  for c in content):
+            return None
+        tokens, token, depth, closed = [], '', 0, False
+        for char in content+' ':
+            if char in ' \t\n\r':
+                if depth == 0 and token:
+                    tokens.append(token)
+                    token, closed = '', False
+                continue
+            elif closed and (char != ',' or token.endswith(',')):
+                return None
+            elif char == opener:
+                if not token.rstrip(',') or token.endswith(',') or kind == 'norm':
+                    return None
+                depth += 1
+            elif char == closer:
+                depth -= 1
+                closed = depth == 0
+            token += char
+        if depth:
+            return None
+        elif kind == 'norm':
+            return tokens
+        tokens = [cls._strip_commas(t) for t in tokens if t != ',']
+        return tokens if all('=' in t for t in tokens) else None
+
+
+    @classmethod
+    def _scan(cls, line, groups):
+        """
+        Hand-written parser for the common subset of the options
+        specification syntax, consisting of paths or compositor groups
+        each followed by optional short form plot, style and
+        normalization keyword lists. Returns None if the line uses any
+        other syntax, e.g. the long form keyword lists, in which case
+        the pyparsing grammar has to be used.
         """
-        parses  = [p for p in cls.opts_spec.scanString(line)]
+        parsed, pos, end = [], 0, len(line)
+        openers = {o: kind for kind, (o, _) in cls._brackets.items()}
+        while True:
+            while pos < end and line[pos] in ' \t\n\r':
+                pos += 1
+            if pos == end:
+                break
+            match = cls._path_pattern.match(line, pos)
+            if match is not None:
+                path = match.group()
+            else:
+                path = [g for g in groups if line.startswith(g, pos)]
+                if not path:
+                    return None
+                path = path[0]
+            pos += len(path)
+            if pos < end and line[pos] not in ' \t\n\r[({':
+                return None
+            group = {'pathspec': path}
+            while True:
+                while pos < end and line[pos] in ' \t\n\r':
+                    pos += 1
+                if pos == end or line[pos] not in openers:
+                    break
+                kind = openers[line[pos]]
+                opener, closer = cls._brackets[kind]
+                depth, start = 0, pos
+                for pos in range(start, end):
+                    depth += (line[pos] == opener) - (line[pos] == closer)
+                    if depth == 0:
+                        break
+                if depth or kind+'_options' in group:
+                    return None
+                tokens = cls._scan_options(line[start+1:pos], kind)
+                if tokens is None:
+                    return None
+                group[kind+'_options'] = tokens
+                pos += 1
+            parsed.append(group)
+        return parsed if parsed else None
+
+
+    @classmethod
+    def _parse_pyparsing(cls, line):
+        "Parses the line into option groups using the pyparsing grammar"
+        opts_spec = cls._grammar()
+        parses  = [p for p in opts_spec.scanString(line)]
         if len(parses) != 1:
             raise SyntaxError("Invalid specification syntax.")
         else:
@@ -336,23 +490,71 @@ class OptsSpec(Parser):
             if (processed.strip() != line.strip()):
                 raise SyntaxError("Failed to parse remainder of string: %r" % line[e:])
 
-        grouped_paths = cls._group_paths_without_options(cls.opts_spec.parseString(line))
+        parsed = []
+        for group in opts_spec.parseString(line):
+            tokens = {'pathspec': group['pathspec']}
+            if 'norm_options' in group:
+                tokens['norm_options'] = group['norm_options'][0].asList()
+            if 'plot_options' in group:
+                tokens['plot_options'] = cls.collect_tokens(group['plot_options'][0], 'brackets')
+            if 'style_options' in group:
+                tokens['style_options'] = cls.collect_tokens(group['style_options'][0], 'parens')
+            parsed.append(tokens)
+        return parsed
+
+
+    @classmethod
+    def _parse_groups(cls, line):
+        """
+        Parses the line into a list of (pathspecs, normalization, plot
+        keywords, style keywords) tuples. The result does not depend
+        on the namespace the keywords are evaluated in and is cached
+        by line and the compositor groups the grammar recognizes.
+        """
+        groups = tuple(el.group for el in Compositor.definitions if el.group)
+        key = (line, groups)
+        if key in cls._parse_cache:
+            return cls._parse_cache[key]
+
+        parsed = cls._scan(line, groups)
+        if parsed is None:
+            parsed = cls._parse_pyparsing(line)
+
+        option_groups = []
+        for pathspecs, group in cls._group_paths_without_options(parsed):
+            normalization, plot, style = None, None, None
+            if 'norm_options' in group:
+                normalization = cls._normalization(group['norm_options'])
+            if 'plot_options' in group:
+                plot = cls.keywords(group['plot_options'])
+            if 'style_options' in group:
+                style = cls.keywords(group['style_options'])
+            option_groups.append((pathspecs, normalization, plot, style))
+
+        if len(cls._parse_cache) >= cls._parse_cache_size:
+            cls._parse_cache.popitem(last=False)
+        cls._parse_cache[key] = option_groups
+        return option_groups
+
+
+    @classmethod
+    def parse(cls, line, ns={}):
+        """
+        Parse an options specification, returning a dictionary with
+        path keys and {'plot':<options>, 'style':<options>} values.
+        """
         parse = {}
-        for pathspecs, group in grouped_paths:
+        for pathspecs, normalization, plot, style in cls._parse_groups(line):
             options = {}
-
-            normalization = cls.process_normalization(group)
             if normalization is not None:
                 options['norm'] = normalization
 
-            if 'plot_options' in group:
-                plotopts =  group['plot_options'][0]
-                opts = cls.todict(plotopts, 'brackets', ns=ns)
+            if plot is not None:
+                opts = cls.evaluate(plot, ns=ns)
                 options['plot'] = {cls.aliases.get(k,k):v for k,v in opts.items()}
 
-            if 'style_options' in group:
-                styleopts = group['style_options'][0]
-                opts = cls.todict(styleopts, 'parens', ns=ns)
+            if style is not None:
+                opts = cls.evaluate(style, ns=ns)
                 options['style'] = {cls.aliases.get(k,k):v for k,v in opts.items()}
 
             for pathspec in pathspecs:
@@ -385,24 +587,35 @@ class CompositorSpec(Parser):
                 parameters to the operation (in square brackets).
     """
 
-    mode = pp.Word(pp.alphas+pp.nums+'_').setResultsName("mode")
+    # Grammar constructed when first required
+    _compositor_spec = None
+
+    @classmethod
+    def _grammar(cls):
+        "Returns the pyparsing grammar of the compositor specification"
+        if cls._compositor_spec is not None:
+            return cls._compositor_spec
+
+        import pyparsing as pp
+        mode = pp.Word(pp.alphas+pp.nums+'_').setResultsName("mode")
 
-    op = pp.Word(pp.alphas+pp.nums+'_').setResultsName("op")
+        op = pp.Word(pp.alphas+pp.nums+'_').setResultsName("op")
 
-    overlay_spec = pp.nestedExpr(opener='(',
-                                 closer=')',
-                                 ignoreExpr=None
-                             ).setResultsName("spec")
+        overlay_spec = pp.nestedExpr(opener='(',
+                                     closer=')',
+                                     ignoreExpr=None
+                                 ).setResultsName("spec")
 
-    value = pp.Word(pp.alphas+pp.nums+'_').setResultsName("value")
+        value = pp.Word(pp.alphas+pp.nums+'_').setResultsName("value")
 
-    op_settings = pp.nestedExpr(opener='[',
-                                closer=']',
-                                ignoreExpr=None
-                            ).setResultsName("op_settings")
+        op_settings = pp.nestedExpr(opener='[',
+                                    closer=']',
+                                    ignoreExpr=None
+                                ).setResultsName("op_settings")
 
-    compositor_spec = pp.OneOrMore(pp.Group(mode + op + overlay_spec + value
-                                            + pp.Optional(op_settings)))
+        cls._compositor_spec = pp.OneOrMore(pp.Group(mode + op + overlay_spec + value
+                                                     + pp.Optional(op_settings)))
+        return cls._compositor_spec
 
 
     @classmethod
@@ -411,7 +624,8 @@ class CompositorSpec(Parser):
         Parse compositor specifications, returning a list Compositors
         """
         definitions = []
-        parses  = [p for p in cls.compositor_spec.scanString(line)]
+        compositor_spec = cls._grammar()
+        parses  = [p for p in compositor_spec.scanString(line)]
         if len(parses) != 1:
             raise SyntaxError("Invalid specification syntax.")
         else:
@@ -421,7 +635,7 @@ class CompositorSpec(Parser):
                 raise SyntaxError("Failed to parse remainder of string: %r" % line[e:])
 
         opmap = {op.__name__:op for op in Compositor.operations}
-        for group in cls.compositor_spec.parseString(line):
+        for group in compositor_spec.parseString(line):
 
             if ('mode' not in group) or group['mode'] not in ['data', 'display']:
                 raise SyntaxError("Either data or display mode must be specified.")
@@ -124,3 +124,50 @@ class TestFileArchive(ComparisonTestCase):
             raise AssertionError("No file %r created on export." % fname)
         self.assertEqual(json.load(open(fname, 'r')), data)
         self.assertEqual(archive.listing(), [])
+
+    def test_filearchive_deduplicated_directory(self):
+        export_name = 'archive_image_dedup'
+        archive = FileArchive(export_name=export_name, exporters=[Serializer], pack=False)
+        archive.add(self.image1)
+        archive.add(filename='copy.pkl', data=Serializer(self.image1)[0],
+                    info={'mime_type': 'application/python-pickle'})
+        archive.export()
+        first, second = [os.path.join(export_name, f)
+                         for f in ['Group1-Im1.pkl', 'copy.pkl']]
+        self.assertTrue(os.path.samefile(first, second))
+
+    def test_filearchive_spooled_tar_links_duplicates(self):
+        export_name = 'archive_image_spool'
+        archive = FileArchive(export_name=export_name, exporters=[Serializer],
+                              pack=True, archive_format='tar', spool=True)
+        data = Serializer(self.image1)[0]
+        for fname in ['a.pkl', 'b.pkl', 'c.pkl']:
+            archive.add(filename=fname, data=data,
+                        info={'mime_type': 'application/python-pickle'})
+        spool_dir = archive._spool_dir
+        self.assertEqual(len(os.listdir(spool_dir)), 1)
+        archive.export()
+        self.assertFalse(os.path.isdir(spool_dir))
+        with tarfile.TarFile(export_name+'.tar', 'r') as f:
+            members = f.getmembers()
+            self.assertEqual([m.islnk() for m in members], [False, True, True])
+            self.assertEqual(f.extractfile(members[2]).read(), data)
+
+    def test_filearchive_spool_removed_on_clear(self):
+        archive = FileArchive(exporters=[Serializer], spool=True,
+                              flush_archive=False)
+        archive.add(filename='a.pkl', data=Serializer(self.image1)[0],
+                    info={'mime_type': 'application/python-pickle'})
+        spool_dir = archive._spool_dir
+        self.assertTrue(os.path.isdir(spool_dir))
+        archive.clear()
+        self.assertFalse(os.path.isdir(spool_dir))
+        self.assertEqual(archive.listing(), [])
+
+    def test_filearchive_spool_removed_on_delete(self):
+        archive = FileArchive(exporters=[Serializer], spool=True)
+        archive.add(filename='a.pkl', data=Serializer(self.image1)[0],
+                    info={'mime_type': 'application/python-pickle'})
+        spool_dir = archive._spool_dir
+        del archive
+        self.assertFalse(os.path.isdir(spool_dir))
@@ -5,7 +5,7 @@ from unittest import SkipTest
 import numpy as np
 from holoviews.core.data import Dataset
 from holoviews.core.options import Store
-from holoviews.element import Graph, TriMesh, circular_layout
+from holoviews.element import Graph, Nodes, TriMesh, circular_layout
 from holoviews.element.comparison import ComparisonTestCase
 from holoviews.plotting import comms
 
@@ -54,6 +54,25 @@ class BokehGraphPlotTests(ComparisonTestCase):
         layout = {str(int(z)): (x, y) for x, y, z in self.graph.nodes.array()}
         self.assertEqual(layout_source.graph_layout, layout)
 
+    def test_plot_graph_with_string_node_ids(self):
+        nodes = Nodes(([0, 1, 2, 3], [0, 1, 0, 1], ['c', 'a', 'b', 'a']))
+        graph = Graph(((['a', 'b', 'c', 'z'], ['b', 'c', 'a', 'a']), nodes))
+        plot = bokeh_renderer.get_plot(graph)
+        node_source = plot.handles['scatter_1_source']
+        edge_source = plot.handles['multi_line_1_source']
+        layout_source = plot.handles['layout_source']
+        self.assertEqual(node_source.data['index'], np.array([0, 3, 2, 3]))
+        self.assertEqual(edge_source.data['start'], np.array([3, 2, 0, 4]))
+        self.assertEqual(edge_source.data['end'], np.array([2, 0, 3, 3]))
+        self.assertEqual(layout_source.graph_layout,
+                         {'0': (0, 0), '2': (2, 0), '3': (3, 1)})
+
+    def test_plot_graph_node_layout_cached(self):
+        plot = bokeh_renderer.get_plot(self.graph)
+        layout = plot._node_cache['layout']
+        plot.update(0)
+        self.assertIs(plot._node_cache['layout'], layout)
+
     def test_plot_graph_with_paths(self):
         graph = self.graph.clone((self.graph.data, self.graph.nodes, self.graph.edgepaths))
         plot = bokeh_renderer.get_plot(graph)
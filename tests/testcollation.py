@@ -4,7 +4,8 @@ Test cases for Collator
 import itertools
 import numpy as np
 
-from holoviews.core import Collator, HoloMap, NdOverlay, Overlay, GridSpace
+from holoviews.core import (Collator, HoloMap, NdOverlay, Overlay, GridSpace,
+                            DynamicMap)
 from holoviews.element import Curve
 from holoviews.element.comparison import ComparisonTestCase
 
@@ -67,6 +68,51 @@ class TestCollation(ComparisonTestCase):
         self.assertEqual(repr(collated), repr(layout))
         self.assertEqual(collated.dimensions(), layout.dimensions())
 
+    def test_collate_layout_overlay_parallel(self):
+        collated = Collator(kdims=['alpha', 'beta'], processes=4)
+        serial = Collator(kdims=['alpha', 'beta'])
+        for k, v in self.nested_overlay.items():
+            collated[k] = v + v
+            serial[k] = v + v
+        self.assertEqual(repr(collated()), repr(serial()))
+
+    def test_collate_streaming(self):
+        loaded = []
+        def transform(vargs):
+            loaded.append(vargs['value'])
+            return Curve(np.arange(10)*vargs['value'])
+        collator = Collator({(i,): (i,) for i in range(3)}, kdims=['A'],
+                            vdims=['value'], value_transform=transform,
+                            streaming=True, cache_size=2)
+        dmap = collator()
+        self.assertIsInstance(dmap, DynamicMap)
+        self.assertEqual(dmap.kdims[0].values, [0, 1, 2])
+        self.assertEqual(loaded, [])
+        self.assertEqual(dmap[2], Curve(np.arange(10)*2))
+        self.assertEqual(loaded, [2])
+
+    def test_collate_streaming_drop_dimensions(self):
+        collator = Collator({(i, 0, i*2): Curve(np.arange(10)*i) for i in range(3)},
+                            kdims=['A', 'B', 'C'], drop=['C'], drop_constant=True,
+                            streaming=True)
+        dmap = collator()
+        eager = collator.clone(streaming=False)()
+        self.assertEqual([kd.name for kd in dmap.kdims], [kd.name for kd in eager.kdims])
+        self.assertEqual(dmap.cdims, eager.cdims)
+        self.assertEqual(dmap[1], eager[1])
+
+    def test_collate_streaming_holomap_values_error(self):
+        collator = Collator({(i,): HoloMap({0: Curve(np.arange(10)*i)})
+                             for i in range(3)}, kdims=['A'], streaming=True)
+        dmap = collator()
+        with self.assertRaises(ValueError):
+            dmap[1]
+
+    def test_collate_streaming_ndoverlay_merge_type(self):
+        collator = Collator({(i,): Curve(np.arange(10)*i) for i in range(3)},
+                            kdims=['A'], merge_type=NdOverlay, streaming=True)
+        self.assertEqual(collator(), collator.clone(streaming=False)())
+
     def test_overlay_hmap_collate(self):
         hmap = HoloMap({i: Curve(np.arange(10)*i) for i in range(3)})
         overlaid = Overlay([hmap, hmap, hmap]).collate()
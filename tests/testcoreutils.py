@@ -17,7 +17,7 @@ except:
 from holoviews.core.util import (
     sanitize_identifier_fn, find_range, max_range, wrap_tuple_streams,
     deephash, merge_dimensions, get_path, make_path_unique, compute_density,
-    date_range, dt_to_int, compute_edges
+    date_range, dt_to_int, compute_edges, isin
 )
 from holoviews import Dimension, Element
 from holoviews.streams import PointerXY
@@ -614,3 +614,27 @@ class TestComputeEdges(ComparisonTestCase):
     def test_uneven_edges(self):
         self.assertEqual(compute_edges(self.array3),
                          np.array([0.5, 1.5, 3.0, 5.0]))
+
+
+class TestIsIn(ComparisonTestCase):
+    """
+    Tests for isin function.
+    """
+
+    def test_isin_numeric(self):
+        self.assertEqual(isin(np.arange(5), [1, 3, 7]),
+                         np.array([False, True, False, True, False]))
+
+    def test_isin_strings(self):
+        values = np.array(['A', 'B', 'C', 'A'], dtype=object)
+        self.assertEqual(isin(values, {'A', 'C'}),
+                         np.array([True, False, True, True]))
+
+    def test_isin_empty_elements(self):
+        self.assertEqual(isin(np.arange(3), []),
+                         np.array([False, False, False]))
+
+    def test_isin_mixed_types(self):
+        values = np.array([None, 'A', 1], dtype=object)
+        self.assertEqual(isin(values, ['A', 1]),
+                         np.array([False, True, True]))
@@ -2,14 +2,19 @@
 Tests for the Dataset Element types.
 """
 
+import os
+import shutil
+import tempfile
 from unittest import SkipTest
 from nose.plugins.attrib import attr
 from itertools import product
 
 import numpy as np
 from holoviews import Dataset, HoloMap, Dimension, Image
-from holoviews.core.data.interface import DataError
-from holoviews.element import Distribution, Points, Scatter
+from holoviews.core.data.interface import DataError, Interface
+from holoviews.core.data.array import ArrayInterface
+from holoviews.core.data.dictionary import DictInterface
+from holoviews.element import Curve, Distribution, Points, Scatter
 from holoviews.element.comparison import ComparisonTestCase
 
 from collections import OrderedDict
@@ -25,6 +30,12 @@ try:
 except:
     dd = None
 
+try:
+    import pyarrow as pa
+    from holoviews.core.data.arrow import ArrowInterface
+except:
+    pa = None
+
 
 class DatatypeContext(object):
 
@@ -993,6 +1004,85 @@ class DaskDatasetTest(DFDatasetTest):
         raise SkipTest("Not supported")
 
 
+class ArrowDatasetTest(HeterogeneousColumnTypes, ComparisonTestCase):
+    """
+    Test of the Apache Arrow ArrowDataset interface.
+    """
+
+    datatype = 'arrow'
+
+    def setUp(self):
+        if pa is None:
+            raise SkipTest("pyarrow not available")
+        self.restore_datatype = Dataset.datatype
+        Dataset.datatype = [self.datatype]
+        self.data_instance_type = pa.Table
+        self.init_column_data()
+
+    def test_dataset_arrow_table_init(self):
+        table = pa.Table.from_arrays([pa.array([1, 2, 3]), pa.array([4., 5., 6.])],
+                                     ['x', 'y'])
+        ds = Dataset(table, kdims=['x'])
+        self.assertIs(ds.data, table)
+        self.assertEqual(ds.vdims, [Dimension('y')])
+
+    def test_dataset_arrow_zero_copy_values(self):
+        table = pa.Table.from_arrays([pa.array(np.arange(10.))], ['x'])
+        ds = Dataset(table, kdims=['x'])
+        values = ds.dimension_values('x')
+        self.assertFalse(values.flags.writeable)
+        self.assertEqual(values, np.arange(10.))
+
+    def test_dataset_arrow_dictionary_encoded_values(self):
+        labels = pa.array(['A', 'B', 'A', 'C']).dictionary_encode()
+        table = pa.Table.from_arrays([labels, pa.array([1, 2, 3, 4])], ['x', 'y'])
+        ds = Dataset(table, kdims=['x'], vdims=['y'])
+        self.assertEqual(ds.dimension_values('x'), np.array(['A', 'B', 'A', 'C'], dtype=object))
+        self.assertEqual(ds.select(x=['A', 'C']).dimension_values('y'), np.array([1, 3, 4]))
+
+    def test_dataset_arrow_groupby_first_appearance_order(self):
+        ds = Dataset((['B', 'A', 'B', 'A'], [1, 2, 3, 4]), kdims=['x'], vdims=['y'])
+        grouped = ds.groupby('x', container_type=list)
+        self.assertEqual([k for k, _ in grouped], ['B', 'A'])
+        self.assertEqual(grouped[0][1].dimension_values('y'), np.array([1, 3]))
+
+    def test_dataset_arrow_aggregate_sorted_groups(self):
+        ds = Dataset((['B', 'A', 'C', 'A', 'B'], [1, 2, 3, 4, 5]),
+                     kdims=['x'], vdims=['y'])
+        for function in [np.mean, lambda x: x.mean()]:
+            aggregated = ds.aggregate('x', function)
+            self.assertEqual(aggregated.dimension_values('x'),
+                             np.array(['A', 'B', 'C'], dtype=object))
+            self.assertEqual(aggregated.dimension_values('y'), np.array([3., 3., 3.]))
+
+    def test_dataset_arrow_from_ipc(self):
+        table = pa.Table.from_arrays([pa.array([1, 2, 3]), pa.array([4., 5., 6.])],
+                                     ['x', 'y'])
+        path = os.path.join(tempfile.mkdtemp(), 'test.arrow')
+        with pa.OSFile(path, 'wb') as sink:
+            with pa.ipc.new_file(sink, table.schema) as writer:
+                writer.write_table(table)
+        loaded = ArrowInterface.from_ipc(path)
+        self.assertTrue(loaded.equals(table))
+        ds = Dataset(loaded, kdims=['x'], vdims=['y'])
+        self.assertEqual(ds.dimension_values('y'), np.array([4., 5., 6.]))
+
+    def test_dataset_arrow_from_parquet_selection(self):
+        try:
+            import pyarrow.parquet as pq
+        except ImportError:
+            raise SkipTest("pyarrow.parquet not available")
+        table = pa.Table.from_arrays([pa.array(np.arange(10)), pa.array(np.arange(10.)*2),
+                                      pa.array(list('ABABABABAB'))], ['x', 'y', 'z'])
+        path = os.path.join(tempfile.mkdtemp(), 'test.parquet')
+        pq.write_table(table, path)
+        loaded = ArrowInterface.from_parquet(path, columns=['x', 'y'], x=(2, 5))
+        self.assertEqual(loaded.column_names, ['x', 'y'])
+        self.assertEqual(ArrowInterface.to_numpy(loaded.column('x')), np.array([2, 3, 4]))
+        loaded = ArrowInterface.from_parquet(path, z=['A'])
+        self.assertEqual(ArrowInterface.to_numpy(loaded.column('x')), np.arange(0, 10, 2))
+
+
 class DictDatasetTest(HeterogeneousColumnTypes, ScalarColumnTypes, ComparisonTestCase):
     """
     Test of the generic dictionary interface.
@@ -1290,6 +1380,50 @@ class GridDatasetTest(GridTests, HomogeneousColumnTypes, ComparisonTestCase):
     def test_dataset_sort_reverse_hm(self):
         raise SkipTest("Not supported")
 
+    def test_dataset_memmap_select_returns_view(self):
+        tmp = tempfile.mkdtemp()
+        path = os.path.join(tmp, 'zs.npy')
+        np.save(path, np.arange(20.).reshape(4, 5))
+        zs = np.load(path, mmap_mode='r')
+        ds = Dataset((np.arange(5), np.arange(4), zs), kdims=['x', 'y'], vdims=['z'])
+        self.assertIs(ds.data['z'], zs)
+        selected = ds.select(x=(1, 3), y=(1, 3))
+        self.assertTrue(np.shares_memory(selected.data['z'], zs))
+        self.assertEqual(selected.data['z'], np.array([[6., 7.], [11., 12.]]))
+        del zs, ds, selected
+        shutil.rmtree(tmp)
+
+    def test_dataset_npz_init_loads_dimensions(self):
+        tmp = tempfile.mkdtemp()
+        path = os.path.join(tmp, 'grid.npz')
+        np.savez(path, x=self.grid_xs, y=self.grid_ys, z=self.grid_zs,
+                 unused=np.zeros(3))
+        with np.load(path) as npz:
+            ds = Dataset(npz, kdims=['x', 'y'], vdims=['z'])
+        self.assertEqual(sorted(ds.data), ['x', 'y', 'z'])
+        self.assertIsInstance(ds.data['z'], np.memmap)
+        self.assertEqual(ds, self.dataset_grid)
+        del ds
+        shutil.rmtree(tmp)
+
+    def test_dataset_npz_compressed_init(self):
+        tmp = tempfile.mkdtemp()
+        path = os.path.join(tmp, 'grid.npz')
+        np.savez_compressed(path, x=self.grid_xs, y=self.grid_ys, z=self.grid_zs)
+        with np.load(path) as npz:
+            ds = Dataset(npz, kdims=['x', 'y'], vdims=['z'])
+        self.assertNotIsInstance(ds.data['z'], np.memmap)
+        self.assertEqual(ds, self.dataset_grid)
+        shutil.rmtree(tmp)
+
+    def test_dataset_1d_values_do_not_alias_data(self):
+        zs = np.arange(5.)
+        ds = Dataset((np.arange(5), zs), kdims=['x'], vdims=['z'],
+                     datatype=['grid'])
+        values = ds.dimension_values('z', flat=False)
+        values[0] = 10
+        self.assertEqual(zs[0], 0)
+
     def test_dataset_sort_vdim_hm(self):
         exception = ('Compressed format cannot be sorted, either instantiate '
                      'in the desired order or use the expanded format.')
@@ -1450,6 +1584,15 @@ class IrisDatasetTest(GridDatasetTest):
         self.init_column_data()
         self.init_grid_data()
 
+    def test_dataset_memmap_select_returns_view(self):
+        raise SkipTest("Not supported")
+
+    def test_dataset_npz_init_loads_dimensions(self):
+        raise SkipTest("Not supported")
+
+    def test_dataset_npz_compressed_init(self):
+        raise SkipTest("Not supported")
+
     def test_dataset_array_init_hm(self):
         "Tests support for arrays (homogeneous)"
         raise SkipTest("Not supported")
@@ -1527,6 +1670,15 @@ class XArrayDatasetTest(GridDatasetTest):
         self.init_column_data()
         self.init_grid_data()
 
+    def test_dataset_memmap_select_returns_view(self):
+        raise SkipTest("Not supported")
+
+    def test_dataset_npz_init_loads_dimensions(self):
+        raise SkipTest("Not supported")
+
+    def test_dataset_npz_compressed_init(self):
+        raise SkipTest("Not supported")
+
     def test_xarray_dataset_with_scalar_dim_canonicalize(self):
         import xarray as xr
         xs = [0, 1]
@@ -1648,3 +1800,206 @@ class RasterDatasetTest(GridTests, ComparisonTestCase):
                               [ 0.06925999,  0.05800389,  0.05620127]])
         self.assertEqual(dataset.dimension_values('z', flat=False),
                          canonical)
+
+
+class LazyDatasetTest(ComparisonTestCase):
+    """
+    Tests for the LazyDataset query plan.
+    """
+
+    def setUp(self):
+        self.restore_datatype = Dataset.datatype
+        Dataset.datatype = ['dictionary']
+        xs = np.arange(10)
+        self.dataset = Dataset((xs, xs % 3, xs[::-1], xs*2.),
+                               kdims=['x', 'g', 't'], vdims=['y'])
+
+    def tearDown(self):
+        Dataset.datatype = self.restore_datatype
+
+    def test_lazy_does_not_execute_until_requested(self):
+        lazy = self.dataset.lazy.select(x=(2, 8)).sort('t')
+        self.assertEqual(lazy._executed, None)
+        self.assertEqual(len(lazy.plan), 2)
+
+    def test_lazy_select_sort_matches_eager(self):
+        lazy = self.dataset.lazy.sort('t').select(x=(2, 8))
+        eager = self.dataset.sort('t').select(x=(2, 8))
+        self.assertEqual(lazy.execute(), eager)
+
+    def test_lazy_select_pushed_before_sort(self):
+        plan = self.dataset.lazy.sort('t').select(x=(2, 8)).optimize()
+        self.assertEqual([op for op, _, _ in plan], ['select', 'sort'])
+
+    def test_lazy_merge_range_selections(self):
+        plan = self.dataset.lazy.select(x=(0, 8)).select(x=(2, 10)).optimize()
+        self.assertEqual(len(plan), 1)
+        self.assertEqual(plan[0][2], {'x': slice(2, 8)})
+
+    def test_lazy_does_not_merge_scalar_selections(self):
+        plan = self.dataset.lazy.select(x=(0, 8)).select(g=1).optimize()
+        self.assertEqual([op for op, _, _ in plan], ['select', 'select'])
+
+    def test_lazy_aggregate_projects_unused_kdims(self):
+        lazy = self.dataset.lazy.select(x=(0, 8)).aggregate('g', np.mean)
+        plan = lazy.optimize()
+        self.assertEqual(plan[0], ('reindex', ([Dimension('x'), Dimension('g')], None), {}))
+        eager = self.dataset.select(x=(0, 8)).aggregate('g', np.mean)
+        self.assertEqual(lazy.execute(), eager)
+
+    def test_lazy_dimension_values(self):
+        lazy = self.dataset.lazy.select(g=[0, 1]).sort('t')
+        eager = self.dataset.select(g=[0, 1]).sort('t')
+        self.assertEqual(lazy.dimension_values('y'), eager.dimension_values('y'))
+
+    def test_lazy_select_sort_fused(self):
+        lazy = self.dataset.lazy.sort('t').select(x=(2, 8)).select(g=[0, 1])
+        plan = lazy.optimize()
+        self.assertEqual(len(lazy._fusable(self.dataset, plan)), 2)
+        eager = self.dataset.select(x=(2, 8), g=[0, 1]).sort('t')
+        self.assertEqual(lazy.execute(), eager)
+
+    def test_lazy_select_sort_fused_reverse_multiple(self):
+        lazy = self.dataset.lazy.select(x=(1, 9)).sort(['g', 't'], reverse=True)
+        eager = self.dataset.select(x=(1, 9)).sort(['g', 't'], reverse=True)
+        self.assertEqual(lazy.execute(), eager)
+
+    def test_lazy_select_sort_fused_array(self):
+        dataset = self.dataset.clone(datatype=['array'])
+        lazy = dataset.lazy.select(g=[1, 2]).sort('t')
+        self.assertEqual(lazy.execute(), dataset.select(g=[1, 2]).sort('t'))
+
+    def test_lazy_scalar_selection_not_fused(self):
+        plan = self.dataset.lazy.select(g=1).sort('t').optimize()
+        self.assertEqual(self.dataset.lazy._fusable(self.dataset, plan), [])
+
+    def test_lazy_element_construction_executes(self):
+        lazy = self.dataset.lazy.select(x=(2, 8)).sort('t')
+        curve = Curve(lazy, 't', 'y')
+        self.assertEqual(curve, Curve(self.dataset.select(x=(2, 8)).sort('t'), 't', 'y'))
+
+
+class DatasetConstructionTest(ComparisonTestCase):
+    """
+    Tests for the trusted constructor used by clone, select, sort and
+    groupby.
+    """
+
+    def setUp(self):
+        xs = np.arange(10)
+        self.dataset = Dataset({'x': xs, 'g': xs % 3, 'y': xs*2.},
+                               kdims=['x', 'g'], vdims=['y'], label='A')
+
+    def test_clone_shares_data_and_params(self):
+        clone = self.dataset.clone()
+        self.assertIs(clone.data, self.dataset.data)
+        self.assertIs(clone.interface, self.dataset.interface)
+        self.assertEqual(clone.kdims, self.dataset.kdims)
+        self.assertEqual(clone.label, 'A')
+        self.assertEqual(clone.ndims, 2)
+        self.assertEqual(clone._plot_id, self.dataset._plot_id)
+        self.assertEqual(clone, self.dataset)
+
+    def test_clone_relabel(self):
+        clone = self.dataset.relabel('B', group='Group')
+        self.assertEqual((clone.group, clone.label), ('Group', 'B'))
+        self.assertEqual(self.dataset.label, 'A')
+
+    def test_clone_redim(self):
+        clone = self.dataset.clone()
+        self.assertEqual(clone.redim(y='z').vdims, [Dimension('z')])
+
+    def test_clone_kdims_override_validated(self):
+        with self.assertRaises(Exception):
+            self.dataset.clone(kdims=['x', 'missing'])
+
+    def test_clone_does_not_alias_dimensions(self):
+        clone = self.dataset.clone()
+        self.assertIsNot(clone.kdims, self.dataset.kdims)
+        self.assertIsNot(clone.vdims, self.dataset.vdims)
+        self.assertIsNot(clone.cdims, self.dataset.cdims)
+        clone.kdims.append(Dimension('z'))
+        self.assertEqual(self.dataset.kdims, [Dimension('x'), Dimension('g')])
+
+    def test_construct_unique_names(self):
+        params = {'kdims': self.dataset.kdims, 'vdims': self.dataset.vdims}
+        first = Dataset._construct(self.dataset.data, self.dataset.interface, params)
+        second = Dataset._construct(self.dataset.data, self.dataset.interface, params)
+        self.assertNotEqual(first.name, second.name)
+
+    def test_construct_custom_init_unsupported(self):
+        self.assertIs(Image._construct({}, DictInterface, {}), None)
+
+    def test_select_matches_constructor(self):
+        selected = self.dataset.select(g=1)
+        expected = Dataset({'x': np.array([1, 4, 7]), 'g': np.array([1, 1, 1]),
+                            'y': np.array([2., 8., 14.])},
+                           kdims=['x', 'g'], vdims=['y'], label='A')
+        self.assertEqual(selected, expected)
+
+    def test_groupby_matches_constructor(self):
+        grouped = self.dataset.groupby('g')
+        group = grouped[1]
+        self.assertIs(group.interface, self.dataset.interface)
+        self.assertEqual(group.kdims, [Dimension('x')])
+        self.assertEqual(group, Dataset({'x': np.array([1, 4, 7]), 'y': np.array([2., 8., 14.])},
+                                        kdims=['x'], vdims=['y'], label='A'))
+
+    def test_groupby_to_element(self):
+        curves = self.dataset.to(Curve, 'x', 'y', 'g')
+        self.assertIsInstance(curves[0], Curve)
+        self.assertEqual(curves[0].dimension_values('y'), np.array([0., 6., 12., 18.]))
+
+
+class InterfaceDispatchTest(ComparisonTestCase):
+    """
+    Tests for the cached interface dispatch in Interface.initialize.
+    """
+
+    def setUp(self):
+        self.restore_datatype = Dataset.datatype
+        Dataset.datatype = ['array', 'dictionary']
+        Interface._dispatch.clear()
+
+    def tearDown(self):
+        Dataset.datatype = self.restore_datatype
+        Interface._dispatch.clear()
+
+    def test_applies(self):
+        self.assertTrue(DictInterface.applies({'x': np.arange(3)}))
+        self.assertFalse(DictInterface.applies((np.arange(3),)))
+
+    def test_signature_distinguishes_dtypes(self):
+        numeric = Interface.signature((np.arange(3), np.arange(3)))
+        strings = Interface.signature((np.array(['a', 'b', 'c']), np.arange(3)))
+        self.assertNotEqual(numeric, strings)
+
+    def test_signature_distinguishes_rows(self):
+        numeric = Interface.signature([(0, 1), (1, 2)])
+        strings = Interface.signature([('a', 1), ('b', 2)])
+        self.assertNotEqual(numeric, strings)
+
+    def test_dispatch_cached(self):
+        data = (np.array(['a', 'b', 'c']), np.arange(3))
+        ds = Dataset(data, kdims=['x'], vdims=['y'])
+        self.assertIs(ds.interface, DictInterface)
+        key = (Dataset, ('array', 'dictionary'), (1, 1), Interface.signature(data))
+        self.assertEqual(Interface._dispatch[key], 1)
+        cached = Dataset((np.array(['d', 'e']), np.arange(2)), kdims=['x'], vdims=['y'])
+        self.assertIs(cached.interface, DictInterface)
+        self.assertEqual(cached.dimension_values('x'), np.array(['d', 'e']))
+
+    def test_dispatch_independent_of_history(self):
+        mixed = Dataset(([1, 'a', 3], [1, 2, 3]), kdims=['x'], vdims=['y'])
+        self.assertIs(mixed.interface, DictInterface)
+        numeric = Dataset(([1, 2, 3], [1, 2, 3]), kdims=['x'], vdims=['y'])
+        self.assertIs(numeric.interface, ArrayInterface)
+
+    def test_dispatch_not_cached_for_applicable_interface(self):
+        Dataset({'x': np.arange(3), 'y': np.arange(3)}, kdims=['x'], vdims=['y'])
+        self.assertEqual(len(Interface._dispatch), 0)
+
+    def test_dispatch_cleared_on_register(self):
+        Dataset((np.array(['a', 'b']), np.arange(2)), kdims=['x'], vdims=['y'])
+        Interface.register(DictInterface)
+        self.assertEqual(len(Interface._dispatch), 0)
@@ -6,6 +6,7 @@ from holoviews import (Dimension, Dataset, Curve, Path, Histogram,
                        BoxWhisker, Raster, Image, QuadMesh, RGB,
                        Graph, TriMesh)
 from holoviews.element.comparison import ComparisonTestCase
+from holoviews.element.util import categorical_aggregate2d
 
 class ElementConstructorTest(ComparisonTestCase):
     """
@@ -91,6 +92,20 @@ class ElementConstructorTest(ComparisonTestCase):
                           kdims=['x', 'y'], vdims=['z'])
         self.assertEqual(hmap.gridded, dataset)
 
+    def test_heatmap_construct_first_value(self):
+        hmap = HeatMap([('A', 'a', np.NaN), ('A', 'a', 1), ('B', 'b', 2), ('A', 'a', 3)])
+        self.assertEqual(hmap.gridded.dimension_values(2, flat=False),
+                         np.array([[1, np.NaN], [np.NaN, 2]]))
+
+    def test_heatmap_sparse_aggregate(self):
+        hmap = HeatMap([('B', 'b', 2), ('A', 'c', 1), ('B', 'a', 3)])
+        sparse = categorical_aggregate2d(hmap, sparse=True)
+        self.assertEqual(sparse.dimension_values(0), np.array(['B', 'B', 'A']))
+        self.assertEqual(sparse.dimension_values(1), np.array(['b', 'a', 'c']))
+        self.assertEqual(sparse.dimension_values(2), np.array([2., 3., 1.]))
+        self.assertEqual(sparse.kdims[0].values, ['B', 'A'])
+        self.assertEqual(sparse.kdims[1].values, ['b', 'c', 'a'])
+
 
 
 class ElementSignatureTest(ComparisonTestCase):
@@ -166,6 +166,13 @@ class TriMeshTests(ComparisonTestCase):
         for p1, p2 in zip(trimesh.edgepaths.split(datatype='array'), paths):
             self.assertEqual(p1, p2)
 
+    def test_trimesh_edgepaths_buffer(self):
+        trimesh = TriMesh((self.simplices, self.nodes))
+        paths = trimesh.edgepaths
+        self.assertEqual(len(paths.data), 1)
+        self.assertEqual(paths.array().shape, (len(self.simplices)*5-1, 2))
+        self.assertIs(trimesh._triangles(), trimesh._triangles())
+
     def test_trimesh_select(self):
         trimesh = TriMesh((self.simplices, self.nodes)).select(x=(0.1, None))
         self.assertEqual(trimesh.array(), np.array(self.simplices[1:]))
@@ -1,3 +1,6 @@
+import os
+import shutil
+import tempfile
 import datetime as dt
 from unittest import SkipTest
 from nose.plugins.attrib import attr
@@ -161,6 +164,19 @@ class ImageInterfaceTest(ComparisonTestCase):
         self.assertEqual(sliced.dimension_values(2, flat=False),
                          self.array[1:5, 6:7])
 
+    def test_slice_memmap_returns_view(self):
+        tmp = tempfile.mkdtemp()
+        path = os.path.join(tmp, 'array.npy')
+        np.save(path, np.flipud(self.array).astype('float64'))
+        array = np.load(path, mmap_mode='r')
+        image = Image(array, bounds=(-10, 0, 10, 10))
+        sliced = image[-2:2, 1:5]
+        self.assertTrue(np.shares_memory(sliced.data, array))
+        self.assertEqual(sliced.dimension_values(2, flat=False),
+                         self.array[1:5, 4:6])
+        del array, image, sliced
+        shutil.rmtree(tmp)
+
     def test_range_xdim(self):
         self.assertEqual(self.image.range(0), (-10, 10))
 
@@ -279,6 +295,9 @@ class ImageGridInterfaceTest(ImageInterfaceTest):
         self.image = Image((self.xs, self.ys, self.array))
         self.image_inv = Image((self.xs[::-1], self.ys[::-1], self.array[::-1, ::-1]))
 
+    def test_slice_memmap_returns_view(self):
+        raise SkipTest("Not supported")
+
     def test_init_data_datetime_xaxis(self):
         start = np.datetime64(dt.datetime.today())
         end = start+np.timedelta64(1, 's')
@@ -3,8 +3,10 @@ Unit test of the (non-rendering) exporters and importers.
 """
 
 import os
+import zipfile
 import numpy as np
-from holoviews import Image, Layout
+from holoviews import Image, Layout, HoloMap, DynamicMap
+from holoviews.core import NdMapping
 from holoviews.core.io import Serializer, Pickler, Unpickler, Deserializer
 from holoviews.element.comparison import ComparisonTestCase
 
@@ -187,3 +189,121 @@ class TestPicklerAdvanced(ComparisonTestCase):
                                 entries=['Image.I(L)'])
         self.assertEqual(single_layout, loaded)
 
+
+
+class TestPicklerFrames(ComparisonTestCase):
+    """
+    Test that HoloMap frames are stored as separate entries and may be
+    loaded lazily.
+    """
+
+    def setUp(self):
+        self.hmap = HoloMap({i: Image(np.arange(4*(i+1)).reshape(2, 2*(i+1)))
+                             for i in range(3)}, kdims=['A'])
+
+    def tearDown(self):
+        for f in os.listdir('.'):
+            if f.endswith('.hvz'):
+                os.remove(f)
+
+    def test_pickler_save_holomap_frame_entries(self):
+        Pickler.save(self.hmap, 'test_pickler_save_holomap_frame_entries')
+        with zipfile.ZipFile('test_pickler_save_holomap_frame_entries.hvz') as f:
+            names = f.namelist()
+            self.assertEqual(f.getinfo('HoloMap./0.npy').compress_type,
+                             zipfile.ZIP_DEFLATED)
+        for i in range(3):
+            self.assertIn('HoloMap./%d' % i, names)
+            self.assertIn('HoloMap./%d.npy' % i, names)
+        self.assertIn('version', names)
+        entries = Unpickler.entries('test_pickler_save_holomap_frame_entries.hvz')
+        self.assertEqual(entries, ['HoloMap.'])
+
+    def test_pickler_save_does_not_modify_frames(self):
+        data = [frame.data for frame in self.hmap]
+        Pickler.save(self.hmap, 'test_pickler_save_does_not_modify_frames')
+        for frame, array in zip(self.hmap, data):
+            self.assertIs(frame.data, array)
+
+    def test_pickler_load_holomap_lazy(self):
+        Pickler.save(self.hmap, 'test_pickler_load_holomap_lazy')
+        loaded = Unpickler.instance(lazy=True).load('test_pickler_load_holomap_lazy.hvz')
+        self.assertIsInstance(loaded, DynamicMap)
+        self.assertEqual(loaded.kdims[0].values, [0, 1, 2])
+        self.assertEqual(loaded[1], self.hmap[1])
+        self.assertEqual(list(loaded.data.keys()), [(1,)])
+
+    def test_pickler_load_holomap_lazy_opens_archive_once(self):
+        Pickler.save(self.hmap, 'test_pickler_load_holomap_lazy_opens_archive_once')
+        loaded = Unpickler.load('test_pickler_load_holomap_lazy_opens_archive_once.hvz',
+                                lazy=True)
+        opened = []
+        class ZipFile(zipfile.ZipFile):
+            def __init__(self, *args, **kwargs):
+                opened.append(args)
+                super(ZipFile, self).__init__(*args, **kwargs)
+        original, zipfile.ZipFile = zipfile.ZipFile, ZipFile
+        try:
+            self.assertEqual(loaded[0], self.hmap[0])
+            self.assertEqual(loaded[2], self.hmap[2])
+        finally:
+            zipfile.ZipFile = original
+        self.assertEqual(len(opened), 1)
+
+    def test_pickler_load_holomap_eager(self):
+        Pickler.save(self.hmap, 'test_pickler_load_holomap_eager')
+        loaded = Unpickler.load('test_pickler_load_holomap_eager.hvz')
+        self.assertIsInstance(loaded, HoloMap)
+        self.assertEqual(loaded, self.hmap)
+
+
+
+class TestUnpicklerCollect(ComparisonTestCase):
+    """
+    Test collecting a set of .hvz files into a Layout of Collators.
+    """
+
+    def setUp(self):
+        self.images = [Image(np.array([[i, 2], [4, 5]]), label='Test')
+                       for i in range(3)]
+        self.files = NdMapping(kdims=['Run'])
+        for i, img in enumerate(self.images):
+            fname = 'test_collect_%d.hvz' % i
+            Pickler.save(img, fname, key={'Seed': i*10})
+            self.files[i] = fname
+
+    def tearDown(self):
+        for f in os.listdir('.'):
+            if f.endswith('.hvz') or f.endswith('.sqlite'):
+                os.remove(f)
+
+    def test_unpickler_scan(self):
+        scanned = Unpickler.scan('test_collect_0.hvz')
+        self.assertEqual(scanned['key'], {'Seed': 0})
+        self.assertEqual(scanned['entries'], ['Image.Test'])
+
+    def test_unpickler_collect_keys(self):
+        collated = Unpickler.collect(self.files)
+        collator = collated['Image', 'Test']
+        self.assertEqual([kd.name for kd in collator.kdims], ['Run', 'Seed'])
+        self.assertEqual(collator.keys(), [(0, 0), (1, 10), (2, 20)])
+
+    def test_unpickler_collect_load(self):
+        hmap = Unpickler.collect(self.files)['Image', 'Test']()
+        self.assertEqual(hmap[10, 1], self.images[1])
+
+    def test_unpickler_collect_load_holomaps_lazy(self):
+        for i, img in enumerate(self.images):
+            hmap = HoloMap({j: img.clone(img.data*j) for j in range(2)},
+                           kdims=['Frame'], label='Test')
+            Pickler.save(hmap, 'test_collect_%d.hvz' % i, key={'Seed': i*10})
+        collator = Unpickler.instance(lazy=True).collect(self.files)['HoloMap', 'Test']
+        hmap = collator()
+        self.assertEqual(hmap[1, 10, 1], self.images[1].clone(self.images[1].data))
+
+    def test_unpickler_collect_index_incremental(self):
+        Unpickler.collect(self.files, index='test_collect.sqlite')
+        Pickler.save(self.images[2], 'test_collect_2.hvz', key={'Seed': 30})
+        os.utime('test_collect_2.hvz', (0, 0))
+        collator = Unpickler.collect(self.files, index='test_collect.sqlite')['Image', 'Test']
+        self.assertEqual(collator.keys(), [(0, 0), (1, 10), (2, 30)])
@@ -0,0 +1,27 @@
+import sys
+from unittest import SkipTest
+
+from holoviews.element.comparison import ComparisonTestCase
+from holoviews.importprofile import ImportProfiler
+
+
+class ImportProfilerTest(ComparisonTestCase):
+
+    def setUp(self):
+        if sys.version_info < (3, 4):
+            raise SkipTest('Import profiling requires Python >= 3.4')
+        if 'wsgiref.headers' in sys.modules:
+            raise SkipTest('Profiled module already imported')
+
+    def test_import_profiler_records_module(self):
+        profiler = ImportProfiler('wsgiref')
+        profiler.start()
+        try:
+            import wsgiref.headers # noqa (profiled import)
+        finally:
+            profiler.stop()
+        self.assertIn('wsgiref.headers', profiler.timings)
+        total, own = profiler.timings['wsgiref.headers']
+        self.assertTrue(total >= own >= 0)
+        self.assertNotIn(profiler, sys.meta_path)
+        self.assertIn('wsgiref.headers', profiler.report())
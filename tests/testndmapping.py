@@ -3,7 +3,7 @@ from collections import OrderedDict
 from holoviews.core import Dimension
 from holoviews.core.ndmapping import MultiDimensionalMapping, NdMapping
 from holoviews.element.comparison import ComparisonTestCase
-from holoviews import HoloMap, Dataset
+from holoviews import HoloMap, Dataset, Curve
 import numpy as np
 
 class DimensionTest(ComparisonTestCase):
@@ -241,3 +241,91 @@ class HoloMapTest(ComparisonTestCase):
                         for i in range(10)}, kdims=['z'])
         mapped = hmap.map(lambda x: x if x.range(1)[1] > 0 else None, Dataset)
         self.assertEqual(hmap[1:10], mapped)
+
+
+class TraversalIndexTest(ComparisonTestCase):
+
+    def setUp(self):
+        self.hmap = HoloMap({i: Curve([i, i+1], group='A' if i%2 else 'B')
+                             for i in range(4)}, kdims=['x'])
+        self.layout = self.hmap + Curve([0, 1], label='Main')
+
+    def test_traverse_order(self):
+        objs = self.layout.traverse(lambda x: x)
+        expected = [self.layout, self.hmap]+self.hmap.values()+[self.layout.Curve.Main]
+        self.assertEqual(len(objs), len(expected))
+        self.assertTrue(all(o is e for o, e in zip(objs, expected)))
+
+    def test_traverse_specs(self):
+        self.assertEqual(self.layout.traverse(lambda x: x.data[0][1], ['Curve.A']), [1, 3])
+        self.assertEqual(len(self.layout.traverse(lambda x: x, [Curve])), 5)
+        self.assertEqual(self.layout.traverse(lambda x: x.label,
+                                              [lambda x: x.label == 'Main']), ['Main'])
+
+    def test_traverse_not_full_breadth(self):
+        objs = self.layout.traverse(lambda x: x, [Curve], full_breadth=False)
+        self.assertEqual(len(objs), 1)
+        self.assertIs(objs[0], self.hmap.values()[0])
+
+    def test_traversal_index_cached(self):
+        self.assertIs(self.layout._traversal_index(), self.layout._traversal_index())
+
+    def test_traversal_index_invalidated_on_setitem(self):
+        self.layout.traverse(lambda x: x)
+        self.hmap[4] = Curve([4, 5], group='A')
+        self.assertEqual(self.layout.traverse(lambda x: x.data[0][1], ['Curve.A']), [1, 3, 4])
+
+    def test_traversal_index_invalidated_on_pop(self):
+        self.layout.traverse(lambda x: x)
+        self.hmap.pop(1)
+        self.assertEqual(self.layout.traverse(lambda x: x.data[0][1], ['Curve.A']), [3])
+
+    def test_traversal_index_invalidated_on_layout_setitem(self):
+        self.layout.traverse(lambda x: x)
+        self.layout.Curve.Extra = Curve([0, 1], group='A')
+        self.assertEqual(len(self.layout.traverse(lambda x: x, ['Curve.A'])), 3)
+
+    def test_traversal_index_invalidated_on_group_change(self):
+        self.layout.traverse(lambda x: x)
+        self.hmap.group = 'Custom'
+        self.assertEqual(self.layout.traverse(lambda x: x, ['HoloMap.Custom']), [self.hmap])
+
+    def test_traversal_index_invalidated_on_data_clear(self):
+        self.layout.traverse(lambda x: x)
+        self.hmap.data.clear()
+        self.assertEqual(self.layout.traverse(lambda x: x, ['Curve.A']), [])
+
+    def test_traversal_index_invalidated_on_layout_data_pop(self):
+        self.layout.traverse(lambda x: x)
+        self.layout.data.pop(list(self.layout.data.keys())[-1])
+        self.assertEqual(self.layout.traverse(lambda x: x.label, [Curve]), ['']*4)
+
+    def test_traversal_index_invalidated_on_data_replacement(self):
+        self.layout.traverse(lambda x: x)
+        self.hmap.data = self.hmap.data.__class__(list(self.hmap.data.items())[:2])
+        self.assertEqual(self.layout.traverse(lambda x: x.data[0][1], ['Curve.A']), [1])
+
+    def test_traversal_index_invalidated_on_data_item_replacement(self):
+        self.layout.traverse(lambda x: x)
+        self.hmap.data[(1,)] = Curve([1, 2], group='B')
+        self.assertEqual(self.layout.traverse(lambda x: x.data[0][1], ['Curve.A']), [3])
+
+    def test_traversal_index_invalidated_on_layout_data_item_replacement(self):
+        self.layout.traverse(lambda x: x)
+        key = list(self.layout.data.keys())[-1]
+        self.layout.data[key] = Curve([0, 1], group='A')
+        self.assertEqual(len(self.layout.traverse(lambda x: x, ['Curve.A'])), 3)
+
+    def test_traversal_index_not_pickled(self):
+        self.layout.traverse(lambda x: x)
+        self.assertNotIn('_index', self.hmap.__getstate__())
+
+    def test_map_preserves_order(self):
+        mapped = self.hmap.map(lambda x: x.relabel('Mapped'), [Curve])
+        self.assertEqual(mapped.keys(), self.hmap.keys())
+        self.assertEqual(mapped.traverse(lambda x: x.label, [Curve]), ['Mapped']*4)
+
+    def test_map_in_place(self):
+        self.hmap.map(lambda x: x.relabel('Mapped'), [Curve], clone=False)
+        self.assertEqual(self.hmap.keys(), [0, 1, 2, 3])
+        self.assertEqual(self.hmap.traverse(lambda x: x.label, [Curve]), ['Mapped']*4)
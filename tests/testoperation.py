@@ -2,11 +2,13 @@ import numpy as np
 from nose.plugins.attrib import attr
 
 from holoviews import (HoloMap, NdOverlay, NdLayout, GridSpace, Image,
-                       Contours, Polygons, Points, Histogram, Curve, Area)
+                       Contours, Polygons, Points, Histogram, Curve, Area,
+                       QuadMesh, Dataset, DynamicMap)
 from holoviews.element.comparison import ComparisonTestCase
 from holoviews.operation.element import (operation, transform, threshold,
                                          gradient, contours, histogram,
                                          interpolate_curve, operation)
+from holoviews.streams import Pipe
 
 class OperationTests(ComparisonTestCase):
     """
@@ -53,7 +55,6 @@ class OperationTests(ComparisonTestCase):
         op_img = gradient(img)
         self.assertEqual(op_img, img.clone(np.array([[3.162278, 3.162278], [3.162278, 3.162278]]), group='Gradient'))
 
-    @attr(optional=1) # Requires matplotlib
     def test_image_contours(self):
         img = Image(np.array([[0, 1, 0], [3, 4, 5.], [6, 7, 8]]))
         op_contours = contours(img, levels=[0.5])
@@ -62,15 +63,84 @@ class OperationTests(ComparisonTestCase):
                             vdims=img.vdims)
         self.assertEqual(op_contours, contour)
 
-    @attr(optional=1) # Requires matplotlib
     def test_image_contours_filled(self):
         img = Image(np.array([[0, 1, 0], [3, 4, 5.], [6, 7, 8]]))
         op_contours = contours(img, filled=True, levels=[2, 2.5])
-        data = [[(0., 0.333333, 2.25), (0.5, 0.3, 2.25), (0.5, 0.25, 2.25), (0., 0.25, 2.25),
-                 (-0.5, 0.08333333, 2.25), (-0.5, 0.16666667, 2.25), (0., 0.33333333, 2.25)]]
+        data = [[(-0.5, 0.16666667, 2.25), (0., 0.333333, 2.25), (0.5, 0.3, 2.25), (0.5, 0.25, 2.25),
+                 (0., 0.25, 2.25), (-0.5, 0.08333333, 2.25), (-0.5, 0.16666667, 2.25)]]
         polys = Polygons(data, vdims=img.vdims)
         self.assertEqual(op_contours, polys)
 
+    def test_image_contours_saddle(self):
+        img = Image(np.array([[0, 1.], [1, 0]]))
+        op_contours = contours(img, levels=[0.5])
+        contour = Contours([[(0.5, 0., 0.5), (0., -0.5, 0.5)],
+                            [(-0.5, 0., 0.5), (0., 0.5, 0.5)]],
+                           vdims=img.vdims)
+        self.assertEqual(op_contours, contour)
+
+    def test_image_contours_nan(self):
+        img = Image(np.array([[0, 1, np.NaN], [3, 4, 5.], [6, 7, 8]]))
+        op_contours = contours(img, levels=[0.5])
+        contour = Contours([[(-0.5, 0.416667, 0.5), (-0.25, 0.5, 0.5)]],
+                           vdims=img.vdims)
+        self.assertEqual(op_contours, contour)
+
+    def test_image_contours_nan_corner_mask(self):
+        # Cells with any NaN corner are dropped (corner_mask=False)
+        img = Image(np.array([[0, 1, np.NaN], [3, 4, 5.], [6, 7, 8]]))
+        op_contours = contours(img, levels=[2])
+        contour = Contours([[(-0.5, 0.166667, 2), (0, 0.333333, 2)]],
+                           vdims=img.vdims)
+        self.assertEqual(op_contours, contour)
+
+    def test_image_contours_filled_closed(self):
+        img = Image(np.array([[0, 1, 0], [3, 4, 5.], [6, 7, 8]]))
+        polys = contours(img, filled=True, levels=5)
+        for path in polys.split(datatype='array'):
+            self.assertEqual(path[0], path[-1])
+
+    def test_qmesh_contours(self):
+        xs, ys = np.meshgrid(np.arange(3), np.arange(3))
+        qmesh = QuadMesh((xs+ys, ys, np.array([[0, 1, 0], [3, 4, 5.], [6, 7, 8]])))
+        op_contours = contours(qmesh, levels=[0.5])
+        contour = Contours([[(0.5, 0., 0.5), (0.166667, 0.166667, 0.5)],
+                            [(2.1, 0.1, 0.5), (1.5, 0., 0.5)]],
+                           vdims=qmesh.vdims)
+        self.assertEqual(op_contours, contour)
+
+    def test_image_contours_filled_nan(self):
+        img = Image(np.array([[0, 1, np.NaN], [3, 4, 5.], [6, 7, 8]]))
+        op_contours = contours(img, filled=True, levels=[0, 10])
+        data = [[(-0.5, -0.5, 5), (-0.5, 0, 5), (-0.5, 0.5, 5), (0, 0.5, 5), (0, 0, 5),
+                 (0.5, 0, 5), (0.5, -0.5, 5), (0, -0.5, 5), (-0.5, -0.5, 5)]]
+        polys = Polygons(data, vdims=img.vdims)
+        self.assertEqual(op_contours, polys)
+
+    def test_image_contours_cached(self):
+        img = Image(np.array([[0, 1, 0], [3, 4, 5.], [6, 7, 8]]))
+        op = contours.instance(levels=[0.5])
+        self.assertIs(op._contour(img, [0.5], False), op._contour(img, [0.5], False))
+
+    def test_image_contours_cache_per_data_and_bounds(self):
+        data = np.array([[0, 1, 0], [3, 4, 5.], [6, 7, 8]])
+        img = Image(data)
+        op = contours.instance(levels=[0.5])
+        result = op._contour(img, [0.5], False)
+        self.assertIs(op._contour(Image(data.copy()), [0.5], False), result)
+        self.assertIsNot(op._contour(img.clone(bounds=(0, 0, 2, 2)), [0.5], False), result)
+        self.assertIsNone(contours.instance()._contour_cache)
+
+    def test_image_contours_cache_in_place_update(self):
+        data = np.array([[0, 1, 0], [3, 4, 5.], [6, 7, 8]])
+        img = Image(data)
+        op = contours.instance(levels=[0.5])
+        op(img)
+        img.data[0, 2] = 1
+        contour = Contours([[(-0.5, 0.416667, 0.5), (-0.25, 0.5, 0.5)]],
+                           vdims=img.vdims)
+        self.assertEqual(op(img), contour)
+
     def test_points_histogram(self):
         points = Points([float(i) for i in range(10)])
         op_hist = histogram(points, num_bins=3)
@@ -125,6 +195,49 @@ class OperationTests(ComparisonTestCase):
         hist = Histogram(([1.,  4., 7.5], [0, 3, 6, 9]), vdims=['y'])
         self.assertEqual(op_hist, hist)
 
+    def test_points_histogram_accumulate(self):
+        op = histogram.instance(num_bins=3, bin_range=(0, 9), normed=False,
+                                accumulate=True)
+        op(Points([(float(i), 0) for i in range(5)]))
+        op_hist = op(Points([(float(i), 0) for i in range(5, 10)]))
+        op_hist = op_hist.redim(x_frequency='Frequency')
+        hist = Histogram(([3, 3, 4], [0, 3, 6, 9]))
+        self.assertEqual(op_hist, hist)
+
+    def test_points_histogram_accumulate_per_source(self):
+        op = histogram.instance(num_bins=3, bin_range=(0, 9), normed=False,
+                                accumulate=True)
+        pipe1 = Pipe(data=[(float(i), 0) for i in range(5)])
+        pipe2 = Pipe(data=[(float(i), 0) for i in range(3)])
+        dmap1 = op(DynamicMap(Points, streams=[pipe1]))
+        dmap2 = op(DynamicMap(Points, streams=[pipe2]))
+        dmap1[()], dmap2[()]
+        pipe1.send([(float(i), 0) for i in range(5, 10)])
+        pipe2.send([(float(i), 0) for i in range(3, 6)])
+        hist1, hist2 = dmap1[()], dmap2[()]
+        self.assertEqual(hist1.redim(x_frequency='Frequency'),
+                         Histogram(([3, 3, 4], [0, 3, 6, 9])))
+        self.assertEqual(hist2.redim(x_frequency='Frequency'),
+                         Histogram(([3, 3, 0], [0, 3, 6, 9])))
+
+    def test_points_histogram_accumulate_groupby(self):
+        op = histogram.instance(num_bins=3, bin_range=(0, 9), normed=False,
+                                accumulate=True, dimension='x', groupby='y')
+        op(Dataset([(float(i), i % 2) for i in range(6)], kdims=['x', 'y']))
+        hists = op(Dataset([(float(i), i % 2) for i in range(6, 10)], kdims=['x', 'y']))
+        self.assertEqual(hists[0].dimension_values(1), np.array([2, 1, 2]))
+        self.assertEqual(hists[1].dimension_values(1), np.array([1, 2, 2]))
+
+    def test_points_histogram_accumulate_requires_bin_range(self):
+        with self.assertRaises(ValueError):
+            histogram(Points([0, 1, 2]), accumulate=True)
+
+    def test_points_histogram_log_mean_weighted(self):
+        points = Points([float(i) for i in range(1, 10)])
+        op_hist = histogram(points, num_bins=2, bin_range=(1, 9), log=True,
+                            weight_dimension='y', mean_weighted=True)
+        self.assertEqual(op_hist.dimension_values(1), np.array([2.5, 6.5]))
+
     def test_interpolate_curve_pre(self):
         interpolated = interpolate_curve(Curve([0, 0.5, 1]), interpolation='steps-pre')
         curve = Curve([(0, 0), (0, 0.5), (1, 0.5), (1, 1), (2, 1)])
@@ -1,8 +1,11 @@
 import os
 import pickle
+from multiprocessing.pool import ThreadPool
 import numpy as np
-from holoviews import Store, StoreOptions, Histogram, Image
-from holoviews.core.options import OptionError, Cycle, Options, OptionTree, options_policy
+from holoviews import Store, StoreOptions, Histogram, Image, Curve, Overlay
+from holoviews.core.operation import Operation
+from holoviews.core.options import (OptionError, Cycle, Options, OptionTree,
+                                    options_policy, Compositor)
 from holoviews.element.comparison import ComparisonTestCase
 from holoviews import plotting              # noqa Register backends
 from unittest import SkipTest
@@ -571,6 +574,69 @@ class TestOptionTreeFind(ComparisonTestCase):
 
 
 
+class first_curve(Operation):
+
+    def _process(self, overlay, key=None):
+        return overlay.values()[0]
+
+
+class TestCompositorMatchCache(ComparisonTestCase):
+
+    def setUp(self):
+        self.definitions = Compositor.definitions
+        Compositor.definitions = []
+        self.compositor = Compositor('Curve.A * Curve.B', first_curve,
+                                     'Collapsed', 'data')
+        Compositor.register(self.compositor)
+
+    def tearDown(self):
+        Compositor.definitions = self.definitions
+        Compositor._match_cache.clear()
+
+    def test_match_cached_by_signature(self):
+        overlay = Curve([1, 2], group='A') * Curve([3, 4], group='B')
+        match = Compositor.strongest_match(overlay, 'data')
+        self.assertEqual(match, (4, self.compositor, (0, 2)))
+        other = Curve([5, 6], group='A') * Curve([7, 8], group='B')
+        key = (Compositor.signature(other), 'data')
+        self.assertIn(key, Compositor._match_cache)
+        self.assertIs(Compositor.strongest_match(other, 'data'), match)
+
+    def test_no_match_cached(self):
+        overlay = Curve([1, 2], group='A') * Curve([3, 4], group='C')
+        self.assertIs(Compositor.strongest_match(overlay, 'data'), None)
+        key = (Compositor.signature(overlay), 'data')
+        self.assertIs(Compositor._match_cache[key], None)
+
+    def test_match_cache_keyed_on_mode(self):
+        overlay = Curve([1, 2], group='A') * Curve([3, 4], group='B')
+        self.assertIs(Compositor.strongest_match(overlay, 'display'), None)
+        self.assertEqual(Compositor.strongest_match(overlay, 'data')[0], 4)
+
+    def test_match_cache_invalidated_on_register(self):
+        overlay = Curve([1, 2], group='A') * Curve([3, 4], group='C')
+        self.assertIs(Compositor.strongest_match(overlay, 'data'), None)
+        compositor = Compositor('Curve.A * Curve.C', first_curve,
+                                'Collapsed', 'data')
+        Compositor.register(compositor)
+        self.assertEqual(Compositor.strongest_match(overlay, 'data'),
+                         (4, compositor, (0, 2)))
+
+    def test_match_cache_invalidated_on_definitions_change(self):
+        overlay = Curve([1, 2], group='A') * Curve([3, 4], group='B')
+        self.assertEqual(Compositor.strongest_match(overlay, 'data')[0], 4)
+        Compositor.definitions = []
+        self.assertIs(Compositor.strongest_match(overlay, 'data'), None)
+
+    def test_collapse_element_across_frames(self):
+        for i in range(3):
+            overlay = Overlay([Curve([i, 1], group='A'), Curve([2, 3], group='B'),
+                               Curve([4, 5], group='C')])
+            collapsed = Compositor.collapse_element(overlay)
+            self.assertEqual(len(collapsed), 2)
+            self.assertEqual(collapsed.get(0), Curve([i, 1], group='Collapsed'))
+
+
 class TestCrossBackendOptions(ComparisonTestCase):
     """
     Test the style system can style a single object across backends.
@@ -708,3 +774,28 @@ class TestCrossBackendOptionPickling(TestCrossBackendOptions):
         bokeh_opts = Store.lookup_options('bokeh', img, 'style').options
         self.assertEqual(bokeh_opts, {'cmap':'Purple'})
 
+
+    def test_pickle_mpl_bokeh_threaded_loads(self):
+        """
+        Test concurrent Store.loads calls each restore their own styles
+        """
+        raw = super(TestCrossBackendOptionPickling, self).test_mpl_bokeh_mpl()
+        pickled = Store.dumps(raw)
+        self.clear_options()
+        pool = ThreadPool(4)
+        try:
+            imgs = pool.map(Store.loads, [pickled]*16)
+        finally:
+            pool.close()
+        self.assertEqual(Store.load_counter_offset, None)
+        for img in imgs:
+            self.assertEqual(raw, img)
+            mpl_opts = Store.lookup_options('matplotlib', img, 'style').options
+            self.assertEqual(mpl_opts, {'cmap':'Blues'})
+            bokeh_opts = Store.lookup_options('bokeh', img, 'style').options
+            self.assertEqual(bokeh_opts, {'cmap':'Purple'})
+
+    def test_loads_resets_counter_offset_on_error(self):
+        with self.assertRaises(Exception):
+            Store.loads(b'not a pickle')
+        self.assertEqual(Store.load_counter_offset, None)
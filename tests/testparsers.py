@@ -287,3 +287,48 @@ class OptsSpecCombinedOptionsTests(ComparisonTestCase):
                     {'style':
                      Options(c='b', s=3)}}
         self.assertEqual(OptsSpec.parse(line), expected)
+
+
+class OptsSpecCacheTests(ComparisonTestCase):
+    """
+    Test the hand-written parser and the caching of parsed specs.
+    """
+
+    def setUp(self):
+        OptsSpec._parse_cache.clear()
+
+    def test_scan_matches_pyparsing(self):
+        lines = ["Curve [show_grid=True xticks=[1, 2]] (color='r' lw=2) {+framewise}",
+                 "Image (cmap=(1, 0, 0),) Curve Points [a=1,b=2]",
+                 "Overlay{+axiswise -framewise}[a=1]"]
+        for line in lines:
+            self.assertEqual(OptsSpec._scan(line, ()), OptsSpec._parse_pyparsing(line))
+
+    def test_scan_unsupported_syntax(self):
+        for line in ["Layout plot[fig_inches=(3,3)]",
+                     "Layout [title_format='foo bar']",
+                     "Curve (label='a b')"]:
+            self.assertEqual(OptsSpec._scan(line, ()), None)
+
+    def test_parse_cached(self):
+        line = "Curve (color='r')"
+        OptsSpec.parse(line)
+        self.assertIn((line, ()), OptsSpec._parse_cache)
+
+    def test_parse_cached_returns_new_options(self):
+        line = "Curve (color='r')"
+        self.assertIsNot(OptsSpec.parse(line)['Curve']['style'],
+                         OptsSpec.parse(line)['Curve']['style'])
+
+    def test_parse_cached_evaluates_namespace(self):
+        line = "Curve (color=c)"
+        self.assertEqual(OptsSpec.parse(line, ns={'c': 'red'}),
+                         {'Curve': {'style': Options(color='red')}})
+        self.assertEqual(OptsSpec.parse(line, ns={'c': 'blue'}),
+                         {'Curve': {'style': Options(color='blue')}})
+
+    def test_parse_invalid_not_cached(self):
+        line = "Curve {+foo}"
+        with self.assertRaises(SyntaxError):
+            OptsSpec.parse(line)
+        self.assertNotIn((line, ()), OptsSpec._parse_cache)
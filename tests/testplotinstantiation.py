@@ -19,11 +19,13 @@ from holoviews.core.util import pd
 from holoviews.element import (Curve, Scatter, Image, VLine, Points,
                                HeatMap, QuadMesh, Spikes, ErrorBars,
                                Scatter3D, Path, Polygons, Bars, Text,
-                               BoxWhisker, HLine, RGB, Raster, Contours)
+                               BoxWhisker, HLine, RGB, Raster, Contours,
+                               Histogram)
 from holoviews.element.comparison import ComparisonTestCase
 from holoviews.streams import Stream, PointerXY, PointerX
 from holoviews.operation import gridmatrix
 from holoviews.plotting import comms
+from holoviews.plotting.plot import Plot
 from holoviews.plotting.util import rgb2hex
 
 # Standardize backend due to random inconsistencies
@@ -324,6 +326,53 @@ class TestMPLPlotInstantiation(ComparisonTestCase):
         artist = plot.handles['artist']
         self.assertEqual(artist.get_array().data, arr.T[:, ::-1].flatten())
 
+    def test_quadmesh_update_in_place(self):
+        hmap = HoloMap({i: QuadMesh(Image(np.arange(6).reshape(2, 3)*i))
+                        for i in range(1, 3)})
+        plot = mpl_renderer.get_plot(hmap)
+        artist = plot.handles['artist']
+        plot.update((2,))
+        self.assertIs(plot.handles['artist'], artist)
+        self.assertEqual(artist.get_array().max(), 10)
+
+    def test_histogram_update_changed_bins(self):
+        hmap = HoloMap({i: Histogram((np.arange(i*2+1), np.arange(i*2)))
+                        for i in range(1, 3)})
+        plot = mpl_renderer.get_plot(hmap)
+        plot.update((2,))
+        self.assertEqual(len(plot.handles['artist']), 4)
+        plot.update((1,))
+        self.assertEqual(len(plot.handles['artist']), 2)
+
+    def test_curve_unchanged_axes_not_finalized(self):
+        hmap = HoloMap({i: Curve([1, 2, 3]) for i in range(3)})
+        plot = mpl_renderer.get_plot(hmap)
+        calls = []
+        plot._finalize_ticks = lambda *args: calls.append(args)
+        plot.update((1,))
+        plot.update((2,))
+        self.assertEqual(calls, [])
+
+    def test_curve_unchanged_axes_extents_computed_once(self):
+        hmap = HoloMap({i: Curve([1, 2, 3]) for i in range(3)})
+        plot = mpl_renderer.get_plot(hmap)
+        get_extents, calls = plot.get_extents, []
+        def extents(*args):
+            calls.append(args)
+            return get_extents(*args)
+        plot.get_extents = extents
+        plot.update((1,))
+        self.assertEqual(len(calls), 1)
+
+    def test_histogram_changed_bins_uses_style(self):
+        hmap = HoloMap({i: Histogram((np.arange(i*2+1), np.arange(i*2)))
+                        for i in range(1, 3)})
+        hmap = hmap.opts({'Histogram': {'style': dict(facecolor='red')}})
+        plot = mpl_renderer.get_plot(hmap)
+        plot.update((2,))
+        colors = [bar.get_facecolor() for bar in plot.handles['artist']]
+        self.assertEqual(colors, [(1, 0, 0, 1)]*4)
+
     def test_heatmap_invert_axes(self):
         arr = np.array([[0, 1, 2], [3, 4, 5]])
         hm = HeatMap(Image(arr)).opts(plot=dict(invert_axes=True))
@@ -375,6 +424,42 @@ class TestBokehPlotInstantiation(ComparisonTestCase):
         self.assertEqual(subplot1.handles['source'].data['y'], np.arange(12))
         self.assertEqual(subplot2.handles['source'].data['y'], np.arange(12)*2)
 
+    def test_overlay_update_framewise(self):
+        hmap = HoloMap({i: (Curve(np.arange(i), label='A') *
+                            Curve(np.arange(i)*2, label='B'))
+                        for i in range(10, 13)})
+        hmap = hmap.opts(norm={'Curve': dict(framewise=True)})
+        plot = bokeh_renderer.get_plot(hmap)
+        plot.update((10,))
+        self.assertEqual(plot.handles['y_range'].end, 18)
+        plot.update((12,))
+        self.assertEqual(plot.handles['y_range'].end, 22)
+        self.assertIs(Plot._options_memo, None)
+
+    def test_shared_options_lookup(self):
+        curve = Curve([1, 2, 3])
+        plot_type = bokeh_renderer.plotting_class(curve)
+        self.assertIsNot(plot_type.lookup_options(curve, 'style'),
+                         plot_type.lookup_options(curve, 'style'))
+        with Plot.shared_options():
+            style = plot_type.lookup_options(curve, 'style')
+            with Plot.shared_options():
+                self.assertIs(plot_type.lookup_options(curve, 'style'), style)
+            self.assertIs(plot_type.lookup_options(curve.relabel('A'), 'style').kwargs,
+                          plot_type.lookup_options(curve.relabel('A'), 'style').kwargs)
+        self.assertIs(Plot._options_memo, None)
+
+    def test_shared_options_lookup_holomap_and_element(self):
+        hmap = HoloMap({i: Curve([1, 2], group='Foo') for i in range(2)})
+        hmap = hmap.opts({'Curve.Foo': {'plot': {'width': 300}},
+                          'HoloMap': {'plot': {'width': 500}}})
+        plot_type = bokeh_renderer.plotting_class(hmap.last)
+        with Plot.shared_options():
+            element_opts = plot_type.lookup_options(hmap.last, 'plot')
+            hmap_opts = plot_type.lookup_options(hmap, 'plot')
+        self.assertEqual(element_opts.kwargs['width'], 300)
+        self.assertEqual(hmap_opts.kwargs['width'], 500)
+
     def test_overlay_update_visible(self):
         hmap = HoloMap({i: Curve(np.arange(i), label='A') for i in range(1, 3)})
         hmap2 = HoloMap({i: Curve(np.arange(i), label='B') for i in range(3, 5)})
@@ -1166,6 +1251,16 @@ class TestBokehPlotInstantiation(ComparisonTestCase):
         self.assertIsInstance(y_range, FactorRange)
         self.assertEqual(y_range.factors, ['1', '2'])
 
+    def test_heatmap_sparse(self):
+        hmap = HeatMap([('B', 'b', 2), ('A', 'c', 1), ('B', 'a', 3)]).opts(plot=dict(sparse=True))
+        plot = bokeh_renderer.get_plot(hmap)
+        source = plot.handles['source']
+        self.assertEqual(source.data['x'], np.array(['B', 'B', 'A']))
+        self.assertEqual(source.data['y'], np.array(['b', 'a', 'c']))
+        self.assertEqual(source.data['zvalues'], np.array([2, 3, 1]))
+        self.assertEqual(plot.handles['x_range'].factors, ['B', 'A'])
+        self.assertEqual(plot.handles['y_range'].factors, ['b', 'c', 'a'])
+
     def test_heatmap_categorical_axes_string_int_invert_xyaxis(self):
         opts = dict(invert_xaxis=True, invert_yaxis=True)
         hmap = HeatMap([('A',1, 1), ('B', 2, 2)]).opts(plot=opts)
@@ -1859,6 +1954,28 @@ class TestPlotlyPlotInstantiation(ComparisonTestCase):
         self.assertEqual(state['data'][3]['xaxis'], 'x2')
         self.assertEqual(state['data'][3]['yaxis'], 'y2')
 
+    def test_diff_only_changed_properties(self):
+        hmap = HoloMap({i: Curve([1, 2, i]) for i in range(3)})
+        plot = plotly_renderer.get_plot(hmap)
+        plotly_renderer.figure_data(plot)
+        plot.update((1,))
+        diff = plotly_renderer.diff(plot, serialize=False)
+        self.assertEqual(list(diff['data'][0].keys()), ['y'])
+        self.assertEqual(diff['data'][0]['y'], np.array([1, 2, 1]))
+        self.assertEqual(diff['layout'], {'title': 'Default: 1'})
+        plot.update((1,))
+        self.assertEqual(plotly_renderer.diff(plot, serialize=False),
+                         {'data': [{}], 'layout': {}})
+
+    def test_diff_binary_arrays(self):
+        hmap = HoloMap({i: Curve(np.arange(2000)*i) for i in range(3)})
+        plot = plotly_renderer.get_plot(hmap)
+        plotly_renderer.figure_data(plot)
+        plot.update((1,))
+        ys = plotly_renderer.diff(plot, serialize=False)['data'][0]['y']
+        self.assertEqual(ys['dtype'], 'float64')
+        self.assertEqual(ys['shape'], [2000])
+
     def test_stream_callback_single_call(self):
         def history_callback(x, history=deque(maxlen=10)):
             history.append(x)
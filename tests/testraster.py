@@ -91,3 +91,11 @@ class TestQuadMesh(ComparisonTestCase):
                              (1.5, -0.5), (1.5, 0.5), (1.5, 1.5)])
         self.assertEqual(trimesh.array(), simplices)
         self.assertEqual(trimesh.nodes.array([0, 1]), vertices)
+
+    def test_quadmesh_to_trimesh_cached(self):
+        qmesh = QuadMesh(([0, 1], [0, 1], np.array([[0, 1], [2, 3]])))
+        trimesh = qmesh.trimesh()
+        self.assertIs(qmesh.trimesh(), trimesh)
+        simplices, vertices = trimesh._triangles()
+        self.assertEqual(simplices, trimesh.array([0, 1, 2]))
+        self.assertEqual(vertices, trimesh.nodes.array([0, 1]))
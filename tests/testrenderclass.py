@@ -9,7 +9,8 @@ from unittest import SkipTest
 from nose.plugins.attrib import attr
 import numpy as np
 
-from holoviews import HoloMap, Image, ItemTable, Store, GridSpace, Table, Curve
+from holoviews import (HoloMap, Image, ItemTable, Store, GridSpace, Table, Curve,
+                       ErrorBars, Graph)
 from holoviews.element.comparison import ComparisonTestCase
 from holoviews.plotting import Renderer
 
@@ -64,6 +65,11 @@ class MPLRendererTest(ComparisonTestCase):
                                        label='Poincaré', group='α Festkörperphysik')
 
         self.renderer = MPLRenderer.instance()
+        self.previous_backend = Store.current_backend
+        Store.current_backend = 'matplotlib'
+
+    def tearDown(self):
+        Store.current_backend = self.previous_backend
 
     def test_get_size_single_plot(self):
         plot = self.renderer.get_plot(self.image1)
@@ -98,6 +104,85 @@ class MPLRendererTest(ComparisonTestCase):
         w, h = self.renderer.get_size(plot)
         self.assertEqual((w, h), (576, 231))
 
+    def test_rgba_frames(self):
+        plot = self.renderer.get_plot(self.map1)
+        w, h = plot.state.canvas.get_width_height()
+        frames = [bytes(frame) for frame in plot._rgba_frames()]
+        self.assertEqual(len(frames), 2)
+        self.assertEqual([len(f) for f in frames], [w*h*4, w*h*4])
+        self.assertNotEqual(frames[0], frames[1])
+
+    def test_rgba_frames_redraw_changed_labels(self):
+        hmap = HoloMap({0: Curve([1, 2, 3], vdims=['a']),
+                        1: Curve([1, 2, 3], vdims=['b'])})
+        plot = self.renderer.get_plot(hmap)
+        canvas = plot.state.canvas
+        draw, draws = canvas.draw, []
+        def full_draw(*args, **kwargs):
+            draws.append(plot.handles['axis'].get_ylabel())
+            return draw(*args, **kwargs)
+        canvas.draw = full_draw
+        frames = list(plot._rgba_frames(blit=True))
+        self.assertEqual(len(frames), 2)
+        self.assertEqual(draws, ['a', 'b'])
+
+    def test_rgba_frames_unchanged_axes_not_redrawn(self):
+        plot = self.renderer.get_plot(HoloMap({i: Curve([1, 2, 3]) for i in range(3)}))
+        canvas = plot.state.canvas
+        draw, draws = canvas.draw, []
+        def full_draw(*args, **kwargs):
+            draws.append(args)
+            return draw(*args, **kwargs)
+        canvas.draw = full_draw
+        frames = list(plot._rgba_frames(blit=True))
+        self.assertEqual(len(frames), 3)
+        self.assertEqual(len(draws), 1)
+
+    def _assert_frames_fully_drawn(self, hmap):
+        plot = self.renderer.get_plot(hmap)
+        frames = [bytes(frame) for frame in plot._rgba_frames()]
+        self.assertNotEqual(frames[0], frames[1])
+        canvas = plot.state.canvas
+        for key, frame in zip(plot.keys, frames):
+            plot.update_frame(key)
+            canvas.draw()
+            self.assertEqual(bytes(canvas.buffer_rgba()), frame)
+
+    def test_rgba_frames_errorbars(self):
+        hmap = HoloMap({i: ErrorBars([(0, 1, 0.1*(i+1)), (1, 1, 0.2*(i+1))])
+                        for i in range(2)}).redim.range(y=(0, 2))
+        self._assert_frames_fully_drawn(hmap)
+
+    def test_rgba_frames_graph(self):
+        hmap = HoloMap({i: Graph(((np.array([0, 1]), np.array([1, 2])),
+                                  (np.array([0, 1, 2]), np.array([0, i+1, 0]), np.arange(3))))
+                        for i in range(2)}).redim.range(y=(0, 3))
+        self._assert_frames_fully_drawn(hmap)
+
+    def test_static_state_tracks_tick_labels(self):
+        plot = self.renderer.get_plot(self.map1)
+        state = plot._static_state(plot.state)
+        plot.handles['axis'].set_xticks([0, 1])
+        plot.handles['axis'].set_xticklabels(['A', 'B'])
+        self.assertNotEqual(plot._static_state(plot.state), state)
+
+    def test_animated_artists(self):
+        plot = self.renderer.get_plot(self.map1)
+        artists = plot._animated_artists()
+        self.assertIn(plot.handles['artist'], artists)
+        self.assertIn(plot.handles['title'], artists)
+
+    def test_encoder_args_mp4(self):
+        args = self.renderer._encoder_args('mp4', (100, 50), 10)
+        self.assertEqual(args[args.index('-s')+1], '100x50')
+        self.assertEqual(args[args.index('-i')+1], 'pipe:0')
+        self.assertEqual(args[-3:], ['-f', 'mp4', 'pipe:1'])
+
+    def test_encoder_args_gif(self):
+        args = self.renderer._encoder_args('gif', (100, 50), 10)
+        self.assertEqual(args[1:], ['-size', '100x50', '-depth', '8', '-delay',
+                                    '10.0', '-loop', '0', 'rgba:-', 'gif:-'])
+
 @attr(optional=1)
 class BokehRendererTest(ComparisonTestCase):
 
@@ -8,9 +8,10 @@ except:
 
 import numpy as np
 
-from holoviews import Distribution, Bivariate, Dataset, Area, Image
+from holoviews import Distribution, Bivariate, Dataset, Area, Image, DynamicMap
 from holoviews.element.comparison import ComparisonTestCase
 from holoviews.operation.stats import (univariate_kde, bivariate_kde)
+from holoviews.streams import Pipe
 
 
 class KDEOperationTests(ComparisonTestCase):
@@ -54,3 +55,70 @@ class KDEOperationTests(ComparisonTestCase):
                             y_range=(0, 4), contours=False)
         img = Image(np.zeros((2, 2)), bounds=(-2, -2, 6, 6), vdims=['Density'])
         self.assertEqual(kde, img)
+
+    def test_univariate_kde_binned_matches_exact(self):
+        values = np.random.RandomState(0).randn(1000)
+        dist = Distribution(values)
+        exact = univariate_kde(dist, n_samples=200, method='exact')
+        binned = univariate_kde(dist, n_samples=200, method='binned')
+        self.assertEqual(binned.dimension_values(0), exact.dimension_values(0))
+        np.testing.assert_allclose(binned.dimension_values(1),
+                                   exact.dimension_values(1), atol=1e-3)
+
+    def test_univariate_kde_binned_matches_exact_heavy_tailed(self):
+        values = np.random.RandomState(0).standard_cauchy(20000)
+        dist = Distribution(values)
+        exact = univariate_kde(dist, method='exact')
+        binned = univariate_kde(dist, method='binned')
+        np.testing.assert_allclose(binned.dimension_values(1),
+                                   exact.dimension_values(1))
+
+    def test_univariate_kde_binned_narrow_kernel_normalized(self):
+        values = np.random.RandomState(0).randn(1000)
+        kde = univariate_kde(Distribution(values), n_samples=11, bin_range=(-3, 3),
+                             bandwidth=0.1, accumulate=True)
+        inside = ((values >= -3) & (values <= 3)).mean()
+        xs, ys = kde.dimension_values(0), kde.dimension_values(1)
+        self.assertAlmostEqual(ys.sum() * (xs[1] - xs[0]), inside)
+
+    def test_univariate_kde_accumulate(self):
+        values = np.random.RandomState(0).randn(1000)
+        op = univariate_kde.instance(n_samples=50, bin_range=(-3, 3), accumulate=True)
+        op(Distribution(values[:400]))
+        accumulated = op(Distribution(values[400:]))
+        kde = univariate_kde(Distribution(values), n_samples=50,
+                             bin_range=(-3, 3), method='binned')
+        self.assertEqual(accumulated, kde)
+
+    def test_univariate_kde_accumulate_per_source(self):
+        values = np.random.RandomState(0).randn(1000)
+        op = univariate_kde.instance(n_samples=50, bin_range=(-3, 3), accumulate=True)
+        pipe1, pipe2 = Pipe(data=values[:400]), Pipe(data=values[:100])
+        dmap1 = op(DynamicMap(Distribution, streams=[pipe1]))
+        dmap2 = op(DynamicMap(Distribution, streams=[pipe2]))
+        dmap1[()], dmap2[()]
+        pipe1.send(values[400:])
+        pipe2.send(values[100:200])
+        kde1 = univariate_kde(Distribution(values), n_samples=50,
+                              bin_range=(-3, 3), method='binned')
+        kde2 = univariate_kde(Distribution(values[:200]), n_samples=50,
+                              bin_range=(-3, 3), method='binned')
+        self.assertEqual(dmap1[()], kde1)
+        self.assertEqual(dmap2[()], kde2)
+
+    def test_bivariate_kde_binned_matches_exact(self):
+        values = np.random.RandomState(0).multivariate_normal(
+            [0, 1], [[1, 0.5], [0.5, 2]], size=1000)
+        bivariate = Bivariate(values)
+        exact = bivariate_kde(bivariate, n_samples=50, contours=False, method='exact')
+        binned = bivariate_kde(bivariate, n_samples=50, contours=False, method='binned')
+        np.testing.assert_allclose(binned.dimension_values(2),
+                                   exact.dimension_values(2), atol=2e-3)
+
+    def test_bivariate_kde_binned_matches_exact_heavy_tailed(self):
+        values = np.random.RandomState(0).standard_cauchy((20000, 2))
+        bivariate = Bivariate(values)
+        exact = bivariate_kde(bivariate, n_samples=50, contours=False, method='exact')
+        binned = bivariate_kde(bivariate, n_samples=50, contours=False, method='binned')
+        np.testing.assert_allclose(binned.dimension_values(2),
+                                   exact.dimension_values(2))
@@ -7,7 +7,8 @@ except:
 
 import numpy as np
 
-from holoviews import Curve, Scatter
+from holoviews import Curve, DynamicMap, Overlay, Scatter
+from holoviews.streams import Pipe
 from holoviews.element.comparison import ComparisonTestCase
 from holoviews.operation.timeseries import (rolling, resample, rolling_outlier_std)
 
@@ -74,3 +75,48 @@ class TimeseriesOperationTests(ComparisonTestCase):
     def test_rolling_outliers_std_dates(self):
         outliers = rolling_outlier_std(self.date_outliers, rolling_window=2, sigma=1)
         self.assertEqual(outliers, Scatter([(pd.Timestamp("2016-01-05"), 10)]))
+
+    def test_roll_ints_streaming(self):
+        op = rolling.instance(rolling_window=3, streaming=True)
+        first = op(Curve(self.values[:4]))
+        self.assertEqual(first, Curve([(0, np.NaN), (1, 2), (2, 3)]))
+        rolled = op(Curve((np.arange(2, 7), self.values[2:])))
+        self.assertEqual(rolled, Curve([(2, 3), (3, 4), (4, 5), (5, 6)]))
+        self.assertEqual(op.streamed_rows(rolled), 3)
+
+    def test_roll_ints_streaming_matches_rolling(self):
+        values = np.random.RandomState(0).randn(50)
+        op = rolling.instance(rolling_window=5, streaming=True)
+        for end in range(10, 51, 10):
+            streamed = op(Curve((np.arange(end)[-20:], values[:end][-20:])))
+        rolled = rolling(Curve(values), rolling_window=5)
+        self.assertEqual(streamed, rolled[streamed.range(0)[0]:48])
+
+    def test_resample_weekly_streaming(self):
+        op = resample.instance(rule='W', streaming=True)
+        op(self.date_curve[:self.dates[3]])
+        resampled = op(self.date_curve)
+        dates = np.array(["2016-01-03"], dtype='datetime64[ns]')
+        self.assertEqual(resampled, Curve((dates, [2])))
+        self.assertEqual(op.streamed_rows(resampled), 1)
+
+    def test_roll_streaming_state_per_source(self):
+        op = rolling.instance(rolling_window=3, streaming=True)
+        pipe1, pipe2 = Pipe(data=self.values[:4]), Pipe(data=self.values[:4]*2)
+        dmap1 = op(DynamicMap(Curve, streams=[pipe1]))
+        dmap2 = op(DynamicMap(Curve, streams=[pipe2]))
+        dmap1[()], dmap2[()]
+        pipe1.send((np.arange(2, 7), self.values[2:]))
+        pipe2.send((np.arange(2, 7), self.values[2:]*2))
+        rolled1, rolled2 = dmap1[()], dmap2[()]
+        self.assertEqual(rolled1, Curve([(2, 3), (3, 4), (4, 5), (5, 6)]))
+        self.assertEqual(rolled2, Curve([(2, 6), (3, 8), (4, 10), (5, 12)]))
+        self.assertEqual(op.streamed_rows(rolled2), 3)
+
+    def test_roll_streaming_state_per_layer(self):
+        op = rolling.instance(rolling_window=3, streaming=True)
+        op(Curve(self.values[:4]) * Curve(self.values[:4]*2))
+        rolled = op(Curve((np.arange(2, 7), self.values[2:])) *
+                    Curve((np.arange(2, 7), self.values[2:]*2)))
+        self.assertEqual(rolled, Overlay([Curve([(2, 3), (3, 4), (4, 5), (5, 6)]),
+                                          Curve([(2, 6), (3, 8), (4, 10), (5, 12)])]))